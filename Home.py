@@ -1,26 +1,27 @@
 # ---------------------- LIBRARIES ----------------------
+import logging
 import os
-import psutil
 import signal
 import math
 from datetime import datetime
 import pandas as pd
 import streamlit as st
-from value_vs_adp import calculate_value_vs_adp
-import spike_week_score
-import rookie_rankings
-import injury_reports
-from age_curve import apply_age_curve
-from load_data import get_adp_data, get_season_projections_qb, get_season_projections_rb
-from load_data import get_season_projections_wr, get_season_projections_te
-from positional_scarcity import (
-    load_player_data,
-    calculate_value_over_replacement,
-    calculate_positional_tiers,
-    get_scarcity_score
-)
+import datasets
+import instrumentation
+import warmup
+from draft_state import DraftState
+from league_config import LeagueConfig
+from available_players import AvailablePlayers
+from team_rosters import TeamRosters
+from draft_simulator import availability, pick_columns
+from best_ball_simulator import simulate_seasons, season_summary
+from recommendations import PickRecommender
+from player_identity import player_rows
+from app_logging import get_logger, rate_limited
 # ---------------------- LIBRARIES ----------------------
 
+logger = get_logger("Home")
+
 
 # ---------------------- PAGE CONFIGURATION ----------------------
 # Streamlit function call used to configure the page settings - sets up the page title and icon for the Streamlit app
@@ -32,8 +33,18 @@ st.set_page_config(
 # ---------------------- PAGE CONFIGURATION ----------------------
 
 
+# ---------------------- WARM-UP ----------------------
+# Stages timed during this rerun are recorded under "Home" (see the Diagnostics page)
+instrumentation.begin_run("Home")
+
+# Starts the background thread that prebuilds and refreshes every shared table (once per server process)
+warmup.start()
+# ---------------------- WARM-UP ----------------------
+
+
 # ---------------------- SHUTDOWN (Development) ----------------------
 def shutdown():
+    import psutil  # only needed when the button is pressed
     pid = os.getpid()
     parent = psutil.Process(pid)
     for child in parent.children(recursive=True):
@@ -55,19 +66,11 @@ with col2:
 # function to initialize the session state variables
 def initialize_session_state():
     defaults = {
-        # Creates a dictionary with keys "Team 1" to "Team 12", each mapped to an empty list.
-        # This represents the draft picks for each of the 12 teams.
-        "teams": {f"Team {i+1}": [] for i in range(12)},
-        # A list of integers from 1 to 12, representing the draft pick order.
-        "pick_order": list(range(1, 13)),
-        # An integer representing the current pick number, starting from 0.
-        "pick_number": 0,
-        # Stores the last drafted player, initially set to None.
-        "last_pick": None,
-        # Stores the last team that picked, initially set to None.
-        "last_team": None,
-        #
-        "drafted_players": []
+        # The draft itself: the league's pick schedule (12-team snake by default, see League Settings), rosters, taken
+        # players and the pick log (undo / redo to any depth).
+        "draft": DraftState(LeagueConfig()),
+        # True right after a pick, while its confirmation (Next Pick / Undo) is shown.
+        "show_last_pick": False,
     }
     # The for loop iterates over each key-value pair in the defaults dictionary:
     for key, value in defaults.items():
@@ -201,87 +204,57 @@ def apply_selectbox_style():
 
 # ---------------------- Button Callbacks ----------------------
 def next_pick():
-    st.session_state.last_pick = None
-    st.session_state.last_team = None
-    st.session_state.pick_number += 1
+    st.session_state.show_last_pick = False
 
 def undo_last_pick():
-    if st.session_state.last_team and st.session_state.last_pick in st.session_state.teams[st.session_state.last_team]:
-        st.session_state.teams[st.session_state.last_team].remove(st.session_state.last_pick)
-        st.session_state.last_pick = None
-        st.session_state.last_team = None
+    pick = st.session_state.draft.undo()
+    if pick:
+        st.session_state.available_players.add(pick.player_id)
+        st.session_state.team_rosters.remove(pick.team, pick.player_id)
+        st.session_state.recommender.add(pick.player_id)
+    st.session_state.show_last_pick = False
+
+def redo_pick():
+    pick = st.session_state.draft.redo()
+    if pick:
+        record_pick(pick)
+    st.session_state.show_last_pick = pick is not None
+
+def apply_league_settings():
+    # A new league starts a new draft: the board, lineups, forecast and simulation are rebuilt for it
+    st.session_state.draft = DraftState(LeagueConfig(
+        num_teams=st.session_state.league_teams,
+        rounds=st.session_state.league_rounds,
+        superflex=st.session_state.league_superflex,
+        third_round_reversal=st.session_state.league_3rr,
+    ))
+    for key in ("available_players", "availability", "season_simulation"):
+        st.session_state.pop(key, None)
+    st.session_state.show_last_pick = False
 # ---------------------- Button Callbacks ----------------------
 
 
 # ---------------------- Script Functions ----------------------
-# Update player age
-def update_player(df, this_year, data_year):
-    # Calculate how many years to increment
-    year_delta = this_year - data_year
-
-    # Automatically increment age based on year difference
-    df['age'] = df['age'] + year_delta
-
-    return df
-
-# Ensures that the draft follows a snake format, where the draft order reverses after each round.
+# Ensures that the draft follows the league's pick order (snake, or third-round reversal).
 def get_team_picking():
-    # st.session_state.pick_number is the current pick number in the draft.
-    # len(st.session_state.pick_order) gives the total number of teams.
-    # The // operator performs integer division to calculate the current round number.
-    round_number = st.session_state.pick_number // len(st.session_state.pick_order) # determine round (e.g., "round 1")
-    # Uses the modulus operator % to find the position within the current round.
-    # This effectively determines the index within the list of teams.
-    pick_in_round = st.session_state.pick_number % len(st.session_state.pick_order) # determine the position
-                                                                                    # (e.g., "round 2, pick 4")
-    # Checks whether the round number is even or odd.
-    # If even, it returns the team from pick_order at the calculated index.
-    # If odd, it returns the team from the reversed order ([::-1]) at the same index.
-    # This logic ensures that the draft follows a snake format, where the order reverses after each round.
-    if round_number % 2 == 0:
-        return st.session_state.pick_order[pick_in_round] # Even round: normal order
-    else:
-        return st.session_state.pick_order[::-1][pick_in_round] # Odd round: reversed order
-
-def build_team_roster(team_picks):
-    starters = {"QB": [], "RB": [], "WR": [], "TE": [], "FLEX": []}
-    bench = []
-    detailed_picks = []
-    for p_name in team_picks:
-        player_info = next((p for p in adp_rankings if p['name'] == p_name), None)
-        if player_info:
-            detailed_picks.append(player_info)
-
-    detailed_picks.sort(key=lambda p: p['adp'])
-
-    for player in detailed_picks:
-        pos = player['pos']
-        if pos == "QB" and len(starters["QB"]) < 1:
-            starters["QB"].append(player)
-        elif pos == "RB" and len(starters["RB"]) < 2:
-            starters["RB"].append(player)
-        elif pos == "WR" and len(starters["WR"]) < 3:
-            starters["WR"].append(player)
-        elif pos == "TE" and len(starters["TE"]) < 1:
-            starters["TE"].append(player)
-        elif pos in ["RB", "WR", "TE"] and len(starters["FLEX"]) < 1:
-            starters["FLEX"].append(player)
-        else:
-            bench.append(player)
-    return starters, bench
-
-# creates and returns a list of players who have not been drafted yet, sorted by their ADP from high to low
-def get_available_players(players_2025):
-    taken = [p for picks in st.session_state.teams.values() for p in picks]
-    return sorted(
-        [p for p in players_2025 if p['name'] not in taken],
-        key=lambda x: x['adp'], reverse=True
-    )
-    # Example: If there are 4 teams (pick_order = [A, B, C, D]):
-    # Round 1 (even): A -> B -> C -> D
-    # Round 2 (odd): D -> C -> B -> A
-    # Round 3 (even): A -> B -> C -> D
-    # And so on...
+    # Team number on the clock, a lookup in the league's pick schedule (None once the draft is complete)
+    return st.session_state.draft.team_on_clock()
+
+def record_pick(pick):
+    # Takes the drafted player off the board and into their team's lineup
+    st.session_state.available_players.remove(pick.player_id)
+    st.session_state.team_rosters.add(pick.team, pick.player_id)
+    st.session_state.recommender.remove(pick.player_id)
+
+def next_pick_availability():
+    # Chance each available player is still there at the picking team's next two picks (draft_simulator). The
+    # simulation only reruns when the board changes, not on every widget interaction.
+    draft = st.session_state.draft
+    key = (draft.cursor, frozenset(draft.taken))
+    cached = st.session_state.get("availability")
+    if cached is None or cached[0] != key:
+        cached = st.session_state.availability = (key, availability(draft, st.session_state.available_players))
+    return cached[1]
 # ---------------------- Script Functions ----------------------
 
 
@@ -294,186 +267,64 @@ initialize_session_state()
 # Get the current year (e.g., 2025)
 current_year = datetime.now().year
 
-# ---------------------- Historical Data - NFL Player Stats .csv files ----------------------
-# ---------------------- Scrape Pro-Football-Reference ----------------------
-# Scrape NFL Player stats from Pro-Football-Reference.com
-# years = [2022, 2023, 2024]
-
-# for year in years:
-#     get_nfl_player_data(year, f"https://www.pro-football-reference.com/years/{year}/fantasy.htm")
-# ---------------------- Scrape Pro-Football-Reference ----------------------
-
-# ---------------------- 2024 NFL Player Stats .csv ----------------------
-# Load the 2024 NFL Player stats .csv file - (must be above Player_Transactions.py data pulls)
-nfl_player_stats_2024_df = pd.read_csv('data_files/nfl_player_stats_2024.csv')
-
-# Remove + and * from player names
-nfl_player_stats_2024_df['player'] = nfl_player_stats_2024_df['player'].str.replace(r'[\+\*]', '', regex=True)
-
-# DataFrame saved in session_state
-st.session_state['nfl_player_stats_2024_df'] = nfl_player_stats_2024_df
-# ---------------------- 2024 NFL Player Stats .csv ----------------------
+# Every table comes from the dataset registry (datasets.py): it is built on first use, shared by all sessions and
+# pages, and a rerun (e.g. clicking "Draft Player") just looks it up again. The draft board only loads the datasets it
+# shows; pages load their own (the injury news, rookies, scarcity, ... are not touched here).
 
-# ---------------------- 2023 NFL Player Stats .csv ----------------------
-# Load the 2023 NFL Player stats CSV file
-nfl_player_stats_2023_df = pd.read_csv('data_files/nfl_player_stats_2023.csv')
-
-# Remove + and * from player names
-nfl_player_stats_2023_df['player'] = nfl_player_stats_2023_df['player'].str.replace(r'[\+\*]', '', regex=True)
-# ---------------------- 2023 NFL Player Stats .csv ----------------------
-
-# ---------------------- 2022 NFL Player Stats .csv ----------------------
-# Load the 2022 NFL Player stats CSV file
-nfl_player_stats_2022_df = pd.read_csv('data_files/nfl_player_stats_2022.csv')
-
-# Remove + and * from player names
-nfl_player_stats_2022_df['player'] = nfl_player_stats_2022_df['player'].str.replace(r'[\+\*]', '', regex=True)
-# ---------------------- 2022 NFL Player Stats .csv ----------------------
-# ---------------------- Historical Data - NFL Player Stats .csv files ----------------------
+# ---------------------- Historical Data - NFL Player Stats ----------------------
+# 2024 NFL Player stats (typed, memory-mapped columnar copy of the CSV; names already cleaned and keyed by player_id)
+nfl_player_stats_2024_df = datasets.load('stats_2024')
+# ---------------------- Historical Data - NFL Player Stats ----------------------
 
 
 # ---------------------- ADP Rankings ----------------------
-# calls load_adp_data() function and stores a list of dictionaries in the adp_rankings variable
-# [{'rank': rank, 'name': name, 'pos': pos, 'adp': adp}, ...]
-adp_rankings = get_adp_data('https://www.fantasypros.com/nfl/adp/best-ball-overall.php')
-
-# Filters the adp_rankings list of player dictionaries to create separate lists for each position (QB, RB, WR, TE).
-adp_rankings_qb = [player for player in adp_rankings if player.get("pos") == "QB"]
-# DataFrame saved in session_state
-st.session_state['adp_data_qb'] = adp_rankings_qb
-
-adp_rankings_rb = [player for player in adp_rankings if player.get("pos") == "RB"]
-st.session_state['adp_data_rb'] = adp_rankings_rb
-
-adp_rankings_wr = [player for player in adp_rankings if player.get("pos") == "WR"]
-st.session_state['adp_data_wr'] = adp_rankings_wr
-
-adp_rankings_te = [player for player in adp_rankings if player.get("pos") == "TE"]
-st.session_state['adp_data_te'] = adp_rankings_te
+# the parsed ADP page as a list of dictionaries: [{'rank': rank, 'name': name, 'pos': pos, 'adp': adp}, ...]
+adp_rankings = datasets.load('adp')
+
+# ADP records keyed by player id, built once per ADP load (datasets.build_adp_records)
+adp_by_id = datasets.load('adp_records')
+
+# Undrafted players in ADP order (overall and per position) and each team's starters / bench. Kept per session and
+# updated by the draft / undo / redo callbacks; rebuilt only when the ADP data or the league settings change.
+if ('available_players' not in st.session_state
+        or st.session_state.available_players.records is not adp_by_id):
+    st.session_state.available_players = AvailablePlayers(adp_by_id, taken=st.session_state.draft.taken)
+    st.session_state.team_rosters = TeamRosters(adp_by_id, st.session_state.draft.rosters,
+                                                st.session_state.draft.league.slots)
+    st.session_state.availability = None
+available_players = st.session_state.available_players
+team_rosters = st.session_state.team_rosters
 # ---------------------- ADP Rankings ----------------------
 
 
-# ---------------------- Season Projections ----------------------
-# [{'name': name, 'team': team, 'pass_att': pass_att, 'pass_cmp': pass_cmp, 'pass_yds': pass_yds, 'pass_tds': pass_tds,
-#     'ints': ints, 'rush_att': rush_att, 'rush_yds': rush_yds, 'rush_tds': rush_tds, 'fumbles': fumbles,
-#     'proj_points': proj_points}]
-season_projections_qb = get_season_projections_qb('https://www.fantasypros.com/nfl/projections/qb.php?week=draft')
-# DataFrame saved in session_state
-st.session_state['season_projections_qb'] = season_projections_qb
-
-# [{'name': name, 'team': team, 'rush_att': rush_att, 'rush_yds': rush_yds, 'rush_tds': rush_tds, 'rec': rec,
-#     'rec_yds': rec_yds, 'rec_tds': rec_tds, 'fumbles': fumbles, 'proj_points': proj_points}]
-season_projections_rb = get_season_projections_rb('https://www.fantasypros.com/nfl/projections/rb.php?week=draft&scoring=PPR&week=draft')
-st.session_state['season_projections_rb'] = season_projections_rb
-
-# [{'name': name, 'team': team, 'rec': rec, 'rec_yds': rec_yds, 'rec_tds': rec_tds, 'rush_att': rush_att,
-#     'rush_yds': rush_yds, 'rush_tds': rush_tds, 'fumbles': fumbles, 'proj_points': proj_points}]
-season_projections_wr = get_season_projections_wr('https://www.fantasypros.com/nfl/projections/wr.php?week=draft&scoring=PPR&week=draft')
-st.session_state['season_projections_wr'] = season_projections_wr
-
-# [{'name': name, 'team': team, 'rec': rec, 'rec_yds': rec_yds, 'rec_tds': rec_tds, 'fumbles': fumbles,
-#     'proj_points': proj_points}]
-season_projections_te = get_season_projections_te('https://www.fantasypros.com/nfl/projections/te.php?week=draft&scoring=PPR&week=draft')
-st.session_state['season_projections_te'] = season_projections_te
-
-# # [{'name': name, 'team': team, 'fg': fg, 'fga': fga, 'xpt': xpt, 'proj_points': proj_points}]
-# season_projections_k = get_season_projections_k('https://www.fantasypros.com/nfl/projections/k.php?week=draft')
-
-# # [{'team': team, 'sack': sack, 'int': int, 'fr': fr, 'ff': ff, 'td': td, 'safety': safety, 'pa': pa,
-# #     'yds_agn': yds_agn, 'proj_points': proj_points}]
-# season_projections_dst = get_season_projections_dst()
-
-# TODO: Change the following code so that ['pos'] is added after ['team'] in the dataframe that is created
-
-# Add 'Position' column to each DataFrame
-season_projections_df_qb = pd.DataFrame(season_projections_qb)
-season_projections_df_qb['pos'] = 'QB'
-season_projections_df_rb = pd.DataFrame(season_projections_rb)
-season_projections_df_rb['pos'] = 'RB'
-season_projections_df_wr = pd.DataFrame(season_projections_wr)
-season_projections_df_wr['pos'] = 'WR'
-season_projections_df_te = pd.DataFrame(season_projections_te)
-season_projections_df_te['pos'] = 'TE'
-
-# Create a list of season projection dfs
-season_projections_df_all = pd.concat([
-    season_projections_df_qb,
-    season_projections_df_rb,
-    season_projections_df_wr,
-    season_projections_df_te
-], ignore_index=True)
-
-# Optionally store it in session state
-# st.session_state['season_projections_all'] = season_projections_all
-
-# Optionally store cleaned DataFrame for export or debugging
-# season_projections_all.to_csv("cleaned_projections.csv", index=False)
-# ---------------------- Season Projections ----------------------
-
-
 # ---------------------- Value vs ADP DataFrame ----------------------
-# Calculates the implied points vs. ADP for each position (QB, RB, WR, TE) using a function called
-# calculate_value_vs_adp() from the implied_points module.
-value_vs_adp_df_qb = calculate_value_vs_adp("QB", adp_rankings_qb, season_projections_qb, False)
-value_vs_adp_df_rb = calculate_value_vs_adp("RB", adp_rankings_rb, season_projections_rb, False)
-value_vs_adp_df_wr = calculate_value_vs_adp("WR", adp_rankings_wr, season_projections_wr, False)
-value_vs_adp_df_te = calculate_value_vs_adp("TE", adp_rankings_te, season_projections_te, False)
-
-# Define a dictionary to map position to the corresponding value_vs_adp dataframe
-value_vs_adp_df = {
-    "QB": value_vs_adp_df_qb,
-    "RB": value_vs_adp_df_rb,
-    "WR": value_vs_adp_df_wr,
-    "TE": value_vs_adp_df_te
-}
+# Implied points vs. ADP for each position, e.g. value_vs_adp_df["QB"] (see value_vs_adp.calculate_value_vs_adp)
+value_vs_adp_df = datasets.load('value_vs_adp')
 # ---------------------- Value vs ADP DataFrame ----------------------
 
 
-# ---------------------- Positional Scarcity ----------------------
-positional_scarcity_df = load_player_data(season_projections_df_all)
-positional_scarcity_df = calculate_value_over_replacement(positional_scarcity_df)
-positional_scarcity_df = calculate_positional_tiers(positional_scarcity_df)
-positional_scarcity_df = get_scarcity_score(positional_scarcity_df)
-
-# Store positional_scarcity_df variable in session state
-st.session_state['positional_scarcity_df'] = positional_scarcity_df
-# ---------------------- Positional Scarcity ----------------------
-
-
 # ---------------------- Boom-Bust DataFrame ----------------------
-# Calculates the Boom-Bust DataFrame for players based on a list of seasons, specifically for the year
-seasons = [2024]
-boom_bust_df = spike_week_score.organize_by_condition(seasons)
+# Boom-Bust profile of every player over spike_week_score.SPIKE_WEEK_SEASONS
+boom_bust_df = datasets.load('boom_bust')
 # ---------------------- Boom-Bust DataFrame ----------------------
 
 
-# ---------------------- Rookie Rankings DataFrame (must be above Player_Transactions.py data pulls) ----------------------
-rookie_rankings_df = rookie_rankings.get_rookie_rankings("data_files/all_rookie_rankings_2025.csv")
-st.session_state['rookie_rankings_df'] = rookie_rankings_df
-# ---------------------- Rookie Rankings DataFrame (must be above Player_Transactions.py data pulls) ----------------------
-
-
-# ---------------------- Injury Reports DataFrame ----------------------
-# List of pages to scrape
-urls = [
-    "https://www.fantasypros.com/nfl/injury-news.php",
-    "https://www.fantasypros.com/nfl/injury-news.php?page=2",
-    "https://www.fantasypros.com/nfl/injury-news.php?page=3",
-]
-injury_reports_df = injury_reports.get_injury_reports(urls)
-st.session_state['injury_reports_df'] = injury_reports_df
-# ---------------------- Injury Reports DataFrame ----------------------
+# ---------------------- Player Index ----------------------
+# 2024 stats and boom-bust rows by canonical player id: {player_id: {source: [row positions]}}
+player_index = datasets.load('draft_player_index')
+# ---------------------- Player Index ----------------------
 
 
-# ---------------------- Age Curve DataFrame ----------------------
-# Update player age
-updated_stats_df = update_player(nfl_player_stats_2024_df, current_year, 2024)
-
-age_curve_df = apply_age_curve(updated_stats_df)
-
-# DataFrame saved in session_state
-st.session_state['age_curve_df'] = age_curve_df
-# ---------------------- Age Curve DataFrame ----------------------
+# ---------------------- Pick Recommendations ----------------------
+# Base score of every ADP player (VoR, scarcity, value vs. ADP, age curve, spike weeks - see recommendations.py).
+# The recommender is kept per session and updated by the pick callbacks like the available players.
+player_scores = datasets.load('player_scores')
+if ('recommender' not in st.session_state or st.session_state.recommender.scores is not player_scores
+        or st.session_state.recommender.records is not adp_by_id):
+    st.session_state.recommender = PickRecommender(player_scores, adp_by_id, taken=st.session_state.draft.taken)
+recommender = st.session_state.recommender
+league = st.session_state.draft.league
+# ---------------------- Pick Recommendations ----------------------
 # -------------------------------------------- DATA HANDLING - (BEGIN) --------------------------------------------
 
 
@@ -501,96 +352,119 @@ st.write("---")
 # ---------------------- HEADER ----------------------
 
 # ---------------------- Draft Controller ----------------------
-# Determines which team is currently making a draft pick in a snake draft format.
+# Determines which team is currently making a draft pick (None once every pick is made).
 team_picking_int = get_team_picking()
+draft_complete = team_picking_int is None
 
 # Create a string that represents the name of the team based on the current pick count.
 # (e.g., "pick_count = 1, current_team returns: Team 1")
 current_team = f"Team {team_picking_int}"
 
 # Calculates the current draft round based on the current pick number and the number of teams (or picks per round).
-current_round = (st.session_state.pick_number // len(st.session_state.pick_order))+1
+current_round = st.session_state.draft.current_round
 
 # Creates a sidebar section in a Streamlit app and displays some information there.
 with st.sidebar:
     st.write("**Team Rosters:**")
-    st.write(st.session_state.teams)
-    st.write(f"**Last Pick:** {st.session_state.last_pick}")
-    st.write(f"**Last Team:** {st.session_state.last_team}")
+    st.write(st.session_state.draft.roster_names())
+    last_pick = st.session_state.draft.last_pick()
+    st.write(f"**Last Pick:** {last_pick.name if last_pick else None}")
+    st.write(f"**Last Team:** {last_pick.team if last_pick else None}")
+
+    # League settings can only change before the first pick (a change starts a new draft)
+    with st.expander("⚙️ League Settings", expanded=not st.session_state.draft.can_undo()):
+        settings_locked = st.session_state.draft.can_undo()
+        with st.form("league_settings"):
+            st.number_input("Teams", min_value=2, max_value=32, value=league.num_teams, key="league_teams",
+                            disabled=settings_locked)
+            st.number_input("Rounds", min_value=1, max_value=40, value=league.rounds, key="league_rounds",
+                            disabled=settings_locked)
+            st.checkbox("Superflex", value=league.superflex, key="league_superflex", disabled=settings_locked)
+            st.checkbox("Third-Round Reversal", value=league.third_round_reversal, key="league_3rr",
+                        disabled=settings_locked)
+            st.form_submit_button("Apply", on_click=apply_league_settings, disabled=settings_locked)
+        if settings_locked:
+            st.caption("Undo every pick to change the league settings.")
+
+    # Data readiness (tables are served instantly, even while the warm-up thread refreshes them)
+    with st.expander("Data Status"):
+        for name, ready in warmup.readiness_status().items():
+            if ready['error'] and not ready['built']:
+                icon = "❌"
+            elif ready['refreshing']:
+                icon = "🔄"
+            elif not ready['built'] or ready['stale']:
+                icon = "⏳"
+            else:
+                icon = "✅"
+            built_at = datetime.fromtimestamp(ready['built_at']).strftime('%H:%M') if ready['built_at'] else "-"
+            st.write(f"{icon} {name} ({built_at})")
 
 # Display some styled and dynamic draft-related info in the Streamlit app.
 st.markdown("<h3 style='color: #0098f5;'>🚩 Let's Begin!</h3>", unsafe_allow_html=True) # 🛠
-st.write("- Teams: 12 | Format: Snake, Full-PPR")
+draft_format = "Snake (3RR)" if league.third_round_reversal else "Snake"
+st.write(f"- Teams: {league.num_teams} | Rounds: {league.rounds} | Format: {draft_format}, Full-PPR"
+         f"{', Superflex' if league.superflex else ''}")
 st.write(f"- Round: {current_round}")
-st.markdown(
-    f"<h3 style='font-size:18px;'> 🕒 On the Clock: {current_team} | Pick Number: {st.session_state.pick_number+1}</h3>",
-    unsafe_allow_html=True
-)
+if draft_complete:
+    st.markdown("<h3 style='font-size:18px;'> 🏁 Draft complete</h3>", unsafe_allow_html=True)
+else:
+    st.markdown(
+        f"<h3 style='font-size:18px;'> 🕒 On the Clock: {current_team} | Pick Number: {st.session_state.draft.cursor+1}</h3>",
+        unsafe_allow_html=True
+    )
 
 # Uses Streamlit to display a subheader with the text "✅️ Pick Selection".
 st.markdown("<h3 style='color: #0098f5;'>✅ Pick Selection</h3>", unsafe_allow_html=True) # 🗳
 
 st.markdown("<p style='color: lightblue;'>🤖 <strong>Please make the first pick!</strong></p>", unsafe_allow_html=True)
 
-# Creates a list of available players with selected info, sorted by ADP (Average Draft Position).
-available_players_list = [
-    {
-        "name": p['name'],
-        "pos": p['pos'],
-        "adp": p.get('adp', None),
-        "team": p.get('team', None),
-        "bye_week": p.get('bye_week', None)
-    }
-    for p in sorted(get_available_players(adp_rankings), key=lambda p: p['adp'])
-]
-
 # Creates two equal-width columns side by side in the Streamlit app.
 col1, col2 = st.columns(2)
 
-# Creates a list of formatted player strings from a list of available players.
-formatted_players = [
-    f"{player['name']} ({player['pos']})" for player in available_players_list  # e.g., "Ja'Marr Chase (WR)"
-]
-
 # Places the following UI elements inside col2.
 with col2:
     # Creates a list called valid_positions that contains the valid positions available for filtering
     valid_positions = ["All", "QB", "RB", "WR", "TE"]
-    # Creates a sorted list of player positions from the available players and combines it with a default "All" option.
-    primary_positions = sorted(set(p['pos'] for p in available_players_list))
-    position_filter_options = ["All"] + [pos for pos in primary_positions if pos in valid_positions]
+    # Positions that still have available players, after a default "All" option.
+    position_filter_options = ["All"] + [pos for pos in available_players.positions() if pos in valid_positions]
     # Creates a dropdown (select box) inside column 2
     position_filter_selection = st.selectbox(
         "Filter by Position:",  # Displayed as the label above the select box.
         position_filter_options  # A list of available position options for filtering.
     )
 
-# Dynamically filter formatted_players based on the selected position
-if position_filter_selection != "All":
-    filtered_players = [
-        f"{p['name']} ({p['pos']})" for p in available_players_list if p['pos'] == position_filter_selection
-    ]
-else:
-    filtered_players = formatted_players  # Show all players if "All" is selected
-
-# Player selection dropdown in the first column with filtered players
+# Player selection dropdown in the first column: the selected position's pre-formatted labels in ADP order
+# (e.g., "Ja'Marr Chase (WR)"), or every available player if "All" is selected
 with col1:
     player_choice = st.selectbox(
         "Select Player",
-        filtered_players,  # Use filtered players list
+        available_players.labels(position_filter_selection),
         index=None,
         placeholder="--- Select Player ---"
     )
+
+# Best available players for the team on the clock, its open lineup slots included
+if not draft_complete:
+    with st.expander(f"💡 Recommended Picks for {current_team}", expanded=True):
+        recommended = recommender.rank(team_rosters.lineup(current_team)[0], limit=10, slots=league.slots)
+        st.dataframe(
+            pd.DataFrame(recommended, columns=list(recommended[0]._fields) if recommended else None)
+            .drop(columns='player_id', errors='ignore')
+            .rename(columns={'name': 'Player', 'pos': 'Pos', 'adp': 'ADP', 'score': 'Score', 'need': 'Need Bonus'})
+            .round(2),
+            hide_index=True,
+        )
 # ---------------------- Draft Controller ----------------------
 
 # ---------------------- Player Overview ----------------------
 # Display player information when selected
 if player_choice:
-    # Extract player name from the formatted string (e.g., "Ja'Marr Chase (WR)")
-    selected_name = player_choice.split(" (")[0]
+    # Player id of the selected label (e.g., "Ja'Marr Chase (WR)")
+    selected_id = available_players.key_of(player_choice)
 
-    # Find the player dictionary in the available_players_list
-    player_info = next((p for p in available_players_list if p['name'] == selected_name), None)
+    # Find the player's ADP record (only while they are still available)
+    player_info = available_players.records[selected_id] if selected_id in available_players else None
 
     if player_info:
         st.markdown(
@@ -617,6 +491,13 @@ if player_choice:
                 st.write(f"Bye Week: {int(player_info['bye_week'])}")
             else:
                 st.write("Bye Week: Not available")
+
+            # Chance he is still on the board when this team picks again
+            forecast = next_pick_availability() if not draft_complete else None
+            if forecast is not None:
+                forecast_row = forecast[forecast['player_id'] == selected_id]
+                for pick_column in pick_columns(forecast):
+                    st.write(f"Available at {pick_column}: {forecast_row[pick_column].iloc[0]:.0%}")
         # ---------------------- Player Overview - Column 1.1 ----------------------
 
 
@@ -666,9 +547,9 @@ if player_choice:
             st.markdown(f"```python\n{code_text}\n```")
 
             # Retrieve spike_week_score from the boom_bust_df DataFrame
-            spike_week_score = boom_bust_df.loc[
-                boom_bust_df['player_display_name'] == player_info['name'], 'spike_week_score'
-            ]
+            spike_week_score = player_rows(
+                player_index, 'weekly', boom_bust_df, selected_id
+            )['spike_week_score']
             if not spike_week_score.empty:
                 st.write(f"Spike Week Score: {spike_week_score.values[0]:.2f}")
             else:
@@ -688,60 +569,19 @@ if player_choice:
         team_name = player_info['team']
         position_name = player_info['pos']
 
-        # Filter DataFrame based on all three conditions
-        matched_player = nfl_player_stats_2024_df[(nfl_player_stats_2024_df['player'] == player_name) &
-                                                  (nfl_player_stats_2024_df['pos'] == position_name)]
-
-        # Check if a match was found
-        if not matched_player.empty:
-            print("---------------------------------------------------------------")
-            print("MATCH FOUND:\n")
-            # Assuming matched_player is a DataFrame with one row
-            headers = [
-                'rank', 'player', 'team', 'pos', 'age', 'games', 'games_started', 'cmp',
-                'pass_att', 'pass_yds', 'pass_td', 'int', 'rush_att', 'rush_yds', 'yds_per_att',
-                'rush_td', 'tgt', 'rec', 'rec_yds', 'yds_per_rec', 'rec_td', 'fmb', 'fmb_lost',
-                'total_td', 'two_pt_made', 'two_pt_pass', 'fantasy_pts', 'ppr_pts',
-                'draftkings_pts', 'fanduel_pts', 'value_based_draft', 'pos_rank', 'ovr_rank'
-            ]
-
-            # Build a dictionary of non-zero fields
-            output_data = {}
-            for field in headers:
-                value = matched_player[field].values[0]
-                if isinstance(value, str) or value != 0:
-                    # Keep field names lowercase with spaces (no capitalization)
-                    display_name = field.replace('_', ' ')
-                    output_data[display_name] = value
-
-            # Convert to DataFrame for easy display (e.g., in Streamlit or Jupyter)
-            output_df = pd.DataFrame.from_dict(output_data, orient='index', columns=['Value'])
-
-            # Optional: Reset index if you want it to look more like a 2-column table
-            output_df.reset_index(inplace=True)
-            output_df.columns = ['Field', 'Value']
-
-            fields_per_line = 4
-            total_fields = len(output_df)
-
-            # Print dataframe row to terminal with bold fields
-            for i in range(0, total_fields, fields_per_line):
-                line_items = []
-                for j in range(i, min(i + fields_per_line, total_fields)):
-                    field = output_df.Field.values[j]
-                    value = output_df.Value.values[j]
-                    bold_field = f"\033[1m{field}\033[0m"
-                    line_items.append(f"{bold_field}: {value}")
-                print(" | ".join(line_items))
-
-            print("---------------------------------------------------------------")
-        else:
-            print("---------------------------------------------------------------")
-            print("NO MATCH FOUND!")
-            print(f"player_info['name']: {player_info['name']}")
-            print(f"player_info['team']: {player_info['team']}")
-            print(f"player_info['pos']: {player_info['pos']}")
-            print("---------------------------------------------------------------")
+        # Look up the player's 2024 rows by id, then match the position
+        matched_player = player_rows(player_index, 'stats_2024', nfl_player_stats_2024_df, selected_id)
+        matched_player = matched_player[matched_player['pos'] == position_name]
+
+        # Log the match (non-zero stats only at DEBUG, and at most once a minute per message - this runs every rerun)
+        if matched_player.empty:
+            logger.warning("⚠️ No 2024 stats matched for the selected player",
+                           extra=rate_limited(60, name=player_name, team=team_name, pos=position_name))
+        elif logger.isEnabledFor(logging.DEBUG):
+            row = matched_player.iloc[0]
+            stats = {field: value for field, value in row.items()
+                     if field != 'player_id' and (isinstance(value, str) or value != 0)}
+            logger.debug("Player overview match", extra=rate_limited(60, **stats))
         # ---------------------- Player Overview - Column 1.2 ----------------------
 
         if not matched_player.empty:
@@ -870,8 +710,9 @@ if player_choice:
 
 # ---------------------- Draft Button ----------------------
 # Draft Buttons: Next Pick and Undo Last Pick
-if st.session_state.last_pick:
-    st.success(f"✅ {st.session_state.last_pick} drafted to {st.session_state.last_team}!")
+last_pick = st.session_state.draft.last_pick()
+if st.session_state.show_last_pick and last_pick:
+    st.success(f"✅ {last_pick.name} drafted to {last_pick.team}!")
 
     col_next, col_undo = st.columns(2)
 
@@ -884,16 +725,25 @@ if st.session_state.last_pick:
             st.rerun()
 
 else:
-    if st.button("Draft Player"):
-        if player_choice:
-            selected_name = player_choice.split(" (")[0]  # Extract just the name
-            if selected_name not in [p for picks in st.session_state.teams.values() for p in picks]:
-                st.session_state.teams[current_team].append(selected_name)
-                st.session_state.last_pick = selected_name
-                st.session_state.last_team = current_team
-                st.rerun()
-            else:
-                st.error("⚠️ Player already taken!")
+    col_draft, col_undo, col_redo = st.columns(3)
+
+    with col_undo:
+        st.button("↩️ Undo Pick", on_click=undo_last_pick, disabled=not st.session_state.draft.can_undo())
+
+    with col_redo:
+        st.button("↪️ Redo Pick", on_click=redo_pick, disabled=not st.session_state.draft.can_redo())
+
+    with col_draft:
+        if st.button("Draft Player", disabled=draft_complete):
+            if player_choice:
+                selected_key = available_players.key_of(player_choice)
+                try:
+                    pick = st.session_state.draft.draft(available_players.records[selected_key]['name'], selected_key)
+                    record_pick(pick)
+                    st.session_state.show_last_pick = True
+                    st.rerun()
+                except ValueError:
+                    st.error("⚠️ Player already taken!")
 # ---------------------- Draft Button ----------------------
 
 # ---------------------- Draft Board & Rosters ----------------------
@@ -907,7 +757,7 @@ st.markdown("<div style='font-size:18px; font-weight:Medium;'>📋 Draft Board F
 col1, col2, col3 = st.columns(3)
 
 with col1:
-    selected_team = st.selectbox("Filter by Team:", ["All"] + list(st.session_state.teams.keys()))
+    selected_team = st.selectbox("Filter by Team:", ["All"] + list(st.session_state.draft.rosters.keys()))
 
 # Leave the other two columns blank
 with col2:
@@ -916,19 +766,19 @@ with col3:
     st.empty()
 
 # Displaying Draft Board & Rosters
-teams = list(st.session_state.teams.items())
+teams = list(st.session_state.draft.rosters)
 if selected_team != "All":
-    teams = [(selected_team, st.session_state.teams[selected_team])]
+    teams = [selected_team]
 
 for i in range(0, len(teams), 4):
     cols = st.columns(4)
-    for idx, (team_name, picks) in enumerate(teams[i:i+4]):
+    for idx, team_name in enumerate(teams[i:i+4]):
         with cols[idx]:
             st.markdown(f"<h3 style='color:#0076B6;'>{team_name}</h3>", unsafe_allow_html=True)
-            starters, bench = build_team_roster(picks)  # You may need to adjust this function
+            # Slots are assigned as picks are made (team_rosters.TeamRosters), so this is a lookup
+            starters, bench = team_rosters.lineup(team_name)
             st.markdown("**Starting Lineup:**")
-            required_slots = {"QB": 1, "RB": 2, "WR": 3, "TE": 1, "FLEX": 1}
-            for slot, required_count in required_slots.items():
+            for slot, required_count in league.slots.items():
                 current_players = starters.get(slot, [])
                 for i in range(required_count):
                     if i < len(current_players):
@@ -940,10 +790,39 @@ for i in range(0, len(teams), 4):
             st.markdown("**Bench:**")
             if bench:
                 for p in bench:
-                    st.markdown(f"{slot}: <span style='color: #00ab41; font-weight: bold;'>{player['name']}</span>",
-                                    unsafe_allow_html=True)
+                    st.markdown(f"BN: <span style='color: #00ab41; font-weight: bold;'>{p['name']}</span>",
+                                unsafe_allow_html=True)
             else:
                 st.write("_No bench players yet._")
 # ---------------------- Draft Board & Rosters ----------------------
 
+# ---------------------- Best Ball Simulation ----------------------
+st.markdown("---")
+st.subheader("🎲 Best Ball Season Simulation")
+
+# Season totals of every roster with each week's optimal lineup counting (best_ball_simulator). The weekly data is
+# only loaded the first time the button is pressed, and a result is shown until the board changes.
+board_key = (st.session_state.draft.cursor, frozenset(st.session_state.draft.taken))
+if st.button("Simulate 10,000 Seasons", disabled=not st.session_state.draft.can_undo()):
+    with st.spinner("Simulating seasons ..."):
+        drafted_positions = {
+            key: adp_by_id[key]['pos']
+            for keys in st.session_state.draft.rosters.values() for key in keys if key in adp_by_id
+        }
+        sim_teams, sim_totals = simulate_seasons(
+            st.session_state.draft.rosters, drafted_positions, datasets.load('weekly_points'), slots=league.slots
+        )
+        st.session_state.season_simulation = (board_key, season_summary(sim_teams, sim_totals))
+
+season_simulation = st.session_state.get("season_simulation")
+if season_simulation and season_simulation[0] == board_key:
+    st.dataframe(
+        season_simulation[1].round(1).rename(columns={
+            'team': 'Team', 'mean': 'Mean', 'std': 'Std Dev', 'p10': '10th %ile', 'median': 'Median',
+            'p90': '90th %ile', 'win_pct': 'Win %',
+        }),
+        hide_index=True,
+    )
+# ---------------------- Best Ball Simulation ----------------------
+
 # -------------------------------------------- USER INTERFACE --------------------------------------------
\ No newline at end of file
@@ -1,10 +1,25 @@
 # ---------------------- LIBRARIES ----------------------
 import pandas as pd
 import streamlit as st
+from instrumentation import timed, cache_miss
 # ---------------------- LIBRARIES ----------------------
 
 
+# ---------------------- Update Player Age ----------------------
+# Update player age
+def update_player(df, this_year, data_year):
+    # Calculate how many years to increment
+    year_delta = this_year - data_year
+
+    # Automatically increment age based on year difference
+    df['age'] = df['age'] + year_delta
+
+    return df
+# ---------------------- Update Player Age ----------------------
+
+
 # ---------------------- Age Curve Multiplier and Risk Tag DataFrame ----------------------
+@timed(cached=True)
 @st.cache_data
 def apply_age_curve(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -20,6 +35,7 @@ def apply_age_curve(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Updated DataFrame with age curve info.
     """
+    cache_miss()
 
     def get_age_curve_multiplier(pos, age):
         # Define age multipliers based on research and Best Ball data trends
@@ -0,0 +1,118 @@
+"""
+Structured, leveled logging for the app (replaces the terminal print() dumps).
+
+    from app_logging import get_logger, frame_summary, rate_limited
+    logger = get_logger(__name__)
+
+    logger.info("🧠 ADP data loaded (%s)", frame_summary(adp_df))           # one line, not the whole frame
+    logger.debug("Top players:\n%s", df.head(10).to_string())             # only rendered when DEBUG is on
+    logger.info("Player overview for %s", name, extra=rate_limited(60))    # at most once a minute per call site
+
+Every line is "time level logger message key=value ...": keyword fields passed as extra=fields(...) are appended as
+key=value pairs so the log pipeline can parse them. The level comes from DRAFTVADER_LOG_LEVEL (default INFO);
+DEBUG brings back sample rows of the tables being loaded.
+"""
+# ---------------------- Libraries ----------------------
+import logging
+import os
+import sys
+import threading
+import time
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Settings ----------------------
+LOG_LEVEL = os.environ.get("DRAFTVADER_LOG_LEVEL", "INFO").strip().upper()
+
+# Parent of every app logger ("draftvader.load_data", "draftvader.Home", ...)
+ROOT_LOGGER = "draftvader"
+
+LOG_FORMAT = "%(asctime)s %(levelname)s %(name)s %(message)s%(fields_text)s"
+# ---------------------- Settings ----------------------
+
+
+# ---------------------- Structured Fields ----------------------
+def fields(**values):
+    """ extra= argument attaching key=value fields to a log line (logger.info("built", extra=fields(rows=10))). """
+    return {'fields': values}
+
+def rate_limited(seconds, **values):
+    """
+    extra= argument sampling a log line: it is emitted at most once per `seconds` per call site (logger + message
+    template); the next emitted line reports how many were dropped in between as suppressed=N.
+    """
+    return {'fields': values, 'rate_limit': seconds}
+
+def frame_summary(df):
+    """ 'rows=R cols=C' for a DataFrame (or 'rows=R' for any other sized collection) - logged instead of the data. """
+    if hasattr(df, 'shape') and len(df.shape) == 2:
+        return f"rows={df.shape[0]} cols={df.shape[1]}"
+    return f"rows={len(df)}"
+
+class StructuredFormatter(logging.Formatter):
+    """ Appends a record's `fields` as ' key=value' pairs (values with spaces are quoted). """
+
+    def format(self, record):
+        values = getattr(record, 'fields', None) or {}
+        record.fields_text = "".join(
+            f" {key}={value!r}" if isinstance(value, str) and " " in value else f" {key}={value}"
+            for key, value in values.items()
+        )
+        return super().format(record)
+# ---------------------- Structured Fields ----------------------
+
+
+# ---------------------- Rate Limiting ----------------------
+class RateLimitFilter(logging.Filter):
+    """ Drops records marked with extra=rate_limited(seconds) that repeat a call site within `seconds`. """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        # (logger name, message template) -> [last emitted at, suppressed since then]
+        self._sites = {}
+
+    def filter(self, record):
+        seconds = getattr(record, 'rate_limit', None)
+        if seconds is None:
+            return True
+        key = (record.name, record.msg)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is not None and now - site[0] < seconds:
+                site[1] += 1
+                return False
+            suppressed = site[1] if site is not None else 0
+            self._sites[key] = [now, 0]
+        if suppressed:
+            record.fields = {**(getattr(record, 'fields', None) or {}), 'suppressed': suppressed}
+        return True
+# ---------------------- Rate Limiting ----------------------
+
+
+# ---------------------- Loggers ----------------------
+_configure_lock = threading.Lock()
+
+def configure(level=None, stream=None):
+    """ (Re)configures the app's root logger; get_logger() calls this once with the defaults. """
+    root = logging.getLogger(ROOT_LOGGER)
+    with _configure_lock:
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        handler = logging.StreamHandler(stream or sys.stdout)
+        handler.setFormatter(StructuredFormatter(LOG_FORMAT, datefmt="%H:%M:%S"))
+        handler.addFilter(RateLimitFilter())
+        root.addHandler(handler)
+        root.setLevel(level or LOG_LEVEL)
+        # Streamlit configures the root logger too - don't print every line twice
+        root.propagate = False
+    return root
+
+def get_logger(name):
+    """ Logger for one module (pass __name__), configured on first use. """
+    root = logging.getLogger(ROOT_LOGGER)
+    if not root.handlers:
+        configure()
+    return root.getChild(name.rsplit(".", 1)[-1])
+# ---------------------- Loggers ----------------------
@@ -0,0 +1,110 @@
+"""
+Players still on the board, kept in ADP order overall and per position.
+
+    pool = AvailablePlayers(adp_records, taken=draft.taken)   # adp_records: {player_id: ADP record}
+    pool.labels("WR")            # ("Ja'Marr Chase (WR)", ...) - cached, ready for a selectbox
+    pool.key_of(choice)          # the selected label's player id
+    pool.remove(pick.player_id)  # after a pick
+    pool.add(pick.player_id)     # after an undo
+
+Each view is a list of (adp, player_id) kept sorted with bisect, so drafting or undoing a player finds its slot in
+O(log n) and only the views that changed rebuild their labels. Nothing is re-sorted between reruns.
+"""
+# ---------------------- Libraries ----------------------
+from bisect import bisect_left, insort
+from collections import Counter
+# ---------------------- Libraries ----------------------
+
+
+# View holding every position
+ALL = "All"
+
+
+# ---------------------- Available Players ----------------------
+class AvailablePlayers:
+    """ ADP-ordered index of the undrafted players of one draft (built once per ADP load). """
+
+    __slots__ = ('records', '_views', '_labels', '_label_of', '_keys_by_label')
+
+    def __init__(self, records, taken=()):
+        # player id -> ADP record ({'name', 'pos', 'adp', 'team', 'bye_week', ...}), i.e. the 'adp_records'
+        # dataset (rebuild the index when the registry hands out a new one)
+        self.records = records
+        # view name ("All", "QB", ...) -> sorted [(adp, player id), ...]
+        self._views = {ALL: []}
+        for key, player in self.records.items():
+            if key not in taken:
+                self._views[ALL].append((player['adp'], key))
+                self._views.setdefault(player['pos'], []).append((player['adp'], key))
+        for view in self._views.values():
+            view.sort()
+        # view name -> tuple of "Name (POS)" labels, dropped whenever the view changes
+        self._labels = {}
+        # player id <-> label; players sharing a name and position get their team added ("Mike Williams (WR, NYJ)")
+        labels = {key: f"{player['name']} ({player['pos']})" for key, player in self.records.items()}
+        counts = Counter(labels.values())
+        self._label_of = {
+            key: label if counts[label] == 1 else f"{player['name']} ({player['pos']}, {player.get('team')})"
+            for (key, label), player in zip(labels.items(), self.records.values())
+        }
+        self._keys_by_label = {label: key for key, label in self._label_of.items()}
+
+    def _entry(self, key):
+        player = self.records[key]
+        return player['adp'], key, (ALL, player['pos'])
+
+    def remove(self, key):
+        """ Takes a drafted player off the board (unknown or already removed players are ignored). """
+        if key not in self.records:
+            return
+        adp, key, view_names = self._entry(key)
+        for name in view_names:
+            view = self._views.get(name, [])
+            i = bisect_left(view, (adp, key))
+            if i < len(view) and view[i] == (adp, key):
+                del view[i]
+                self._labels.pop(name, None)
+
+    def add(self, key):
+        """ Puts an undrafted player back on the board at their ADP position. """
+        if key not in self.records or key in self:
+            return
+        adp, key, view_names = self._entry(key)
+        for name in view_names:
+            insort(self._views.setdefault(name, []), (adp, key))
+            self._labels.pop(name, None)
+
+    def __contains__(self, key):
+        if key not in self.records:
+            return False
+        adp, key, _ = self._entry(key)
+        view = self._views[ALL]
+        i = bisect_left(view, (adp, key))
+        return i < len(view) and view[i] == (adp, key)
+
+    def __len__(self):
+        return len(self._views[ALL])
+
+    def keys(self, position=ALL):
+        """ Available player ids in ADP order. """
+        return [key for _, key in self._views.get(position, [])]
+
+    def players(self, position=ALL):
+        """ Available players' ADP records in ADP order. """
+        return [self.records[key] for _, key in self._views.get(position, [])]
+
+    def labels(self, position=ALL):
+        """ Selectbox options ("Ja'Marr Chase (WR)") in ADP order, built once per change of the view. """
+        labels = self._labels.get(position)
+        if labels is None:
+            labels = self._labels[position] = tuple(self._label_of[key] for _, key in self._views.get(position, []))
+        return labels
+
+    def key_of(self, label):
+        """ Player id of a label from labels(), or None. """
+        return self._keys_by_label.get(label)
+
+    def positions(self):
+        """ Positions that still have players available, sorted. """
+        return sorted(name for name, view in self._views.items() if name != ALL and view)
+# ---------------------- Available Players ----------------------
@@ -0,0 +1,66 @@
+"""
+Benchmark: Best Ball season simulation throughput (best_ball_simulator) for a completed 12-team draft.
+
+Rosters and weekly histories are synthetic (20 rounds, 1-17 games of history per player, a few players without
+history), so the benchmark runs offline without nfl_data_py.
+
+Usage:
+    python benchmarks/bench_best_ball_simulator.py
+    python benchmarks/bench_best_ball_simulator.py --seasons 1000 10000 --rounds 18
+"""
+# ---------------------- Libraries ----------------------
+import argparse
+import os
+import statistics
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from best_ball_simulator import simulate_seasons, SEASON_WEEKS
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Synthetic Draft ----------------------
+# Positions drafted round by round (cycled), roughly a Best Ball build
+ROUND_POSITIONS = ['RB', 'WR', 'WR', 'RB', 'WR', 'QB', 'TE', 'RB', 'WR', 'WR']
+
+def synthetic_draft(teams, rounds, seed=0):
+    rng = np.random.default_rng(seed)
+    rosters = {f"Team {team}": [f"T{team}R{rnd}" for rnd in range(rounds)] for team in range(1, teams + 1)}
+    positions = {key: ROUND_POSITIONS[rnd % len(ROUND_POSITIONS)]
+                 for keys in rosters.values() for rnd, key in enumerate(keys)}
+    players = {}
+    for key in positions:
+        if rng.random() < 0.9:
+            games = rng.gamma(2.0, 6.0, rng.integers(1, 18)).astype(np.float32)
+            players[key] = np.concatenate([games, np.zeros(17 - len(games), dtype=np.float32)])
+    pooled = {pos: rng.gamma(1.5, 5.0, 2_000).astype(np.float32) for pos in set(ROUND_POSITIONS)}
+    return rosters, positions, {'players': players, 'positions': pooled}
+# ---------------------- Synthetic Draft ----------------------
+
+
+# ---------------------- Benchmark ----------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seasons', type=int, nargs='+', default=[1_000, 10_000])
+    parser.add_argument('--teams', type=int, default=12)
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    rosters, positions, weekly_points = synthetic_draft(args.teams, args.rounds)
+    print(f"{args.teams} teams x {args.rounds} rounds x {SEASON_WEEKS} weeks")
+    print(f"{'seasons':>8} {'median s':>9} {'lineups/s':>12}")
+    for seasons in args.seasons:
+        samples = []
+        for seed in range(args.repeat):
+            start = time.perf_counter()
+            simulate_seasons(rosters, positions, weekly_points, seasons=seasons, seed=seed)
+            samples.append(time.perf_counter() - start)
+        median = statistics.median(samples)
+        print(f"{seasons:>8} {median:>9.2f} {seasons * args.teams * SEASON_WEEKS / median:>12,.0f}")
+
+if __name__ == '__main__':
+    main()
+# ---------------------- Benchmark ----------------------
@@ -0,0 +1,57 @@
+"""
+Benchmark: availability forecast latency (draft_simulator) for a live draft, in one process and over a process pool.
+
+The ADP pool is synthetic (300 players, the size of the FantasyPros ADP page), so the benchmark runs offline. The
+forecast is for the team on the clock at the given pick and its next two picks.
+
+Usage:
+    python benchmarks/bench_draft_simulator.py
+    python benchmarks/bench_draft_simulator.py --simulations 10000 100000 --workers 1 4 --cursor 30
+"""
+# ---------------------- Libraries ----------------------
+import argparse
+import os
+import statistics
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from draft_simulator import upcoming_picks, picks_by_others, survival_probabilities
+from draft_state import DraftState
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Benchmark ----------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--simulations', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count() or 1])
+    parser.add_argument('--players', type=int, default=300)
+    parser.add_argument('--cursor', type=int, default=0, help="Picks already made (0-based pick on the clock)")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    draft = DraftState()
+    draft.cursor = args.cursor
+    team = draft.team_on_clock()
+    picks = upcoming_picks(draft, team)
+    pick_counts = [picks_by_others(draft, team, number) for number in picks]
+    adp = np.sort(np.random.default_rng(0).uniform(1, 300, args.players))
+
+    print(f"Team {team} on the clock at pick {args.cursor + 1}; next picks {[number + 1 for number in picks]} "
+          f"({pick_counts} picks by other teams before each)")
+    print(f"{'simulations':>12} {'workers':>8} {'median ms':>10} {'min ms':>8}")
+    for simulations in args.simulations:
+        for workers in sorted(set(args.workers)):
+            samples = []
+            for seed in range(args.repeat):
+                start = time.perf_counter()
+                survival_probabilities(adp, pick_counts, simulations=simulations, workers=workers, seed=seed)
+                samples.append(time.perf_counter() - start)
+            print(f"{simulations:>12} {workers:>8} {statistics.median(samples) * 1000:>10.1f} "
+                  f"{min(samples) * 1000:>8.1f}")
+
+if __name__ == '__main__':
+    main()
+# ---------------------- Benchmark ----------------------
@@ -0,0 +1,173 @@
+"""
+Benchmark: terminal output cost of one app rerun - the old print() dumps vs. the leveled logging in app_logging.
+
+    legacy print   - print(df) of the whole positional scarcity frame, the top-10 spike week iterrows block,
+                     the ADP / projection "Data summary" rows and Home.py's ANSI player overview lines
+    logging INFO   - what the same code paths log now: one summary line (rows / cols) per table, the player
+                     overview line sampled at most once a minute
+    logging DEBUG  - the same with DEBUG on (sample rows rendered again, still no full-frame dumps)
+
+Output goes to a temporary file, like a log pipeline capturing stdout. The tables are synthetic, with the shape of
+the scraped ones, so the benchmark runs offline.
+
+Usage:
+    python benchmarks/bench_logging.py
+    python benchmarks/bench_logging.py --reruns 200
+"""
+# ---------------------- Libraries ----------------------
+import argparse
+import contextlib
+import logging
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import app_logging
+from app_logging import get_logger, frame_summary, rate_limited
+from scraper import TEAM_ABBR
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Synthetic Tables ----------------------
+STAT_FIELDS = [
+    'rank', 'player', 'team', 'pos', 'age', 'games', 'games_started', 'cmp', 'pass_att', 'pass_yds', 'pass_td',
+    'int', 'rush_att', 'rush_yds', 'yds_per_att', 'rush_td', 'tgt', 'rec', 'rec_yds', 'yds_per_rec', 'rec_td',
+    'fmb', 'fmb_lost', 'total_td', 'two_pt_made', 'two_pt_pass', 'fantasy_pts', 'ppr_pts', 'draftkings_pts',
+    'fanduel_pts', 'value_based_draft', 'pos_rank', 'ovr_rank'
+]
+
+def synthetic_tables(seed=0):
+    rng = random.Random(seed)
+    scarcity = pd.DataFrame([
+        {'name': f"{pos} Player{i}", 'team': rng.choice(TEAM_ABBR), 'pos': pos,
+         **{f"stat_{k}": rng.uniform(0, 300) for k in range(10)},
+         'proj_points': rng.uniform(0, 350), 'VoR': rng.uniform(-50, 150), 'Tier': rng.randint(1, 8),
+         'ScarcityScore': rng.uniform(-50, 180)}
+        for pos, count in {'QB': 40, 'RB': 90, 'WR': 120, 'TE': 50}.items() for i in range(count)
+    ])
+    spike = pd.DataFrame({
+        'player_display_name': [f"RB Player{i}" for i in range(600)],
+        'spike_week_score': [rng.uniform(0, 20) for _ in range(600)],
+        **{col: [float(rng.randint(0, 17)) for _ in range(600)] for col in [
+            'total_games', 'over_20_ppr_count', 'over_25_ppr_count', 'over_30_ppr_count',
+            'under_5_ppr_count', 'under_10_ppr_count', 'under_15_ppr_count']},
+    })
+    adp = [{'rank': i, 'name': f"Player{i}", 'pos': 'WR', 'adp': i + 0.5, 'team': 'KC', 'bye_week': 10}
+           for i in range(300)]
+    stats_row = pd.DataFrame([{field: (f"Player {field}" if field in ('player', 'team', 'pos')
+                                       else rng.uniform(0, 300)) for field in STAT_FIELDS}])
+    return scarcity, spike, adp, stats_row
+# ---------------------- Synthetic Tables ----------------------
+
+
+# ---------------------- One Rerun ----------------------
+def legacy_rerun(scarcity, spike, adp, stats_row):
+    """ The output statements of the pre-logging code paths, line for line. """
+    print("\n")
+    print(scarcity)
+    print("---------------------------------------------------------------")
+
+    top_10 = spike.sort_values(by='spike_week_score', ascending=False).head(10)
+    print("\nTop 10 Players by Spike Week Score:\n")
+    for index, row in top_10.iterrows():
+        print(f"{row['player_display_name']}: {int(row['total_games'])} total games\n"
+              f"Spike Week Score: {row['spike_week_score']:.2f}\n"
+              f"{int(row['over_20_ppr_count'])} games over 20, {int(row['over_25_ppr_count'])} over 25, "
+              f"{int(row['over_30_ppr_count'])} over 30\n"
+              f"{int(row['under_5_ppr_count'])} under 5, {int(row['under_10_ppr_count'])} under 10, "
+              f"{int(row['under_15_ppr_count'])} under 15")
+        print("---------------------------------------------------------------")
+
+    print("🧠 ADP data loaded!\n")
+    print("Data summary:")
+    for player in adp[:5]:
+        print(player)
+    print("---------------------------------------------------------------")
+
+    print("---------------------------------------------------------------")
+    print("MATCH FOUND:\n")
+    output_data = {}
+    for field in STAT_FIELDS:
+        value = stats_row[field].values[0]
+        if isinstance(value, str) or value != 0:
+            output_data[field.replace('_', ' ')] = value
+    output_df = pd.DataFrame.from_dict(output_data, orient='index', columns=['Value'])
+    output_df.reset_index(inplace=True)
+    output_df.columns = ['Field', 'Value']
+    for i in range(0, len(output_df), 4):
+        line_items = []
+        for j in range(i, min(i + 4, len(output_df))):
+            line_items.append(f"\033[1m{output_df.Field.values[j]}\033[0m: {output_df.Value.values[j]}")
+        print(" | ".join(line_items))
+    print("---------------------------------------------------------------")
+
+def logging_rerun(scarcity, spike, adp, stats_row):
+    """ What the same code paths log now (see positional_scarcity, spike_week_score, load_data and Home.py). """
+    logger = get_logger("bench")
+
+    logger.info("🧠 Positional scarcity scores calculated (%s)", frame_summary(scarcity))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Sample rows:\n%s", scarcity.head().to_string())
+
+    if logger.isEnabledFor(logging.DEBUG):
+        top_10 = spike.sort_values(by='spike_week_score', ascending=False).head(10)
+        logger.debug("Top 10 Players by Spike Week Score:\n%s", top_10.to_string(index=False))
+    logger.info("🧠 Spike Week scores calculated (%s)", frame_summary(spike))
+
+    logger.info("🧠 ADP data loaded (%s)", frame_summary(adp))
+    logger.debug("Sample rows: %s", adp[:5])
+
+    if logger.isEnabledFor(logging.DEBUG):
+        row = stats_row.iloc[0]
+        stats = {field: value for field, value in row.items() if isinstance(value, str) or value != 0}
+        logger.debug("Player overview match", extra=rate_limited(60, **stats))
+# ---------------------- One Rerun ----------------------
+
+
+# ---------------------- Benchmark ----------------------
+def time_reruns(rerun, tables, reruns, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(reruns):
+            rerun(*tables)
+        samples.append((time.perf_counter() - start) / reruns)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--reruns', type=int, default=50, help="Reruns per timing sample")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    tables = synthetic_tables()
+    results = {}
+    with tempfile.TemporaryFile("w+", encoding="utf-8") as sink:
+        with contextlib.redirect_stdout(sink):
+            results['legacy print'] = time_reruns(legacy_rerun, tables, args.reruns, args.repeat)
+        legacy_bytes = sink.tell()
+
+        for label, level in [('logging INFO', 'INFO'), ('logging DEBUG', 'DEBUG')]:
+            app_logging.configure(level=level, stream=sink)
+            sink.seek(0)
+            sink.truncate()
+            results[label] = time_reruns(logging_rerun, tables, args.reruns, args.repeat)
+            results[f"{label} bytes"] = sink.tell()
+
+    baseline = results['legacy print']
+    per_rerun = args.reruns * args.repeat
+    print(f"Output cost per rerun ({args.reruns} reruns x {args.repeat} samples, median)")
+    print(f"{'legacy print':<16} {baseline * 1000:>8.2f} ms  {legacy_bytes / per_rerun / 1024:>8.1f} KiB/rerun")
+    for label in ['logging INFO', 'logging DEBUG']:
+        print(f"{label:<16} {results[label] * 1000:>8.2f} ms  "
+              f"{results[f'{label} bytes'] / per_rerun / 1024:>8.1f} KiB/rerun  "
+              f"saves {(baseline - results[label]) * 1000:.2f} ms ({baseline / results[label]:.0f}x)")
+
+if __name__ == '__main__':
+    main()
+# ---------------------- Benchmark ----------------------
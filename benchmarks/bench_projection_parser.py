@@ -0,0 +1,119 @@
+"""
+Benchmark: schema-driven projection parser (scraper.parse_season_projections) vs. the old per-cell
+BeautifulSoup html.parser loop that load_season_projections_qb/rb/wr/te used.
+
+Usage:
+    python benchmarks/bench_projection_parser.py                      # synthetic FantasyPros-style pages
+    python benchmarks/bench_projection_parser.py --pages saved_pages  # saved qb.html, rb.html, wr.html, te.html
+"""
+# ---------------------- Libraries ----------------------
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import pandas as pd
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import scraper
+from scraper import PROJECTION_SCHEMAS, TEAM_ABBR, parse_season_projections
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Legacy Parser ----------------------
+def legacy_parse(html, pos):
+    """ The pre-schema parser: html.parser tree, per-cell .text.strip(), per-column pd.to_numeric. """
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', {'id': 'data'})
+    stat_cols = PROJECTION_SCHEMAS[pos]
+
+    players = []
+    for row in table.tbody.find_all('tr'):
+        cols = row.find_all('td')
+        if len(cols) > 1:
+            player_info = cols[0].text.strip()
+            player_name_parts = player_info.split()
+            team = player_name_parts[-1] if player_name_parts[-1] in TEAM_ABBR else ''
+            name = ' '.join(player_name_parts[:-1]) if team else player_info
+            player = {'name': name, 'team': team}
+            for i, col in enumerate(stat_cols, start=1):
+                player[col] = cols[i].text.strip()
+            players.append(player)
+
+    df = pd.DataFrame(players)
+    for col in stat_cols:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df = df.dropna(subset=['name', 'proj_points'])
+    df = df.sort_values(by='proj_points', ascending=False)
+    return df.to_dict(orient='records')
+# ---------------------- Legacy Parser ----------------------
+
+
+# ---------------------- Synthetic Pages ----------------------
+def synthetic_page(pos, n_players=250, seed=0):
+    """ Builds a page shaped like FantasyPros' projection table (player link cell, then one cell per stat). """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n_players):
+        team = rng.choice(TEAM_ABBR)
+        cells = [f'<td class="player-label"><a class="player-name" href="#">Player{i} Name{i}</a> {team} '
+                 f'<a class="fp-player-link" href="#"></a></td>']
+        cells += [f'<td class="center">{rng.uniform(0, 400):.1f}</td>' for _ in PROJECTION_SCHEMAS[pos]]
+        rows.append(f"<tr class='mpb-player-{i}'>{''.join(cells)}</tr>")
+    header = ''.join(f'<th>{col}</th>' for col in ['Player'] + PROJECTION_SCHEMAS[pos])
+    return (f'<html><head><title>{pos} Projections</title></head><body><div class="mobile-table">'
+            f'<table id="data"><thead><tr>{header}</tr></thead><tbody>{"".join(rows)}</tbody></table>'
+            f'</div></body></html>')
+# ---------------------- Synthetic Pages ----------------------
+
+
+# ---------------------- Benchmark ----------------------
+def time_it(func, *args, repeat=7):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', help="Directory with saved qb.html, rb.html, wr.html and te.html pages")
+    parser.add_argument('--repeat', type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"Tree builder: {'lxml' if scraper.lxml_html is not None else 'html.parser (lxml not installed)'}")
+    print(f"{'pos':<4} {'rows':>5} {'legacy (ms)':>12} {'schema (ms)':>12} {'speedup':>8}  match")
+
+    total_legacy = total_new = 0.0
+    for pos in ['QB', 'RB', 'WR', 'TE']:
+        if args.pages:
+            with open(os.path.join(args.pages, f'{pos.lower()}.html'), encoding='utf-8') as f:
+                html = f.read()
+        else:
+            html = synthetic_page(pos)
+
+        legacy_rows = legacy_parse(html, pos)
+        new_rows = parse_season_projections(html, pos)
+        # The new parser also reads "4,306.1"-style numbers, so only compare rows the legacy parser kept
+        new_by_name = {row['name']: row for row in new_rows}
+        match = all(
+            row['name'] in new_by_name and new_by_name[row['name']]['proj_points'] == row['proj_points']
+            for row in legacy_rows
+        )
+
+        legacy_time = time_it(legacy_parse, html, pos, repeat=args.repeat)
+        new_time = time_it(parse_season_projections, html, pos, repeat=args.repeat)
+        total_legacy += legacy_time
+        total_new += new_time
+        print(f"{pos:<4} {len(new_rows):>5} {legacy_time * 1000:>12.1f} {new_time * 1000:>12.1f} "
+              f"{legacy_time / new_time:>7.1f}x  {'yes' if match else 'NO'}")
+
+    print(f"{'all':<4} {'':>5} {total_legacy * 1000:>12.1f} {total_new * 1000:>12.1f} "
+          f"{total_legacy / total_new:>7.1f}x")
+
+if __name__ == '__main__':
+    main()
+# ---------------------- Benchmark ----------------------
@@ -0,0 +1,110 @@
+"""
+Benchmark: per-pick latency of the live recommendations (recommendations.PickRecommender) over a full draft.
+
+Each pick does what Home.py does between two picks: record the pick (recommender, available players and team
+lineups), then rank the available players for the next team on the clock. The whole ranking is built, not just the
+top 10, so the numbers are an upper bound. The tables are synthetic (300 ADP players), so the benchmark runs offline.
+
+Exits with status 1 when the p99 pick latency is over the budget (default 50 ms), so it can gate a change.
+
+Usage:
+    python benchmarks/bench_recommendations.py
+    python benchmarks/bench_recommendations.py --drafts 20 --budget-ms 50
+"""
+# ---------------------- Libraries ----------------------
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from available_players import AvailablePlayers
+from draft_state import DraftState
+from league_config import LeagueConfig
+from player_identity import player_id
+from recommendations import PickRecommender, build_player_scores
+from team_rosters import TeamRosters
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Synthetic Tables ----------------------
+def synthetic_tables(players, seed=0):
+    """ ADP records and the four scoring tables, with the columns the 'player_scores' builder reads. """
+    rng = random.Random(seed)
+    positions = ['QB', 'RB', 'RB', 'WR', 'WR', 'WR', 'TE']
+    adp = sorted(
+        ({'name': f"Player{i}", 'pos': rng.choice(positions), 'adp': rng.uniform(1, 300), 'team': 'KC',
+          'bye_week': 10} for i in range(players)),
+        key=lambda player: player['adp'],
+    )
+    records = {player_id(player['name']): player for player in adp}
+    names = [player['name'] for player in adp]
+    scarcity = pd.DataFrame({
+        'name': names, 'player_id': list(records), 'pos': [player['pos'] for player in adp],
+        'VoR': [rng.uniform(-50, 150) for _ in names], 'ScarcityScore': [rng.uniform(-50, 180) for _ in names],
+    })
+    value_vs_adp = {'ALL': pd.DataFrame({'name': names, 'value_vs_adp': [rng.uniform(-30, 30) for _ in names]})}
+    age_curve = pd.DataFrame({'player': names, 'age_curve_multiplier': [rng.uniform(0.85, 1.05) for _ in names]})
+    boom_bust = pd.DataFrame({'player_id': list(records), 'spike_week_score': [rng.uniform(0, 20) for _ in names]})
+    return records, scarcity, value_vs_adp, age_curve, boom_bust
+# ---------------------- Synthetic Tables ----------------------
+
+
+# ---------------------- Benchmark ----------------------
+def run_draft(records, scores, rounds, seed):
+    """ One full draft with ADP-ish picks; returns the per-pick latencies in seconds. """
+    rng = random.Random(seed)
+    draft = DraftState(LeagueConfig(num_teams=12, rounds=rounds))
+    pool = AvailablePlayers(records)
+    rosters = TeamRosters(records, draft.rosters, draft.league.slots)
+    recommender = PickRecommender(scores, records)
+    latencies = []
+    for _ in range(draft.league.total_picks):
+        # Someone from the top of the board, not always the first
+        candidates = pool.players()[:8]
+        name = rng.choice(candidates)['name']
+
+        start = time.perf_counter()
+        pick = draft.draft(name)
+        pool.remove(pick.player_id)
+        rosters.add(pick.team, pick.player_id)
+        recommender.remove(pick.player_id)
+        if not draft.is_complete():
+            recommender.rank(rosters.lineup(draft.team_name(draft.team_on_clock()))[0], slots=draft.league.slots)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--players', type=int, default=300)
+    parser.add_argument('--rounds', type=int, default=20)
+    parser.add_argument('--drafts', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=50.0, help="p99 pick latency budget")
+    args = parser.parse_args()
+
+    tables = synthetic_tables(args.players)
+    start = time.perf_counter()
+    scores = build_player_scores(*tables)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    latencies = []
+    for seed in range(args.drafts):
+        latencies += run_draft(tables[0], scores, args.rounds, seed)
+    latencies_ms = np.array(latencies) * 1000
+    p50, p99 = np.percentile(latencies_ms, [50, 99])
+
+    print(f"Base scores ('player_scores', once per data load): {build_ms:.1f} ms")
+    print(f"Per pick over {len(latencies_ms)} picks: p50 {p50:.3f} ms  p99 {p99:.3f} ms  "
+          f"max {latencies_ms.max():.3f} ms  mean {statistics.fmean(latencies_ms):.3f} ms")
+    if p99 > args.budget_ms:
+        print(f"⚠️ p99 {p99:.2f} ms is over the {args.budget_ms:.0f} ms budget")
+        raise SystemExit(1)
+    print(f"✅ Within the {args.budget_ms:.0f} ms budget")
+
+if __name__ == '__main__':
+    main()
+# ---------------------- Benchmark ----------------------
@@ -0,0 +1,138 @@
+"""
+Benchmark: memory held by 1, 10 and 50 simulated browser sessions.
+
+    per-session copies  - what Home.py used to do: every session stored its own copy of the stats, ADP, projection,
+                          scarcity, rookie, injury and age curve tables in st.session_state (st.cache_data hands each
+                          caller a fresh unpickled copy)
+    shared registry     - the tables live once in datasets.py and session_state only holds the draft state
+
+The scraped sources are replaced by synthetic tables of the same shape, so the benchmark runs offline.
+
+Usage:
+    python benchmarks/bench_session_memory.py
+    python benchmarks/bench_session_memory.py --sessions 1 10 50 100
+"""
+# ---------------------- Libraries ----------------------
+import argparse
+import gc
+import os
+import pickle
+import random
+import sys
+import tracemalloc
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import datasets
+from draft_state import DraftState
+from player_identity import add_player_ids
+from scraper import PROJECTION_SCHEMAS, TEAM_ABBR
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Synthetic Sources ----------------------
+def synthetic_sources(seed=0):
+    """ Stand-ins for the scraped datasets (FantasyPros, injury news, rookies, nfl_data_py boom/bust). """
+    rng = random.Random(seed)
+    counts = {'QB': 40, 'RB': 90, 'WR': 120, 'TE': 50}
+
+    fantasypros = {'adp': []}
+    for pos, count in counts.items():
+        fantasypros[pos] = [
+            {'name': f"{pos} Player{i}", 'team': rng.choice(TEAM_ABBR),
+             **{col: rng.uniform(0, 300) for col in PROJECTION_SCHEMAS[pos]}}
+            for i in range(count)
+        ]
+        fantasypros['adp'] += [
+            {'rank': 0, 'name': f"{pos} Player{i}", 'pos': pos, 'adp': rng.uniform(1, 300),
+             'team': rng.choice(TEAM_ABBR), 'bye_week': rng.randint(5, 14)}
+            for i in range(count)
+        ]
+
+    injuries = pd.DataFrame([
+        {'player_name': f"WR Player{i}", 'headline': f"WR Player{i} (hamstring) limited at practice " * 2,
+         'date': "Aug 20, 2025", 'description': "Lorem ipsum dolor sit amet. " * 12,
+         'fantasy_impact': "Monitor his status ahead of the weekend. " * 6}
+        for i in range(150)
+    ])
+    rookies = pd.DataFrame([
+        {'RK': i, 'PLAYER NAME': f"Rookie Player{i}", 'TEAM': rng.choice(TEAM_ABBR), 'POS': 'WR', 'AGE': 21,
+         'BEST': i, 'WORST': i + 20, 'AVG.': i + 5.5, 'STD.DEV': 3.2, 'ECR VS. ADP': 0}
+        for i in range(200)
+    ])
+    boom_bust = pd.DataFrame({
+        'player_display_name': [f"RB Player{i}" for i in range(600)],
+        **{col: [rng.uniform(0, 20) for _ in range(600)] for col in ['spike_week_score', 'total_games']},
+    })
+    return {
+        'fantasypros': fantasypros,
+        'injury_reports': add_player_ids(injuries, 'player_name'),
+        'rookie_rankings': add_player_ids(rookies, 'PLAYER NAME'),
+        'boom_bust': add_player_ids(boom_bust, 'player_display_name'),
+    }
+
+def load_shared_tables():
+    """ Builds the registry tables Home.py and the pages read (scraped inputs replaced by synthetic ones). """
+    for name, value in synthetic_sources().items():
+        datasets.register(name)(lambda value=value: value)
+    fantasypros = datasets.load('fantasypros')
+    adp_by_position = datasets.load('adp_by_position')
+    return {
+        'nfl_player_stats_2024_df': datasets.load('stats_2024'),
+        **{f'adp_data_{pos.lower()}': adp_by_position[pos] for pos in ['QB', 'RB', 'WR', 'TE']},
+        **{f'season_projections_{pos.lower()}': fantasypros[pos] for pos in ['QB', 'RB', 'WR', 'TE']},
+        'positional_scarcity_df': datasets.load('positional_scarcity'),
+        'rookie_rankings_df': datasets.load('rookie_rankings'),
+        'injury_reports_df': datasets.load('injury_reports'),
+        'age_curve_df': datasets.load('age_curve'),
+    }
+# ---------------------- Synthetic Sources ----------------------
+
+
+# ---------------------- Simulated Sessions ----------------------
+def draft_state():
+    """ The draft-specific part of session_state (see Home.initialize_session_state). """
+    return {"draft": DraftState(), "show_last_pick": False}
+
+def copied_session(tables):
+    # Each session got its own copy of every table (an st.cache_data hit unpickles a fresh one)
+    return {**draft_state(), **{key: pickle.loads(pickle.dumps(value)) for key, value in tables.items()}}
+
+def shared_session(tables):
+    # Sessions only keep draft state; tables are looked up in the registry when a page needs them
+    return draft_state()
+
+def session_memory(make_session, tables, n_sessions):
+    """ Bytes allocated by `n_sessions` sessions on top of the shared tables. """
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    sessions = [make_session(tables) for _ in range(n_sessions)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del sessions
+    return after - before
+# ---------------------- Simulated Sessions ----------------------
+
+
+# ---------------------- Benchmark ----------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1, 10, 50])
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    tables = load_shared_tables()
+    shared_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"Shared tables + their modules (loaded once per process): {shared_size / 2**20:.1f} MiB\n")
+
+    print(f"{'sessions':>8} {'per-session copies':>20} {'shared registry':>17}")
+    for n_sessions in args.sessions:
+        copied = session_memory(copied_session, tables, n_sessions)
+        shared = session_memory(shared_session, tables, n_sessions)
+        print(f"{n_sessions:>8} {copied / 2**20:>16.1f} MiB {shared / 2**20:>13.2f} MiB")
+
+if __name__ == '__main__':
+    main()
+# ---------------------- Benchmark ----------------------
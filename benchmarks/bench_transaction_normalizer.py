@@ -0,0 +1,129 @@
+"""
+Benchmark: single-pass transaction normalizer (player_transactions.normalize_transactions) vs. the old
+per-line loop of ~30 re.sub calls in parse_player_transactions, timed and checked against the correctly spaced text
+of each synthetic line.
+
+Usage:
+    python benchmarks/bench_transaction_normalizer.py               # one synthetic season (~5,000 lines)
+    python benchmarks/bench_transaction_normalizer.py --lines 20000
+"""
+# ---------------------- Libraries ----------------------
+import argparse
+import os
+import random
+import re
+import statistics
+import sys
+import time
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from player_transactions import (
+    TRANSACTION_KEYWORDS, TRANSACTION_POSITIONS, normalize_transaction_text, normalize_transactions
+)
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Legacy Normalizer ----------------------
+def legacy_normalize(text):
+    """ The pre-compiled-pattern normalizer, rule for rule. """
+    text = re.sub(r'(The)([A-Z])', r'\1 \2', text)
+
+    for keyword in TRANSACTION_KEYWORDS:
+        text = re.sub(rf'([a-z])({keyword})', r'\1 \2', text, flags=re.IGNORECASE)
+
+    for pos in TRANSACTION_POSITIONS:
+        text = re.sub(rf'({pos})([A-Z])', r'\1 \2', text)
+
+    def fix_glued(match):
+        word = match.group(2)
+        if word.lower() == "season":
+            return match.group(1) + word
+        return match.group(1) + " " + word
+
+    text = re.sub(r'([a-zA-Z])(?=(to|on|from|season)\b)', r'\1 ', text)
+    text = re.sub(r'([a-zA-Z])\s(season\b)', fix_glued, text, flags=re.IGNORECASE)
+
+    text = re.sub(r'\b(the)([A-Z])', r'\1 \2', text, flags=re.IGNORECASE)
+    return text
+# ---------------------- Legacy Normalizer ----------------------
+
+
+# ---------------------- Synthetic Season ----------------------
+TEAMS = ["Baltimore Ravens", "Kansas City Chiefs", "Detroit Lions", "Buffalo Bills", "Green Bay Packers",
+         "San Francisco 49ers", "Dallas Cowboys", "New York Jets", "Houston Texans", "Miami Dolphins"]
+FIRST_NAMES = ["John", "Marcus", "Tyler", "DeShawn", "Chris", "Malik", "Brandon", "Kevin", "Andre", "Jordan"]
+LAST_NAMES = ["Smith", "Williams", "Brown", "Davis", "Miller", "Moore", "Taylor", "Thomas", "Harris", "Clark",
+              "Jackson", "Dalton"]
+
+# {g} marks where get_text(strip=True) drops the space between two text nodes
+TEMPLATES = [
+    "The{g}{team}{g}signed {pos}{g}{name}{g}to a one-year contract.",
+    "The{g}{team}{g}re-signed {pos}{g}{name}.",
+    "The{g}{team}{g}waived {pos}{g}{name}.",
+    "The{g}{team}{g}claimed {pos}{g}{name}{g}off waivers from the{g}{other}.",
+    "The{g}{team}{g}released {pos}{g}{name}.",
+    "The{g}{team}{g}activated {pos}{g}{name}{g}from the physically unable to perform list.",
+    "The{g}{team}{g}placed {pos}{g}{name}{g}on injured reserve.",
+    "The{g}{team}{g}traded {pos}{g}{name}{g}to the{g}{other}{g}for a 2026 fifth-round pick.",
+    "The{g}{team}{g}signed {pos}{g}{name}{g}to a contract extension through the 2027 season.",
+    "The{g}{team}{g}signed{g}{pos}{g}{name}{g}to the practice squad.",
+]
+
+def synthetic_season(n_lines, seed=0):
+    """
+    Transaction lines glued the way get_text(strip=True) returns them from Pro-Football-Reference, and the same
+    lines correctly spaced.
+    """
+    rng = random.Random(seed)
+    lines, expected = [], []
+    for _ in range(n_lines):
+        team, other = rng.sample(TEAMS, 2)
+        values = dict(team=team, other=other, pos=rng.choice(TRANSACTION_POSITIONS),
+                      name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}")
+        template = rng.choice(TEMPLATES)
+        lines.append(template.format(g="", **values))
+        expected.append(template.format(g=" ", **values))
+    return lines, expected
+# ---------------------- Synthetic Season ----------------------
+
+
+# ---------------------- Benchmark ----------------------
+def time_it(func, *args, repeat=5):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--lines', type=int, default=5000, help="Transaction lines in the synthetic season")
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    lines, expected = synthetic_season(args.lines)
+    series = pd.Series(lines)
+
+    legacy_time = time_it(lambda: [legacy_normalize(line) for line in lines], repeat=args.repeat)
+    per_line_time = time_it(lambda: [normalize_transaction_text(line) for line in lines], repeat=args.repeat)
+    batch_time = time_it(normalize_transactions, series, repeat=args.repeat)
+
+    print(f"{len(lines)} transaction lines")
+    print(f"{'legacy loop':<28} {legacy_time * 1000:>9.1f} ms")
+    print(f"{'normalize_transaction_text':<28} {per_line_time * 1000:>9.1f} ms  "
+          f"{legacy_time / per_line_time:>5.1f}x")
+    print(f"{'normalize_transactions':<28} {batch_time * 1000:>9.1f} ms  {legacy_time / batch_time:>5.1f}x")
+
+    # Lines each normalizer gets wrong (e.g. the legacy "C B Jaylon", "extensi on" or "Houst on Texans")
+    for label, output in [('legacy loop', [legacy_normalize(line) for line in lines]),
+                          ('normalize_transactions', normalize_transactions(series).tolist())]:
+        wrong = [(got, want) for got, want in zip(output, expected) if got != want]
+        print(f"\n{label}: {len(wrong)}/{len(lines)} lines differ from the correctly spaced text")
+        for got, want in wrong[:3]:
+            print(f"  got:      {got}\n  expected: {want}")
+
+if __name__ == '__main__':
+    main()
+# ---------------------- Benchmark ----------------------
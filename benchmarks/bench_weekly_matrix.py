@@ -0,0 +1,133 @@
+"""
+Benchmark: handing the weekly data to process-pool workers - a pickled weekly DataFrame vs. the weekly_matrix
+published through shared memory or a memory-mapped .npy file.
+
+    pickled frame   - every worker gets the weekly frame (nfl_data_py's ~50 columns) as an initializer argument and
+                      builds the player x week matrix itself
+    shared memory   - the matrix is built once and published with weekly_matrix.publish(); workers attach()
+    npy mmap        - the same through a .npy file workers memory-map
+
+For each it reports the worker start-up time (pool created -> every worker initialized), the time a worker takes to
+read every cell once and each worker's memory: RSS and its private part (USS, from /proc/self/smaps_rollup on
+Linux) - pages of a shared segment or a mapped file count as shared, not private. Workers use the "spawn" start
+method by default (macOS / Windows, and what forked workers pay as soon as they write to the inherited pages). The
+weekly frame is synthetic, so the benchmark runs offline.
+
+Usage:
+    python benchmarks/bench_weekly_matrix.py
+    python benchmarks/bench_weekly_matrix.py --players 2000 --seasons 10 --workers 4 --start-method fork
+"""
+# ---------------------- Libraries ----------------------
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import weekly_matrix
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Synthetic Weekly Data ----------------------
+def synthetic_weekly_data(players, seasons, extra_columns=45, seed=0):
+    """ A weekly frame shaped like nfl_data_py.import_weekly_data() (one row per player game, ~50 columns). """
+    rng = np.random.default_rng(seed)
+    positions = np.array(['QB', 'RB', 'WR', 'TE'])
+    player = np.repeat(np.arange(players), seasons * 17)
+    season = np.tile(np.repeat(np.arange(2024 - seasons + 1, 2025), 17), players)
+    week = np.tile(np.arange(1, 18), players * seasons)
+    df = pd.DataFrame({
+        'player_display_name': [f"Player {i}" for i in player],
+        'position': positions[player % len(positions)],
+        'season': season,
+        'week': week,
+        'season_type': 'REG',
+        'fantasy_points_ppr': rng.gamma(2.0, 6.0, len(player)).astype(np.float64),
+    })
+    for column in range(extra_columns):
+        df[f"stat_{column}"] = rng.random(len(df))
+    return df
+# ---------------------- Synthetic Weekly Data ----------------------
+
+
+# ---------------------- Workers ----------------------
+def memory_usage():
+    """ (RSS MiB, USS MiB) of this process; USS is None where /proc/self/smaps_rollup doesn't exist. """
+    try:
+        with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+            fields = {line.split(":")[0]: int(line.split()[1]) for line in f if line.split()[1:2] and
+                      line.split()[1].isdigit()}
+        return fields['Rss'] / 1024, (fields['Private_Clean'] + fields['Private_Dirty']) / 1024
+    except OSError:
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, None
+
+def report(queue, values):
+    """ Reads every cell once (a per-player mean) and sends (ready time, read seconds, memory) to the parent. """
+    ready = time.time()
+    start = time.perf_counter()
+    np.nanmean(values, axis=1)
+    queue.put((ready, time.perf_counter() - start, memory_usage()))
+
+def init_from_frame(queue, weekly_data):
+    report(queue, weekly_matrix.build_weekly_matrix(weekly_data)['values'])
+
+def init_from_spec(queue, spec):
+    report(queue, weekly_matrix.attach(spec))
+
+# ---------------------- Workers ----------------------
+
+
+# ---------------------- Benchmark ----------------------
+def run_pool(workers, context, initializer, initargs):
+    """ Starts a pool whose initializer loads the data; returns (start-up s, read ms, RSS MiB, USS MiB or None). """
+    queue = context.Queue()
+    start = time.time()
+    # multiprocessing.Pool starts every worker up front (ProcessPoolExecutor may start them on demand)
+    with context.Pool(workers, initializer=initializer, initargs=(queue, *initargs)):
+        reports = [queue.get(timeout=600) for _ in range(workers)]
+    startup = max(ready for ready, _, _ in reports) - start
+    read_ms = np.mean([elapsed for _, elapsed, _ in reports]) * 1000
+    rss = np.mean([memory[0] for _, _, memory in reports])
+    uss = [memory[1] for _, _, memory in reports]
+    return startup, read_ms, rss, (np.mean(uss) if None not in uss else None)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--players', type=int, default=2000)
+    parser.add_argument('--seasons', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--start-method', default="spawn", choices=multiprocessing.get_all_start_methods())
+    args = parser.parse_args()
+
+    weekly_data = synthetic_weekly_data(args.players, args.seasons)
+    start = time.perf_counter()
+    matrix = weekly_matrix.build_weekly_matrix(weekly_data)
+    build_ms = (time.perf_counter() - start) * 1000
+    values = matrix['values']
+    print(f"Weekly frame: {len(weekly_data):,} rows x {weekly_data.shape[1]} columns, "
+          f"{weekly_data.memory_usage(deep=True).sum() / 2**20:.1f} MiB")
+    print(f"Matrix: {values.shape[0]:,} players x {values.shape[1]} weeks float32, {values.nbytes / 2**20:.1f} MiB "
+          f"(built in {build_ms:.0f} ms)")
+    print(f"{args.workers} workers, start method '{args.start_method}'\n")
+
+    context = multiprocessing.get_context(args.start_method)
+    print(f"{'':<15} {'start-up s':>10} {'read ms':>8} {'RSS MiB':>8} {'USS MiB':>8}  (per worker)")
+    rows = [('pickled frame', init_from_frame, (weekly_data,), None)]
+    rows += [(label, init_from_spec, None, backend) for label, backend in
+             [('shared memory', "shared_memory"), ('npy mmap', "npy")]]
+    for label, initializer, initargs, backend in rows:
+        if backend is None:
+            result = run_pool(args.workers, context, initializer, initargs)
+        else:
+            with weekly_matrix.publish(values, backend=backend) as spec:
+                result = run_pool(args.workers, context, initializer, (spec,))
+        startup, read_ms, rss, uss = result
+        print(f"{label:<15} {startup:>10.2f} {read_ms:>8.1f} {rss:>8.1f} {f'{uss:.1f}' if uss is not None else '-':>8}")
+
+if __name__ == '__main__':
+    main()
+# ---------------------- Benchmark ----------------------
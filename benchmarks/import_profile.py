@@ -0,0 +1,145 @@
+"""
+Import-time profile of the app modules (python -X importtime), so slow or heavy imports creeping back are visible.
+
+For every module it reports the cumulative import time (best of --repeat fresh interpreters), how many modules
+it pulls in and whether any of the deferred libraries was imported. Those are only imported at first use:
+
+    nfl_data_py          spike_week_score.load_weekly_data()
+    bs4                  the HTML parsers (scraper, injury_reports, player_transactions, schedules)
+    plotly, seaborn,     the chart sections of pages/Positional_Scarcity.py / pages/Season_Projections.py
+    matplotlib
+    psutil               Home.py's shutdown button
+
+Usage:
+    python benchmarks/import_profile.py                    # profile every app module
+    python benchmarks/import_profile.py datasets --top 15  # heaviest imports of one module
+    python benchmarks/import_profile.py --check            # exit 1 if an app module imports a deferred library
+    python benchmarks/import_profile.py --json profile.json
+"""
+# ---------------------- Libraries ----------------------
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Settings ----------------------
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules imported by Home.py and the pages (the page scripts themselves run Streamlit code, so they aren't imported)
+APP_MODULES = [
+    'app_logging', 'instrumentation', 'snapshots', 'http_client', 'player_identity', 'datasets', 'warmup',
+    'scraper', 'load_data', 'positional_scarcity', 'spike_week_score', 'age_curve',
+    'rookie_rankings', 'injury_reports', 'schedules', 'player_transactions',
+]
+
+# Heavy libraries that must only be imported at first use
+DEFERRED_LIBRARIES = ['nfl_data_py', 'bs4', 'plotly', 'seaborn', 'matplotlib', 'psutil']
+
+# "import time:  self [us] | cumulative | imported package" (nesting shown by indentation)
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+# ---------------------- Settings ----------------------
+
+
+# ---------------------- Profile ----------------------
+def profile_import(module):
+    """
+    Imports `module` in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict: {'ok': bool, 'error': str or None, 'cumulative_ms': float,
+               'imports': [(name, depth, self_ms, cumulative_ms), ...] in import-finished order,
+               'loaded': set of the modules in sys.modules afterwards}.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import sys, {module}; print(' '.join(sys.modules))"],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            imports.append((name, (len(indent) - 1) // 2, int(self_us) / 1000, int(cumulative_us) / 1000))
+
+    error = None
+    if result.returncode != 0:
+        error = (result.stderr.strip().splitlines() or ["import failed"])[-1]
+    own = [entry for entry in imports if entry[0] == module]
+    return {
+        'ok': result.returncode == 0,
+        'error': error,
+        'cumulative_ms': own[-1][3] if own else sum(entry[2] for entry in imports),
+        'imports': imports,
+        # -X importtime also lists failed attempts (e.g. streamlit trying plotly), so check what actually loaded
+        'loaded': set(result.stdout.split()),
+    }
+
+def best_profile(module, repeat):
+    """ Fastest of `repeat` runs (import time is noisy; the minimum is the most repeatable). """
+    runs = [profile_import(module) for _ in range(repeat)]
+    return min(runs, key=lambda run: run['cumulative_ms'])
+
+def deferred_imported(profile):
+    packages = {name.split(".")[0] for name in profile['loaded']}
+    return [library for library in DEFERRED_LIBRARIES if library in packages]
+# ---------------------- Profile ----------------------
+
+
+# ---------------------- Report ----------------------
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('modules', nargs='*', default=APP_MODULES, help="Modules to profile (default: app modules)")
+    parser.add_argument('--repeat', type=int, default=3, help="Fresh interpreters per module (best is reported)")
+    parser.add_argument('--top', type=int, default=0, help="Also list the N slowest imports of each module")
+    parser.add_argument('--check', action='store_true', help="Exit 1 if a module imports a deferred library")
+    parser.add_argument('--json', metavar='PATH', help="Write the profile as JSON (for comparing versions)")
+    args = parser.parse_args()
+
+    report = {'python': sys.version.split()[0], 'modules': {}, 'libraries': {}}
+    violations = []
+
+    print(f"{'module':<22} {'import ms':>10} {'modules':>8}  deferred libraries imported")
+    for module in args.modules:
+        profile = best_profile(module, args.repeat)
+        deferred = deferred_imported(profile)
+        if deferred:
+            violations.append((module, deferred))
+        if not profile['ok']:
+            print(f"{module:<22} {'-':>10} {'-':>8}  ({profile['error']})")
+        else:
+            print(f"{module:<22} {profile['cumulative_ms']:>10.1f} {len(profile['imports']):>8}  "
+                  f"{', '.join(deferred) or '-'}")
+        for name, depth, self_ms, cumulative_ms in sorted(profile['imports'], key=lambda entry: -entry[3])[:args.top]:
+            print(f"    {cumulative_ms:>9.1f} ms  {name}")
+        report['modules'][module] = {
+            'ok': profile['ok'], 'error': profile['error'], 'cumulative_ms': round(profile['cumulative_ms'], 1),
+            'modules_imported': len(profile['imports']), 'deferred_imported': deferred,
+        }
+
+    # What deferring saves: the cost of each library on its own
+    print(f"\n{'deferred library':<22} {'import ms':>10}")
+    for library in DEFERRED_LIBRARIES:
+        profile = best_profile(library, args.repeat)
+        cost = round(profile['cumulative_ms'], 1) if profile['ok'] else None
+        report['libraries'][library] = cost
+        print(f"{library:<22} {cost if cost is not None else 'not installed':>10}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nWrote {args.json}")
+
+    if violations:
+        print("\n⚠️ Deferred libraries imported at module level:")
+        for module, deferred in violations:
+            print(f"   {module}: {', '.join(deferred)}")
+        if args.check:
+            raise SystemExit(1)
+
+if __name__ == '__main__':
+    main()
+# ---------------------- Report ----------------------
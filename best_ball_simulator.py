@@ -0,0 +1,197 @@
+"""
+Best Ball season simulator: every team's best possible lineup scores each week, so a roster is worth the sum of its
+weekly optimal lineups.
+
+    weekly_points = datasets.load('weekly_points')                       # historical weekly PPR per player
+    teams, totals = simulate_seasons(draft.rosters, positions, weekly_points, seasons=10_000)
+    season_summary(teams, totals)                                        # mean / percentiles / win % per team
+
+A player's week is bootstrapped from his historical weekly PPR scores (the weekly_matrix built from the nfl_data_py
+weekly data of the Spike Week Score), padded with zeros up to a full schedule per season so missed games are drawn
+as zero weeks. Players without history (rookies, ...) draw from the pooled weekly scores of their position.
+
+Everything is vectorized over (season, week, team): a position's players are gathered into a padded
+(seasons, weeks, teams, players) block and np.partition picks its top starters plus the best FLEX / SUPERFLEX
+candidates, so no lineup is ever sorted or built in Python.
+"""
+# ---------------------- Libraries ----------------------
+import numpy as np
+import pandas as pd
+from instrumentation import timed
+from team_rosters import STARTING_SLOTS, FLEX_SLOTS
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Settings ----------------------
+# Fantasy weeks of a Best Ball season, and the games each NFL team plays per regular season
+SEASON_WEEKS = 17
+GAMES_PER_SEASON = 17
+
+# Seasons simulated per batch (bounds the (seasons x weeks x players) sample block to ~100 MB of float32)
+BATCH_SIZE = 500
+# ---------------------- Settings ----------------------
+
+
+# ---------------------- Weekly Points ----------------------
+def build_weekly_points(matrix):
+    """
+    Historical weekly PPR scores from the player x week matrix (see weekly_matrix.build_weekly_matrix).
+
+    Returns:
+        dict: {'players': {player_id: float32 array of weekly scores, zero-padded to GAMES_PER_SEASON per season},
+               'positions': {pos: float32 array of every weekly score at that position}}
+    """
+    values = matrix['values']
+    played = ~np.isnan(values)
+    seasons = np.array([season for season, _ in matrix['weeks']])
+    season_columns = [seasons == season for season in np.unique(seasons)]
+    # Seasons in which each player has at least one game
+    active_seasons = sum(played[:, columns].any(axis=1) for columns in season_columns) if season_columns else 0
+
+    players = {}
+    for row, key in enumerate(matrix['player_ids']):
+        games = values[row, played[row]]
+        points = np.zeros(max(len(games), int(active_seasons[row]) * GAMES_PER_SEASON), dtype=np.float32)
+        points[:len(games)] = games
+        players[key] = points
+    row_positions = np.array(matrix['positions'], dtype=object)
+    positions = {
+        pos: values[(row_positions == pos)[:, None] & played]
+        for pos in STARTING_SLOTS if pos in matrix['positions']
+    }
+    return {'players': players, 'positions': positions}
+# ---------------------- Weekly Points ----------------------
+
+
+# ---------------------- Simulation ----------------------
+def _position_columns(team_players, pos, columns, empty_column, width):
+    """ (teams, width) column indices of each team's `pos` players, padded with the always-zero column. """
+    index = np.full((len(team_players), width), empty_column, dtype=np.intp)
+    for t, players in enumerate(team_players):
+        team_columns = [columns[key] for key, player_pos in players if player_pos == pos]
+        index[t, :len(team_columns)] = team_columns
+    return index
+
+def _flex_candidates(pos, slots):
+    """ How many of a position's non-starters can still start in a flex slot of `slots`. """
+    return sum(slots[slot] for slot, positions in FLEX_SLOTS.items() if pos in positions and slots.get(slot, 0))
+
+def _best_lineups(samples, lineup_columns, slots=STARTING_SLOTS):
+    """
+    Weekly optimal lineup score of every team: the top QB / RB / WR / TE starters, then each flex slot (FLEX before
+    SUPERFLEX) takes the best remaining player it allows.
+
+    Args:
+        samples (np.ndarray): (seasons, weeks, players + 1) weekly scores (the last column is the empty slot).
+        lineup_columns (dict): {pos: (teams, width) column indices} - see _position_columns().
+        slots (dict): Starting lineup slot counts.
+
+    Returns:
+        np.ndarray: (seasons, weeks, teams) lineup scores.
+    """
+    score = 0
+    extras = {}
+    for pos, index in lineup_columns.items():
+        starters = slots.get(pos, 0)
+        candidates = _flex_candidates(pos, slots)
+        # Largest `starters` values first, then the flex candidates in descending order
+        kth = list(range(max(starters - 1, 0), starters + candidates))
+        block = -samples[..., index]
+        block = np.partition(block, kth, axis=-1) if kth else block
+        score = score - block[..., :starters].sum(axis=-1)
+        if candidates:
+            extras[pos] = -block[..., starters:starters + candidates]
+
+    # Flex slots are filled greedily from the most restrictive one: each takes the best next candidate it allows
+    taken = {pos: np.zeros(score.shape, dtype=np.intp) for pos in extras}
+    for slot, allowed in FLEX_SLOTS.items():
+        eligible = [pos for pos in allowed if pos in extras]
+        for _ in range(slots.get(slot, 0) if eligible else 0):
+            heads = np.stack([
+                np.take_along_axis(extras[pos], np.minimum(taken[pos], extras[pos].shape[-1] - 1)[..., None],
+                                   axis=-1)[..., 0]
+                for pos in eligible
+            ])
+            best = heads.argmax(axis=0)
+            score = score + heads.max(axis=0)
+            for i, pos in enumerate(eligible):
+                taken[pos] += best == i
+    return score
+
+@timed()
+def simulate_seasons(rosters, positions, weekly_points, seasons=10_000, weeks=SEASON_WEEKS, seed=None,
+                     slots=STARTING_SLOTS):
+    """
+    Season totals of every team's Best Ball roster over `seasons` simulated seasons.
+
+    Args:
+        rosters (dict): {team name: [player ids]} - e.g. DraftState.rosters.
+        positions (dict): {player_id: pos} of the drafted players (other positions than QB / RB / WR / TE and
+                          unknown players are left out).
+        weekly_points (dict): The 'weekly_points' dataset (see build_weekly_points()).
+        seed (int): Seed for reproducible runs.
+        slots (dict): Starting lineup slot counts (e.g. LeagueConfig.slots).
+
+    Returns:
+        tuple: ([team names], float32 array of season totals with shape (seasons, teams)).
+    """
+    rng = np.random.default_rng(seed)
+    teams = list(rosters)
+    team_players = [
+        [(key, positions[key]) for key in rosters[team] if positions.get(key) in STARTING_SLOTS] for team in teams
+    ]
+
+    # One column per rostered player, holding his (zero-padded) history; the extra last column is an empty slot
+    drafted = [key for players in team_players for key, _ in players]
+    columns = {key: column for column, key in enumerate(dict.fromkeys(drafted))}
+    histories = []
+    for key in columns:
+        history = weekly_points['players'].get(key)
+        if history is None:
+            history = weekly_points['positions'].get(positions[key], np.zeros(1, dtype=np.float32))
+        histories.append(history)
+    lengths = np.array([len(history) for history in histories] + [1], dtype=np.intp)
+    table = np.zeros((len(histories) + 1, lengths.max()), dtype=np.float32)
+    for column, history in enumerate(histories):
+        table[column, :len(history)] = history
+    player_columns = np.arange(len(table))
+
+    # Each position block needs room for its starters plus its flex candidates
+    lineup_columns = {}
+    for pos in STARTING_SLOTS:
+        if pos in FLEX_SLOTS or not (slots.get(pos, 0) or _flex_candidates(pos, slots)):
+            continue
+        most = max([sum(player_pos == pos for _, player_pos in players) for players in team_players] + [0])
+        lineup_columns[pos] = _position_columns(team_players, pos, columns, len(histories),
+                                                max(most, slots.get(pos, 0) + _flex_candidates(pos, slots), 1))
+
+    totals = np.empty((seasons, len(teams)), dtype=np.float32)
+    for start in range(0, seasons, BATCH_SIZE):
+        size = min(BATCH_SIZE, seasons - start)
+        # Bootstrap: a uniformly drawn week of each player's history for every (season, week)
+        draws = (rng.random((size, weeks, len(table)), dtype=np.float32) * lengths).astype(np.intp)
+        np.minimum(draws, lengths - 1, out=draws)
+        samples = table[player_columns, draws]
+        totals[start:start + size] = _best_lineups(samples, lineup_columns, slots).sum(axis=1)
+    return teams, totals
+
+def season_summary(teams, totals):
+    """
+    Season total distribution of each team: mean, spread, percentiles and how often it finished first.
+
+    Returns:
+        pd.DataFrame: One row per team, best mean first.
+    """
+    winners = np.bincount(totals.argmax(axis=1), minlength=len(teams))
+    p10, p50, p90 = np.percentile(totals, [10, 50, 90], axis=0)
+    summary = pd.DataFrame({
+        'team': teams,
+        'mean': totals.mean(axis=0),
+        'std': totals.std(axis=0),
+        'p10': p10,
+        'median': p50,
+        'p90': p90,
+        'win_pct': winners / len(totals) * 100,
+    })
+    return summary.sort_values('mean', ascending=False).reset_index(drop=True)
+# ---------------------- Simulation ----------------------
@@ -0,0 +1,338 @@
+"""
+Lazy dataset registry.
+
+Every table the app shows is registered here with the datasets it is derived from and the function that builds it:
+
+    @register('age_curve', inputs=['stats_2024'])
+    def build_age_curve(stats_2024): ...
+
+load('age_curve') builds 'stats_2024' first (only if needed), then the age curve, and keeps both for the rest of the
+process. A page therefore computes only its own part of the graph - opening the Age Curve page never scrapes
+injury news - and every session shares the same built tables.
+
+Every built table is fingerprinted by content hash, and a derived table remembers the fingerprints of the inputs it
+was built from. Source tables with a `ttl` are re-read once they are older than that; a derived table is only
+rebuilt when an input's fingerprint actually changed, and a rebuild that produces identical content stops there.
+So an unchanged scrape costs one hash, and an ADP refresh only recomputes the tables that depend on ADP.
+When a background refresher is running (see warmup.py) stale tables are served as they are while it rebuilds them.
+"""
+# ---------------------- Libraries ----------------------
+import hashlib
+import threading
+import time
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from http_client import TTL_15_MINUTES, TTL_HOURLY, TTL_DAILY
+from instrumentation import stage, cache_miss
+from app_logging import get_logger, fields
+# ---------------------- Libraries ----------------------
+
+logger = get_logger(__name__)
+
+
+# ---------------------- Registry ----------------------
+# name -> {'inputs': (names...), 'builder': callable, 'ttl': seconds or None}
+DATASETS = {}
+
+# name -> {'value', 'fingerprint', 'inputs': {input name: fingerprint}, 'built_at', 'changed_at'}
+_built = {}
+
+_locks = {}
+_locks_lock = threading.Lock()
+
+# True while a background refresher keeps the tables up to date: load() then never rebuilds a table it already has
+SERVE_STALE = False
+
+def register(name, inputs=(), ttl=None):
+    """ Decorator registering `builder(*input_values)` as the way to build dataset `name`. """
+    def decorator(builder):
+        DATASETS[name] = {'inputs': tuple(inputs), 'builder': builder, 'ttl': ttl}
+        return builder
+    return decorator
+
+def _lock_for(name):
+    with _locks_lock:
+        return _locks.setdefault(name, threading.Lock())
+# ---------------------- Registry ----------------------
+
+
+# ---------------------- Fingerprints ----------------------
+def fingerprint(value):
+    """ Content hash of a dataset: equal tables (or lists / dicts of records) always get the same fingerprint. """
+    digest = hashlib.sha1()
+    _hash_into(digest, value)
+    return digest.hexdigest()[:16]
+
+def _hash_into(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((list(value.columns), [str(dtype) for dtype in value.dtypes])).encode("utf-8"))
+        try:
+            digest.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+        except TypeError:
+            # Unhashable cells (e.g. lists) - fall back to the printed values
+            digest.update(repr(value.values.tolist()).encode("utf-8"))
+    elif isinstance(value, np.ndarray):
+        # repr() elides the middle of large arrays
+        digest.update(repr((value.dtype.str, value.shape)).encode("utf-8"))
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, dict):
+        for key in sorted(value, key=str):
+            digest.update(repr(key).encode("utf-8"))
+            _hash_into(digest, value[key])
+    else:
+        digest.update(repr(value).encode("utf-8"))
+
+def _input_fingerprints(name):
+    return {dep: _built[dep]['fingerprint'] for dep in DATASETS[name]['inputs'] if dep in _built}
+
+def _is_stale(name, entry):
+    spec = DATASETS[name]
+    if spec['ttl'] is not None and time.time() - entry['built_at'] >= spec['ttl']:
+        return True
+    # An input whose content changed since this table was built
+    return entry['inputs'] != _input_fingerprints(name)
+# ---------------------- Fingerprints ----------------------
+
+
+# ---------------------- Load / Refresh ----------------------
+def load(name):
+    """
+    Returns dataset `name`, building it (and whatever it depends on) on first access.
+
+    Built datasets are shared process-wide: treat the returned objects as read-only.
+    """
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset '{name}' (registered: {', '.join(sorted(DATASETS))})")
+
+    # Recorded as a cache hit unless the table (not just one of its inputs) had to be built
+    with stage(f"dataset:{name}", cached=True):
+        # Stale-but-instant: the background refresher swaps in the new table when it is ready
+        entry = _built.get(name)
+        if entry is not None and SERVE_STALE:
+            return entry['value']
+        return _build(name, load)
+
+def refresh(name):
+    """ Rebuilds `name` (and its inputs) if missing or stale, even while stale tables are being served. """
+    with stage(f"dataset:{name}", cached=True):
+        return _build(name, refresh)
+
+def _build(name, load_input):
+    input_values = [load_input(dep) for dep in DATASETS[name]['inputs']]
+
+    with _lock_for(name):
+        entry = _built.get(name)
+        if entry is not None and not _is_stale(name, entry):
+            return entry['value']
+
+        cache_miss()
+        start = time.perf_counter()
+        value = DATASETS[name]['builder'](*input_values)
+        new_fingerprint = fingerprint(value)
+        now = time.time()
+
+        if entry is not None and entry['fingerprint'] == new_fingerprint:
+            # Same content as before: keep the existing table so nothing downstream is rebuilt
+            entry.update(inputs=_input_fingerprints(name), built_at=now)
+            logger.info("🧠 Dataset '%s' unchanged, checked in %.2fs", name, time.perf_counter() - start,
+                        extra=fields(fingerprint=new_fingerprint))
+            return entry['value']
+
+        _built[name] = {
+            'value': value, 'fingerprint': new_fingerprint, 'inputs': _input_fingerprints(name),
+            'built_at': now, 'changed_at': now,
+        }
+        logger.info("🧠 Dataset '%s' built in %.2fs", name, time.perf_counter() - start,
+                    extra=fields(fingerprint=new_fingerprint))
+        return value
+
+def is_built(name):
+    return name in _built
+
+def status(name):
+    """
+    {'built': bool, 'built_at': epoch seconds or None, 'changed_at': epoch seconds or None, 'stale': bool,
+     'fingerprint': str or None} for one dataset ('built_at' = last built or verified unchanged).
+    """
+    entry = _built.get(name)
+    if entry is None:
+        return {'built': False, 'built_at': None, 'changed_at': None, 'stale': True, 'fingerprint': None}
+    return {'built': True, 'built_at': entry['built_at'], 'changed_at': entry['changed_at'],
+            'stale': _is_stale(name, entry), 'fingerprint': entry['fingerprint']}
+
+def invalidate(name):
+    """ Drops a built dataset and everything derived from it, so the next load() rebuilds them. """
+    with _lock_for(name):
+        _built.pop(name, None)
+    for other, spec in DATASETS.items():
+        if name in spec['inputs']:
+            invalidate(other)
+# ---------------------- Load / Refresh ----------------------
+
+
+# ---------------------- Dataset Definitions ----------------------
+# Modules are imported inside the builders so a page only imports what its own datasets need
+# (e.g. nfl_data_py is loaded the first time 'boom_bust' is built).
+
+# Identity columns of a season, enough for the player index
+IDENTITY_COLUMNS = ['player', 'player_id', 'team', 'pos']
+
+# Columns telling apart ADP players who share a name (see player_identity.assign_player_ids)
+ADP_TIEBREAK = ('pos', 'team')
+
+@register('stats_2024')
+def build_stats_2024():
+    from load_data import load_historical_stats
+    return load_historical_stats(2024)
+
+@register('stats_2023')
+def build_stats_2023():
+    from load_data import load_historical_stats
+    return load_historical_stats(2023, columns=IDENTITY_COLUMNS)
+
+@register('stats_2022')
+def build_stats_2022():
+    from load_data import load_historical_stats
+    return load_historical_stats(2022, columns=IDENTITY_COLUMNS)
+
+@register('top_320_players', inputs=['stats_2024'])
+def build_top_320_players(stats_2024):
+    """ Top 320 QB / RB / WR / TE of 2024 by overall rank (the "relevant" players of the news pages). """
+    filtered_df = stats_2024[stats_2024['pos'].isin(['QB', 'RB', 'WR', 'TE'])]
+    return filtered_df.sort_values('ovr_rank').reset_index(drop=True).head(320)
+
+@register('fantasypros', ttl=TTL_HOURLY)
+def build_fantasypros():
+    from load_data import get_fantasypros_data
+    return get_fantasypros_data()
+
+@register('adp', inputs=['fantasypros'])
+def build_adp(fantasypros):
+    """ [{'rank': rank, 'name': name, 'pos': pos, 'adp': adp, ...}, ...] """
+    return fantasypros['adp']
+
+@register('adp_records', inputs=['adp'])
+def build_adp_records(adp):
+    """
+    {player_id: ADP record} - the draft board's player lookups (built once per ADP load). Players sharing a name get
+    separate ids (player_identity.assign_player_ids, told apart by position and team).
+    """
+    from player_identity import add_player_ids
+    keys = add_player_ids(pd.DataFrame(adp, columns=['name', 'pos', 'team']), 'name', tiebreak=ADP_TIEBREAK)
+    return dict(zip(keys['player_id'], adp))
+
+@register('adp_by_position', inputs=['adp'])
+def build_adp_by_position(adp):
+    return {pos: [player for player in adp if player.get('pos') == pos] for pos in ['QB', 'RB', 'WR', 'TE']}
+
+@register('projections_by_position', inputs=['fantasypros'])
+def build_projections_by_position(fantasypros):
+    """ {'QB': [{'name': name, 'team': team, ..., 'proj_points': proj_points}, ...], 'RB': [...], ...} """
+    return {pos: fantasypros[pos] for pos in ['QB', 'RB', 'WR', 'TE']}
+
+@register('season_projections', inputs=['projections_by_position'])
+def build_season_projections(projections_by_position):
+    """ All four positions' projections in one frame with 'pos' and 'player_id' columns. """
+    from player_identity import add_player_ids
+    frames = []
+    for pos, projections in projections_by_position.items():
+        df = pd.DataFrame(projections)
+        df['pos'] = pos
+        frames.append(df)
+    return add_player_ids(pd.concat(frames, ignore_index=True), 'name', tiebreak=('pos', 'team'))
+
+@register('value_vs_adp', inputs=['adp_by_position', 'projections_by_position'])
+def build_value_vs_adp(adp_by_position, projections_by_position):
+    from value_vs_adp import calculate_value_vs_adp
+    return {
+        pos: calculate_value_vs_adp(pos, adp_by_position[pos], projections_by_position[pos], False)
+        for pos in ['QB', 'RB', 'WR', 'TE']
+    }
+
+@register('positional_scarcity', inputs=['season_projections'])
+def build_positional_scarcity(season_projections):
+    from positional_scarcity import (
+        load_player_data, calculate_value_over_replacement, calculate_positional_tiers, get_scarcity_score
+    )
+    df = load_player_data(season_projections)
+    df = calculate_value_over_replacement(df)
+    df = calculate_positional_tiers(df)
+    return get_scarcity_score(df)
+
+@register('boom_bust')
+def build_boom_bust():
+    import spike_week_score
+    from player_identity import add_player_ids
+    df = spike_week_score.organize_by_condition(spike_week_score.SPIKE_WEEK_SEASONS)
+    return add_player_ids(df, 'player_display_name')
+
+@register('weekly_matrix')
+def build_weekly_matrix():
+    """ Player x week float32 matrix of weekly PPR scores (see weekly_matrix.py). """
+    import spike_week_score
+    from weekly_matrix import build_weekly_matrix
+    return build_weekly_matrix(spike_week_score.load_weekly_data(spike_week_score.SPIKE_WEEK_SEASONS))
+
+@register('weekly_points', inputs=['weekly_matrix'])
+def build_weekly_points(weekly_matrix):
+    """ Historical weekly PPR scores per player and per position (the Best Ball simulator's bootstrap source). """
+    from best_ball_simulator import build_weekly_points
+    return build_weekly_points(weekly_matrix)
+
+@register('rookie_rankings')
+def build_rookie_rankings():
+    import rookie_rankings
+    from player_identity import add_player_ids
+    df = rookie_rankings.get_rookie_rankings("data_files/all_rookie_rankings_2025.csv")
+    return add_player_ids(df, 'PLAYER NAME', tiebreak=('POS', 'TEAM'))
+
+@register('injury_reports', inputs=['stats_2024', 'rookie_rankings'], ttl=TTL_15_MINUTES)
+def build_injury_reports(stats_2024, rookie_rankings):
+    """ Injury news with the player of each headline resolved against the 2024 players and the rookies. """
+    import injury_reports
+    from player_identity import normalize_name
+    names = pd.concat([stats_2024['player'], rookie_rankings['PLAYER NAME']]).dropna().unique()
+    return injury_reports.get_injury_news(known_names=tuple(sorted({normalize_name(name) for name in names})))
+
+@register('schedules', ttl=TTL_DAILY)
+def build_schedules():
+    from schedules import get_schedules, SCHEDULE_URL, SCHEDULE_YEAR
+    return get_schedules(SCHEDULE_YEAR, SCHEDULE_URL.format(year=SCHEDULE_YEAR))
+
+@register('age_curve', inputs=['stats_2024'])
+def build_age_curve(stats_2024):
+    """ Age curve of the 2024 players, with ages moved forward to the current season. """
+    from age_curve import apply_age_curve, update_player
+    stats = update_player(stats_2024[['player', 'team', 'pos', 'age']].copy(), datetime.now().year, 2024)
+    return apply_age_curve(stats)
+
+@register('player_scores', inputs=['adp_records', 'positional_scarcity', 'value_vs_adp', 'age_curve', 'boom_bust'])
+def build_player_scores(adp_records, positional_scarcity, value_vs_adp, age_curve, boom_bust):
+    """ {player_id: base recommendation score} of every ADP player (see recommendations.py). """
+    from recommendations import build_player_scores
+    return build_player_scores(adp_records, positional_scarcity, value_vs_adp, age_curve, boom_bust)
+
+@register('draft_player_index', inputs=['stats_2024', 'boom_bust'])
+def build_draft_player_index(stats_2024, boom_bust):
+    """ The part of the player index the draft board's player overview needs. """
+    import player_identity
+    return player_identity.build_player_index({'stats_2024': stats_2024, 'weekly': boom_bust})
+
+@register('player_index', inputs=['adp', 'season_projections', 'stats_2024', 'stats_2023', 'stats_2022',
+                                  'boom_bust', 'rookie_rankings', 'injury_reports'])
+def build_player_index(adp, season_projections, stats_2024, stats_2023, stats_2022, boom_bust, rookie_rankings,
+                       injury_reports):
+    """ {player_id: {source: [row positions]}} over every player-level dataset (see player_identity). """
+    import player_identity
+    return player_identity.build_player_index({
+        'adp': player_identity.add_player_ids(pd.DataFrame(adp), 'name', tiebreak=ADP_TIEBREAK),
+        'projections': season_projections,
+        'stats_2024': stats_2024,
+        'stats_2023': stats_2023,
+        'stats_2022': stats_2022,
+        'weekly': boom_bust,
+        'rookies': rookie_rankings,
+        'injuries': injury_reports,
+    })
+# ---------------------- Dataset Definitions ----------------------
@@ -0,0 +1,158 @@
+"""
+Monte Carlo forecast of who will still be on the board at a team's next picks.
+
+    forecast = availability(draft, available_players)          # team on the clock, its next 2 picks
+    forecast.loc[forecast['name'] == "Ja'Marr Chase", pick_columns(forecast)]   # chance he is there at each pick
+
+Every simulated draft orders the available players by a Plackett-Luce draw around their ADP: players are drawn one
+by one with probability proportional to adp ** -SHARPNESS, so picks 1 and 5 rarely swap while picks 101 and 105
+often do. The draw is vectorized as an exponential race - each player is "picked" at time Exp(1) * adp ** SHARPNESS
+and the draft order is the order of those times (the same ordering as Gumbel noise added to -SHARPNESS * log(adp),
+without the logs). A player survives to a pick if none of the other teams' picks before it took him, which only
+needs the first k of each draw (np.argpartition), never a full sort.
+
+10k drafts of a 300-player pool take about 0.1 s in one process; `workers` spreads deeper runs over a process pool.
+"""
+# ---------------------- Libraries ----------------------
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import pandas as pd
+from instrumentation import timed
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Settings ----------------------
+# How closely drafters follow ADP: higher is closer (the Plackett-Luce weight of a player is adp ** -SHARPNESS)
+SHARPNESS = 8.0
+
+# Simulated drafts per batch (bounds the (batch x players) noise matrix to a few MB)
+BATCH_SIZE = 2_000
+
+# Prefix of the forecast's per-pick columns ("Pick 27")
+PICK_COLUMN_PREFIX = "Pick "
+# ---------------------- Settings ----------------------
+
+
+# ---------------------- Pick Schedule ----------------------
+def upcoming_picks(draft, team=None, count=2):
+    """
+    Overall pick numbers (0-based) of `team`'s next `count` picks after the one on the clock (fewer near the end of
+    the draft), looked up in the league's pick schedule.
+
+    Args:
+        draft (DraftState): The draft in progress.
+        team (int): Team number (default: the team on the clock).
+    """
+    team = draft.team_on_clock() if team is None else team
+    if team is None:
+        return []
+    return draft.league.next_picks(team, draft.cursor, count)
+
+def picks_by_others(draft, team, pick_number):
+    """ Picks other teams make from the one on the clock up to (not including) `pick_number`. """
+    return int(np.count_nonzero(draft.league.pick_teams[draft.cursor:pick_number] != team))
+# ---------------------- Pick Schedule ----------------------
+
+
+# ---------------------- Simulation ----------------------
+def _count_taken(adp, pick_counts, simulations, seed, sharpness=SHARPNESS):
+    """
+    Runs `simulations` drafts and counts, per entry of `pick_counts`, how often each player was among the first k
+    picks. Returns an int64 array of shape (len(pick_counts), players).
+    """
+    rng = np.random.default_rng(seed)
+    players = len(adp)
+    # Relative pick "slowness" adp ** sharpness, scaled by the best ADP so it stays within float32
+    slowness = (np.maximum(adp, 0.5) / np.maximum(adp.min(), 0.5)) ** sharpness
+    slowness = np.minimum(slowness, np.finfo(np.float32).max / 64).astype(np.float32)
+    taken = np.zeros((len(pick_counts), players), dtype=np.int64)
+
+    # Only counts strictly between 0 and the pool size need a draw (0 picks take nobody, >= players take everyone)
+    partial = sorted({k for k in pick_counts if 0 < k < players})
+    for i, k in enumerate(pick_counts):
+        if k >= players:
+            taken[i] = simulations
+    if not partial:
+        return taken
+
+    deepest = partial[-1]
+    for start in range(0, simulations, BATCH_SIZE):
+        size = min(BATCH_SIZE, simulations - start)
+        # Pick times of each simulated draft; partitioning at every k - 1 makes the first k columns the first k
+        # picks for each count at once
+        times = rng.standard_exponential(size=(size, players), dtype=np.float32)
+        times *= slowness
+        top = np.argpartition(times, [k - 1 for k in partial], axis=1)[:, :deepest]
+        for i, k in enumerate(pick_counts):
+            if k in partial:
+                taken[i] += np.bincount(top[:, :k].ravel(), minlength=players)
+    return taken
+
+@timed()
+def survival_probabilities(adp, pick_counts, simulations=10_000, workers=1, seed=None, sharpness=SHARPNESS):
+    """
+    Probability that each player is still available after the first k picks of a simulated draft, for every k in
+    `pick_counts`.
+
+    Args:
+        adp (array-like): ADP of the available players.
+        pick_counts (list[int]): Picks made before each pick of interest.
+        simulations (int): Simulated drafts.
+        workers (int): Processes to spread the simulations over (1 runs in this process).
+        seed (int): Seed for reproducible forecasts.
+
+    Returns:
+        np.ndarray: float array of shape (len(pick_counts), players).
+    """
+    adp = np.asarray(adp, dtype=float)
+    pick_counts = list(pick_counts)
+    if workers <= 1 or simulations < workers * BATCH_SIZE:
+        taken = _count_taken(adp, pick_counts, simulations, seed, sharpness)
+    else:
+        # Independent streams per worker (SeedSequence.spawn), so the split doesn't correlate the draws
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        shares = [simulations // workers + (i < simulations % workers) for i in range(workers)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_count_taken, adp, pick_counts, share, worker_seed, sharpness)
+                       for share, worker_seed in zip(shares, seeds)]
+            taken = sum(future.result() for future in futures)
+    return 1.0 - taken / simulations
+# ---------------------- Simulation ----------------------
+
+
+# ---------------------- Availability Forecast ----------------------
+def availability(draft, pool, team=None, count=2, simulations=10_000, workers=1, seed=None):
+    """
+    Chance that each available player is still on the board at `team`'s next `count` picks, with the other teams
+    drafting by ADP (see the module docstring). The team's own picks in between are not simulated.
+
+    Args:
+        draft (DraftState): The draft in progress.
+        pool (AvailablePlayers): The players still on the board.
+        team (int): Team number (default: the team on the clock).
+
+    Returns:
+        pd.DataFrame: player_id, name, pos, adp and one column per upcoming pick, named after its 1-based number
+        (e.g. "Pick 27", see pick_columns()), in ADP order.
+    """
+    team = draft.team_on_clock() if team is None else team
+    picks = upcoming_picks(draft, team, count)
+    players = pool.players()
+    forecast = pd.DataFrame({
+        'player_id': pool.keys(),
+        'name': [player['name'] for player in players],
+        'pos': [player['pos'] for player in players],
+        'adp': [player['adp'] for player in players],
+    })
+    survival = survival_probabilities(
+        forecast['adp'].to_numpy(), [picks_by_others(draft, team, number) for number in picks],
+        simulations=simulations, workers=workers, seed=seed,
+    )
+    for number, column in zip(picks, survival):
+        forecast[f"{PICK_COLUMN_PREFIX}{number + 1}"] = column
+    return forecast
+
+def pick_columns(forecast):
+    """ The per-pick survival columns of an availability() forecast, in pick order. """
+    return [column for column in forecast.columns if column.startswith(PICK_COLUMN_PREFIX)]
+# ---------------------- Availability Forecast ----------------------
@@ -0,0 +1,152 @@
+"""
+Draft engine behind the draft board: who is on the clock, who has been taken and every pick made so far.
+
+    draft = DraftState(LeagueConfig(num_teams=12, rounds=18))
+    draft.draft("Ja'Marr Chase")    # -> Pick(number=0, team='Team 1', player_id=..., name="Ja'Marr Chase")
+    draft.undo()                     # any number of times
+    draft.redo()                     # replays undone picks until a new pick is drafted
+
+Picks are kept in a log; `cursor` is the number of picks currently in effect, so picks past the cursor are the
+redo history. The taken players are a set of player ids, so drafting, undoing, redoing and "is this player taken?"
+are all O(1). The pick order comes from the league's precomputed schedule (league_config.LeagueConfig).
+"""
+# ---------------------- Libraries ----------------------
+from collections import namedtuple
+from league_config import LeagueConfig
+from player_identity import player_id
+# ---------------------- Libraries ----------------------
+
+
+# One entry of the pick log (number is the 0-based overall pick)
+Pick = namedtuple('Pick', ['number', 'team', 'player_id', 'name'])
+
+
+# ---------------------- Draft State ----------------------
+class DraftState:
+    """ Snake draft between the league's teams, named "Team 1" ... "Team N" (see team_at() for the order). """
+
+    __slots__ = ('league', 'rosters', 'names', 'taken', 'pick_log', 'cursor')
+
+    def __init__(self, league=None):
+        """
+        Args:
+            league (LeagueConfig): Teams, rounds, lineup slots and pick order (default: LeagueConfig()).
+        """
+        self.league = LeagueConfig() if league is None else league
+        # team name -> drafted player ids, in pick order
+        self.rosters = {self.team_name(team): [] for team in self.pick_order}
+        # player id -> name, for every player drafted so far (undone picks included)
+        self.names = {}
+        # player ids of every pick in effect
+        self.taken = set()
+        # every pick made; entries at or past `cursor` were undone and can be redone
+        self.pick_log = []
+        self.cursor = 0
+
+    # ---------------------- Pick Order ----------------------
+    @staticmethod
+    def team_name(team):
+        return f"Team {team}"
+
+    @property
+    def pick_order(self):
+        """ Team numbers in first-round order. """
+        return list(range(1, self.league.num_teams + 1))
+
+    @property
+    def num_teams(self):
+        return self.league.num_teams
+
+    @property
+    def current_round(self):
+        """ 1-based round of the pick on the clock (the last round once the draft is complete). """
+        return self.league.round_of(min(self.cursor, self.league.total_picks - 1))
+
+    def team_at(self, pick_number):
+        """
+        Team number making overall pick `pick_number` (0-based): a lookup in the league's pick schedule. In a snake
+        draft the order reverses every round; with third-round reversal round 3 repeats round 2's order.
+
+        Example with 4 teams:
+            Round 1: 1 -> 2 -> 3 -> 4
+            Round 2: 4 -> 3 -> 2 -> 1
+            Round 3: 1 -> 2 -> 3 -> 4    (3RR: 4 -> 3 -> 2 -> 1)
+        """
+        return self.league.team_at(pick_number)
+
+    def is_complete(self):
+        """ True once every team has made all of its picks. """
+        return self.cursor >= self.league.total_picks
+
+    def team_on_clock(self):
+        """ Team number making the current pick, or None once the draft is complete. """
+        return None if self.is_complete() else self.team_at(self.cursor)
+    # ---------------------- Pick Order ----------------------
+
+    # ---------------------- Picks ----------------------
+    def is_taken(self, name):
+        return player_id(name) in self.taken
+
+    def draft(self, name, key=None):
+        """
+        Drafts `name` to the team on the clock and advances the clock (dropping any redo history). `key` is the
+        player's id when it is known (players sharing a name have different ids), else player_id(name).
+
+        Raises:
+            ValueError: If the player has already been drafted or the draft is complete.
+        """
+        if self.is_complete():
+            raise ValueError(f"The draft is complete ({self.league.total_picks} picks)")
+        key = player_id(name) if key is None else key
+        if key in self.taken:
+            raise ValueError(f"{name} has already been drafted")
+        del self.pick_log[self.cursor:]
+        pick = Pick(self.cursor, self.team_name(self.team_on_clock()), key, name)
+        self.pick_log.append(pick)
+        self._apply(pick)
+        return pick
+
+    def undo(self):
+        """ Takes back the latest pick in effect (the clock moves back to that team). Returns it, or None. """
+        if not self.can_undo():
+            return None
+        self.cursor -= 1
+        pick = self.pick_log[self.cursor]
+        # Picks are undone newest first, so the pick is always the last one on its team's roster
+        self.rosters[pick.team].pop()
+        self.taken.discard(pick.player_id)
+        return pick
+
+    def redo(self):
+        """ Re-applies the most recently undone pick. Returns it, or None if there is nothing to redo. """
+        if not self.can_redo():
+            return None
+        pick = self.pick_log[self.cursor]
+        self._apply(pick)
+        return pick
+
+    def _apply(self, pick):
+        self.rosters[pick.team].append(pick.player_id)
+        self.names[pick.player_id] = pick.name
+        self.taken.add(pick.player_id)
+        self.cursor += 1
+
+    def can_undo(self):
+        return self.cursor > 0
+
+    def can_redo(self):
+        return self.cursor < len(self.pick_log)
+
+    def last_pick(self):
+        """ The latest pick in effect, or None before the first pick. """
+        return self.pick_log[self.cursor - 1] if self.cursor else None
+
+    def roster_names(self):
+        """ {team name: [player names]} in pick order (for display). """
+        return {team: [self.names[key] for key in keys] for team, keys in self.rosters.items()}
+
+    def picks(self):
+        """ Picks in effect, in draft order. """
+        return self.pick_log[:self.cursor]
+    # ---------------------- Picks ----------------------
+# ---------------------- Draft State ----------------------
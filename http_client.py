@@ -0,0 +1,216 @@
+# ---------------------- Libraries ----------------------
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+import snapshots
+from app_logging import get_logger
+# ---------------------- Libraries ----------------------
+
+logger = get_logger(__name__)
+
+
+# ---------------------- Settings ----------------------
+# Browser-like User-Agent (FantasyPros and Pro-Football-Reference reject some default client headers)
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+}
+
+# Seconds to wait for a page before giving up (used when a source doesn't define its own timeout)
+DEFAULT_TIMEOUT = 15
+
+# Upper bound on simultaneous requests made by fetch_pages()
+MAX_WORKERS = 8
+
+# Root of every on-disk cache the app keeps (HTTP responses live in <CACHE_DIR>/http)
+CACHE_DIR = os.environ.get("DRAFTVADER_CACHE_DIR", ".cache")
+HTTP_CACHE_DIR = os.path.join(CACHE_DIR, "http")
+
+# How long a cached page is served without asking the server again (seconds).
+# After the TTL runs out the page is revalidated with ETag / If-Modified-Since, so an unchanged page costs a 304.
+TTL_ALWAYS_REVALIDATE = 0
+TTL_15_MINUTES = 15 * 60
+TTL_HOURLY = 60 * 60
+TTL_DAILY = 24 * 60 * 60
+TTL_FOREVER = None  # pages that never change once published
+# ---------------------- Settings ----------------------
+
+
+# ---------------------- Shared Session ----------------------
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """
+    Returns the process-wide requests.Session shared by every scraper.
+
+    The session keeps one connection pool per host, so concurrent requests to the same site
+    (e.g. the five FantasyPros pages) reuse TCP/TLS connections instead of opening a new one per call.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update(DEFAULT_HEADERS)
+                _session = session
+    return _session
+# ---------------------- Shared Session ----------------------
+
+
+# ---------------------- Response Cache ----------------------
+def cache_key(url):
+    """ Stable file name for a URL inside HTTP_CACHE_DIR. """
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+def body_hash(body):
+    """ Hash of a cached body, stored in its metadata to tie the two files together. """
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()
+
+def read_cached_response(url):
+    """
+    Returns (body, metadata) for a cached URL, or (None, None) if it has never been stored.
+
+    A body that doesn't match the hash in its metadata (the pair was caught between two writes) counts as not stored.
+    """
+    path = os.path.join(HTTP_CACHE_DIR, cache_key(url))
+    try:
+        with open(path + ".json", encoding="utf-8") as f:
+            meta = json.load(f)
+        with open(path + ".html", encoding="utf-8") as f:
+            body = f.read()
+    except (OSError, ValueError):
+        return None, None
+    if not isinstance(meta, dict) or meta.get("body_hash") != body_hash(body):
+        logger.debug("Cached response of %s doesn't match its metadata, ignoring it", url)
+        return None, None
+    return body, meta
+
+def write_cached_response(url, body=None, meta=None):
+    """
+    Stores the body and/or metadata for a URL. Each file is written to a temp file first so readers never see half
+    a page, and the metadata - carrying the body's hash - goes last, so a reader can tell a mismatched pair.
+    Metadata written on its own must keep the "body_hash" of the body it was read with.
+    """
+    os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+    path = os.path.join(HTTP_CACHE_DIR, cache_key(url))
+    if body is not None and meta is not None:
+        meta = {**meta, "body_hash": body_hash(body)}
+    for suffix, content in ((".html", body), (".json", json.dumps(meta) if meta is not None else None)):
+        if content is None:
+            continue
+        tmp_path = f"{path}{suffix}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp_path, path + suffix)
+
+def is_fresh(meta, ttl):
+    """ Whether a cached copy is younger than `ttl`; one without a fetch time is stale. """
+    fetched_at = meta.get("fetched_at")
+    if fetched_at is None:
+        return False
+    return ttl is TTL_FOREVER or time.time() - fetched_at < ttl
+# ---------------------- Response Cache ----------------------
+
+
+# ---------------------- Fetch Functions ----------------------
+def fetch_page(url, timeout=DEFAULT_TIMEOUT, ttl=TTL_ALWAYS_REVALIDATE):
+    """
+    Fetches a single page through the shared session and the on-disk response cache.
+
+    A cached copy younger than `ttl` is returned without touching the network. Older copies are revalidated
+    with If-None-Match / If-Modified-Since and reused when the server answers 304 Not Modified.
+    In snapshot replay mode the page is read from the snapshot directory instead (see snapshots.py).
+
+    Args:
+        url (str): Page to download.
+        timeout (float): Seconds to wait before giving up.
+        ttl (int | None): Seconds a cached copy stays fresh (TTL_FOREVER never expires, 0 always revalidates).
+
+    Returns:
+        str: The response body.
+
+    Raises:
+        requests.RequestException: On connection errors, timeouts and HTTP error statuses
+                                   (snapshots.SnapshotMissingError when replaying a page that was never recorded).
+    """
+    # Replay mode: answer from the snapshot directory only, never from the network
+    if snapshots.is_replaying():
+        return snapshots.load_page(url)
+
+    body = _fetch_with_cache(url, timeout, ttl)
+
+    # Record mode: keep a copy of every page the pipeline used
+    if snapshots.is_recording():
+        snapshots.save_page(url, body)
+    return body
+
+def _fetch_with_cache(url, timeout, ttl):
+    cached_body, meta = read_cached_response(url)
+    if meta is not None and is_fresh(meta, ttl):
+        return cached_body
+
+    headers = {}
+    if meta is not None:
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    response = get_session().get(url, timeout=timeout, headers=headers)
+
+    if response.status_code == 304 and meta is not None:
+        # Unchanged upstream - keep the stored body and restart its TTL
+        meta["fetched_at"] = time.time()
+        write_cached_response(url, meta=meta)
+        return cached_body
+
+    response.raise_for_status()
+    write_cached_response(url, body=response.text, meta={
+        "url": url,
+        "fetched_at": time.time(),
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    })
+    return response.text
+
+def fetch_pages(sources, max_workers=MAX_WORKERS):
+    """
+    Fetches several pages at once on a thread pool.
+
+    Args:
+        sources (dict): Maps a source key to a (url, timeout, ttl) tuple (see fetch_page()).
+        max_workers (int): Maximum number of requests in flight.
+
+    Returns:
+        tuple: (pages, timings) where pages maps each key to the response body (None if the fetch failed)
+               and timings maps each key to the seconds spent on that request.
+    """
+    pages = {}
+    timings = {}
+
+    def fetch(key, url, timeout, ttl):
+        start = time.perf_counter()
+        try:
+            return key, fetch_page(url, timeout, ttl), time.perf_counter() - start
+        except requests.RequestException as e:
+            logger.error("⚠️ HTTP request error (%s): %s", key, e)
+            return key, None, time.perf_counter() - start
+
+    workers = max(1, min(max_workers, len(sources)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(fetch, key, *source) for key, source in sources.items()]
+        for future in futures:
+            key, html, elapsed = future.result()
+            pages[key] = html
+            timings[key] = elapsed
+
+    return pages, timings
+# ---------------------- Fetch Functions ----------------------
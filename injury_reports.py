@@ -1,93 +1,194 @@
-import requests
-from bs4 import BeautifulSoup
+import hashlib
+import os
 import pandas as pd
 import streamlit as st
+import snapshots
+from player_identity import add_player_ids, name_from_headline
+from http_client import fetch_pages, CACHE_DIR, DEFAULT_TIMEOUT, TTL_15_MINUTES
+from instrumentation import timed, cache_miss
+from app_logging import get_logger, fields, rate_limited
 # ---------------------- Libraries ----------------------
 
+logger = get_logger(__name__)
 
-# ---------------------- Get Injury Reports ----------------------
-@st.cache_data
-def get_injury_reports(urls):
 
-    # Check if the message has been shown before printing to terminal
-    if 'injury_reports_shown' not in st.session_state:
-        print("---------------------------------------------------------------")
-        print(f"\n////////// Injury Reports //////////\n")
-        print("---------------------------------------------------------------")
-        st.session_state['injury_reports_shown'] = True
+# ---------------------- Injury News Pages ----------------------
+INJURY_NEWS_URL = "https://www.fantasypros.com/nfl/injury-news.php"
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
-    }
+# How deep the incremental crawler may page back, and how many pages it requests at once
+INJURY_NEWS_MAX_PAGES = 12
+INJURY_NEWS_BATCH_SIZE = 3
 
-    injury_data = []
+# Articles already crawled, keyed by article_id() (kept across restarts), newest first and capped at
+# INJURY_NEWS_MAX_ARTICLES
+INJURY_NEWS_STORE = os.path.join(CACHE_DIR, "injury_news.csv")
+INJURY_NEWS_MAX_ARTICLES = 500
 
-    for url in urls:
-        print(f"Scraping: {url}")
-        response = requests.get(url, headers=headers)
-        soup = BeautifulSoup(response.text, "html.parser")
-
-        articles = soup.find_all("div", class_="player-news-item")
-
-        for article in articles:
-            try:
-                # Headline
-                headline_tag = article.find("div", class_="player-news-header").find("a")
-                headline = headline_tag.text.strip() if headline_tag else None
-
-                # Date
-                date_tag = article.find("div", class_="player-news-header").find("p")
-                date = date_tag.text.strip().split("By")[0].strip() if date_tag else None
-
-                # Description: find the first <p> directly following the .player-news-header block
-                ten_columns_div = article.find("div", class_="ten columns")
-                p_tags = ten_columns_div.find_all("p", recursive=False)  # only direct children
-
-                # We expect:
-                # - p[0] is inside .player-news-header (author/date)
-                # - p[1] is the description
-                # - p[2] is the fantasy impact
-                description = None
-                fantasy_impact = None
-                found_description = False
-
-                for p in p_tags:
-                    text = p.get_text(strip=True)
-                    if not found_description and "Fantasy Impact" not in text and "By" not in text:
-                        description = text
-                        found_description = True
-                    elif "Fantasy Impact" in text:
-                        fantasy_impact = text.replace("Fantasy Impact:", "").strip()
-                        break
-
-                injury_data.append({
-                    "headline": headline,
-                    "date": date,
-                    "description": description,
-                    "fantasy_impact": fantasy_impact
-                })
-
-            except Exception as e:
-                print(f"Error parsing article: {e}")
+INJURY_COLUMNS = ["headline", "date", "description", "fantasy_impact"]
 
-    # Convert to DataFrame
-    df = pd.DataFrame(injury_data)
+def injury_news_url(page):
+    return INJURY_NEWS_URL if page == 1 else f"{INJURY_NEWS_URL}?page={page}"
+# ---------------------- Injury News Pages ----------------------
 
-    # Extract player_name from the first two words of the headline
-    def extract_player_name(headline):
-        if pd.isna(headline):
-            return None
-        words = headline.split()
-        return " ".join(words[:2]) if len(words) >= 2 else headline
 
-    df.insert(0, 'player_name', df['headline'].apply(extract_player_name))
+# ---------------------- Parse Injury Articles ----------------------
+def article_id(headline, date):
+    """ Stable id of a news item: the same headline posted on the same date always hashes to the same id. """
+    return hashlib.sha1(f"{headline}|{date}".encode("utf-8")).hexdigest()[:16]
 
-    print("")
-    print(df.head())
-    print("---------------------------------------------------------------")
+def parse_injury_articles(html):
+    """ Parses every .player-news-item on an injury news page into a list of dicts (in page order). """
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, "html.parser")
 
-    # Optional: Save to CSV
-    # df.to_csv("fantasypros_injury_news.csv", index=False)
+    articles = soup.find_all("div", class_="player-news-item")
 
-    return df
-# ---------------------- Get Injury Reports ----------------------
\ No newline at end of file
+    injury_data = []
+    for article in articles:
+        try:
+            # Headline
+            headline_tag = article.find("div", class_="player-news-header").find("a")
+            headline = headline_tag.text.strip() if headline_tag else None
+
+            # Date
+            date_tag = article.find("div", class_="player-news-header").find("p")
+            date = date_tag.text.strip().split("By")[0].strip() if date_tag else None
+
+            # Description: find the first <p> directly following the .player-news-header block
+            ten_columns_div = article.find("div", class_="ten columns")
+            p_tags = ten_columns_div.find_all("p", recursive=False)  # only direct children
+
+            # We expect:
+            # - p[0] is inside .player-news-header (author/date)
+            # - p[1] is the description
+            # - p[2] is the fantasy impact
+            description = None
+            fantasy_impact = None
+            found_description = False
+
+            for p in p_tags:
+                text = p.get_text(strip=True)
+                if not found_description and "Fantasy Impact" not in text and "By" not in text:
+                    description = text
+                    found_description = True
+                elif "Fantasy Impact" in text:
+                    fantasy_impact = text.replace("Fantasy Impact:", "").strip()
+                    break
+
+            injury_data.append({
+                "headline": headline,
+                "date": date,
+                "description": description,
+                "fantasy_impact": fantasy_impact
+            })
+
+        except Exception as e:
+            logger.warning("⚠️ Error parsing article: %s", e, extra=rate_limited(60))
+
+    return injury_data
+
+def build_injury_reports_df(injury_data, known_names=()):
+    # Convert to DataFrame
+    df = pd.DataFrame(injury_data, columns=INJURY_COLUMNS)
+
+    # Player name from the start of the headline (matched against the known players' canonical names when given),
+    # plus its canonical player id
+    known_names = frozenset(known_names)
+    df.insert(0, 'player_name', df['headline'].map(lambda headline: name_from_headline(headline, known_names)))
+    return add_player_ids(df, 'player_name')
+# ---------------------- Parse Injury Articles ----------------------
+
+
+# ---------------------- Incremental Injury News ----------------------
+def read_injury_store(store_path):
+    if store_path and os.path.exists(store_path):
+        return pd.read_csv(store_path, dtype=str, keep_default_na=False).replace({"": None})
+    return pd.DataFrame(columns=["article_id"] + INJURY_COLUMNS)
+
+@timed()
+def crawl_injury_news(max_pages=INJURY_NEWS_MAX_PAGES, batch_size=INJURY_NEWS_BATCH_SIZE,
+                      store_path=INJURY_NEWS_STORE):
+    """
+    Incrementally crawls the injury news pages, newest first.
+
+    Pages are requested `batch_size` at a time in parallel (a refresh checks page 1 on its own first). Paging
+    stops at the first page that contains an article already in the store (or a page without articles), so a
+    refresh only downloads and parses the pages holding new items, and the first run can afford to go
+    `max_pages` deep. A page that fails to download is retried once; if it still fails the crawl stops without
+    saving, since the store must never hold the pages before a gap (the next refresh would stop in front of it).
+
+    Args:
+        max_pages (int): Deepest page to request.
+        batch_size (int): Pages fetched concurrently per round.
+        store_path (str | None): CSV holding previously seen articles (None keeps nothing between runs).
+
+    Returns:
+        pd.DataFrame: The newest INJURY_NEWS_MAX_ARTICLES known articles (new ones first) with an 'article_id'
+        column.
+    """
+    store = read_injury_store(store_path)
+    seen_ids = set(store["article_id"])
+
+    new_articles = []
+    reached_seen = False
+    failed_page = None
+    page = 1
+    while page <= max_pages and not reached_seen and failed_page is None:
+        # On a refresh, look at page 1 alone first - usually it already reaches stored articles
+        size = 1 if page == 1 and seen_ids else batch_size
+        batch = list(range(page, min(page + size, max_pages + 1)))
+        pages, _ = fetch_pages({p: (injury_news_url(p), DEFAULT_TIMEOUT, TTL_15_MINUTES) for p in batch})
+        retry = [p for p in batch if pages[p] is None]
+        if retry:
+            pages.update(fetch_pages({p: (injury_news_url(p), DEFAULT_TIMEOUT, TTL_15_MINUTES) for p in retry})[0])
+
+        for p in batch:
+            if pages[p] is None:
+                failed_page = p
+                break
+            articles = parse_injury_articles(pages[p])
+            if not articles:
+                # Past the last page - nothing deeper to crawl
+                reached_seen = True
+                break
+            for article in articles:
+                key = article_id(article["headline"], article["date"])
+                if key in seen_ids:
+                    reached_seen = True
+                    continue
+                seen_ids.add(key)
+                new_articles.append({"article_id": key, **article})
+            if reached_seen:
+                break
+        page += size
+
+    logger.info("🧠 Injury news crawled", extra=fields(new_articles=len(new_articles), stored=len(store)))
+    if failed_page is not None:
+        logger.warning("⚠️ Injury news page %d could not be fetched; the new articles are not saved", failed_page)
+    if new_articles:
+        store = pd.concat([pd.DataFrame(new_articles, columns=store.columns), store], ignore_index=True)
+        store = store.head(INJURY_NEWS_MAX_ARTICLES)
+        if store_path and failed_page is None:
+            os.makedirs(os.path.dirname(store_path) or ".", exist_ok=True)
+            store.to_csv(store_path, index=False)
+
+    return store.head(INJURY_NEWS_MAX_ARTICLES)
+
+@timed(cached=True)
+@st.cache_data(ttl=TTL_15_MINUTES)
+def get_injury_news(max_pages=INJURY_NEWS_MAX_PAGES, known_names=()):
+    """
+    Injury reports DataFrame backed by the incremental crawler, newest article first.
+
+    Columns: player_name (the player named at the start of the headline), player_id (see
+    player_identity.player_id), headline, date, description and fantasy_impact.
+
+    Args:
+        known_names (tuple): Canonical names of the known players, used to find the name in each headline.
+    """
+    cache_miss()
+    # Replay runs must not mix in articles stored by earlier live runs
+    store_path = None if snapshots.is_replaying() else INJURY_NEWS_STORE
+    store = crawl_injury_news(max_pages=max_pages, store_path=store_path)
+    return build_injury_reports_df(store[INJURY_COLUMNS].to_dict(orient="records"), known_names)
+# ---------------------- Incremental Injury News ----------------------
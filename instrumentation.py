@@ -0,0 +1,151 @@
+"""
+Per-stage timing / memory instrumentation.
+
+    with stage("parse ADP"):             # times a block
+        ...
+
+    @timed(cached=True)                  # times every call; put it above @st.cache_data
+    @st.cache_data
+    def get_schedules(year, url):
+        cache_miss()                       # only runs when st.cache_data had no entry -> recorded as a miss
+        ...
+
+Every script run calls begin_run("Home") (or its page name); the stages it triggers are recorded under that run with
+wall time, cache hit/miss and - when memory tracing is on (DRAFTVADER_TRACE_MEMORY=1 or the Diagnostics page
+toggle) - peak allocation. tracemalloc's peak is process-wide, so the peaks of stages running on several threads at
+once are approximate: they include the other threads' allocations, and one thread's stage resets the peak under
+another's. pages/Diagnostics.py shows the runs and exports them as JSON via export_json().
+"""
+# ---------------------- Libraries ----------------------
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Settings ----------------------
+# Number of runs kept in memory, and of stages kept per run (oldest dropped first). The stage cap bounds the runs
+# of threads that never call begin_run (e.g. thread-pool workers), whose one run would otherwise grow forever.
+MAX_RUNS = 50
+MAX_STAGES_PER_RUN = 1000
+
+if os.environ.get("DRAFTVADER_TRACE_MEMORY", "").strip() in ("1", "true", "yes"):
+    tracemalloc.start()
+# ---------------------- Settings ----------------------
+
+
+# ---------------------- Runs ----------------------
+_runs = deque(maxlen=MAX_RUNS)
+_runs_lock = threading.Lock()
+_local = threading.local()
+
+def begin_run(label):
+    """ Starts a new run on this thread (one per script rerun); following stages are recorded under it. """
+    run = {
+        'label': label,
+        'thread': threading.current_thread().name,
+        'started_at': datetime.now().isoformat(timespec="seconds"),
+        'stages': deque(maxlen=MAX_STAGES_PER_RUN),
+    }
+    _local.run = run
+    _local.stack = []
+    with _runs_lock:
+        _runs.append(run)
+    return run
+
+def _current_run():
+    run = getattr(_local, 'run', None)
+    if run is None:
+        # Stages outside a script run (e.g. the warm-up thread) get a run named after their thread
+        run = begin_run(threading.current_thread().name)
+    return run
+
+def get_runs():
+    """ Snapshot of the recorded runs, oldest first. """
+    with _runs_lock:
+        return [dict(run, stages=list(run['stages'])) for run in _runs]
+
+def clear_runs():
+    with _runs_lock:
+        _runs.clear()
+
+def export_json(indent=2):
+    """ All recorded runs as a JSON document (for regression tracking across versions). """
+    return json.dumps({
+        'exported_at': datetime.now().isoformat(timespec="seconds"),
+        'memory_tracing': tracemalloc.is_tracing(),
+        'runs': get_runs(),
+    }, indent=indent)
+# ---------------------- Runs ----------------------
+
+
+# ---------------------- Stages ----------------------
+def set_memory_tracing(enabled):
+    """ Turns peak-allocation measurement on or off (tracemalloc slows allocation-heavy code while it is on). """
+    if enabled and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    elif not enabled and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+@contextmanager
+def stage(name, cached=False):
+    """
+    Records one stage of the current run: wall time, cache hit/miss (if `cached`) and peak allocation.
+
+    Stages nest; a stage's 'depth' is its nesting level and its peak includes its children's. The peak is only
+    approximate while stages run on other threads too (see the module docstring).
+    """
+    run = _current_run()
+    stack = _local.stack
+    tracing = tracemalloc.is_tracing()
+    frame = {'cache': 'hit' if cached else None, 'child_peak': 0}
+    if tracing:
+        frame['start_bytes'] = tracemalloc.get_traced_memory()[0]
+        # Process-wide: this also restarts the peak of any stage running on another thread
+        tracemalloc.reset_peak()
+    stack.append(frame)
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        stack.pop()
+        record = {
+            'stage': name,
+            'depth': len(stack),
+            'seconds': round(elapsed, 4),
+            'cache': frame['cache'],
+            'peak_bytes': None,
+        }
+        if tracing and tracemalloc.is_tracing():
+            absolute_peak = max(tracemalloc.get_traced_memory()[1], frame['child_peak'])
+            record['peak_bytes'] = absolute_peak - frame['start_bytes']
+            if stack:
+                stack[-1]['child_peak'] = max(stack[-1]['child_peak'], absolute_peak)
+        run['stages'].append(record)
+
+def cache_miss():
+    """ Marks the innermost running stage as a cache miss (call it inside the cached function body). """
+    stack = getattr(_local, 'stack', None)
+    if stack:
+        stack[-1]['cache'] = 'miss'
+
+def timed(name=None, cached=False):
+    """ Decorator form of stage(); `cached=True` for functions wrapped in st.cache_data (see cache_miss()). """
+    def decorator(func):
+        stage_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(stage_name, cached=cached):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+# ---------------------- Stages ----------------------
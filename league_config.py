@@ -0,0 +1,94 @@
+"""
+League settings - team count, rounds, starting lineup slots, superflex and third-round reversal - with the draft's
+pick schedule computed once.
+
+    league = LeagueConfig(num_teams=12, rounds=18, superflex=True, third_round_reversal=True)
+    league.team_at(26)              # team number making overall pick 26 (0-based) - an array lookup
+    league.next_pick(3, after=26)   # Team 3's first pick after pick 26, or None once it has no picks left
+    league.slots                    # {'QB': 1, 'RB': 2, 'WR': 3, 'TE': 1, 'FLEX': 1, 'SUPERFLEX': 1}
+
+`pick_teams[n]` is the team at overall pick n and `team_picks[team - 1]` the overall picks of a team in round order,
+so "who picks at N" and "when does this team pick next" never walk the snake order.
+"""
+# ---------------------- Libraries ----------------------
+import numpy as np
+from team_rosters import STARTING_SLOTS
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- League Config ----------------------
+class LeagueConfig:
+    """ Settings of one draft. Treat it as immutable: the pick schedule is computed in the constructor. """
+
+    __slots__ = ('num_teams', 'rounds', 'slots', 'superflex', 'third_round_reversal', 'pick_teams', 'team_picks')
+
+    def __init__(self, num_teams=12, rounds=18, slots=None, superflex=False, third_round_reversal=False):
+        """
+        Args:
+            num_teams (int): Teams in the draft ("Team 1" ... "Team N").
+            rounds (int): Picks per team.
+            slots (dict): Starting lineup slot counts (default: team_rosters.STARTING_SLOTS).
+            superflex (bool): Adds a SUPERFLEX slot (QB, RB, WR or TE).
+            third_round_reversal (bool): Round 3 runs in the same order as round 2, and the snake alternates from
+                                         there (3RR).
+
+        Raises:
+            ValueError: If there are no teams or no rounds.
+        """
+        if num_teams < 1 or rounds < 1:
+            raise ValueError(f"A draft needs at least one team and one round (got {num_teams} teams, {rounds} rounds)")
+        self.num_teams = num_teams
+        self.rounds = rounds
+        self.slots = dict(STARTING_SLOTS if slots is None else slots)
+        if superflex:
+            self.slots.setdefault("SUPERFLEX", 1)
+        self.superflex = "SUPERFLEX" in self.slots
+        self.third_round_reversal = third_round_reversal
+
+        # Team numbers in draft order: one row per round, reversed on the snake's way back
+        order = np.tile(np.arange(1, num_teams + 1), (rounds, 1))
+        reversed_rounds = np.arange(rounds) % 2 == 1
+        if third_round_reversal:
+            # Round 3 (index 2) repeats round 2's direction and every later round flips with it
+            reversed_rounds[2:] = ~reversed_rounds[2:]
+        order[reversed_rounds] = order[reversed_rounds, ::-1]
+        self.pick_teams = order.ravel()
+        self.pick_teams.flags.writeable = False
+        # (team - 1, round) -> overall pick number
+        self.team_picks = np.argsort(self.pick_teams, kind='stable').reshape(num_teams, rounds)
+        self.team_picks.flags.writeable = False
+
+    def __repr__(self):
+        return (f"LeagueConfig(num_teams={self.num_teams}, rounds={self.rounds}, slots={self.slots}, "
+                f"superflex={self.superflex}, third_round_reversal={self.third_round_reversal})")
+
+    @property
+    def total_picks(self):
+        return len(self.pick_teams)
+
+    def team_at(self, pick_number):
+        """ Team number making overall pick `pick_number` (0-based). """
+        return int(self.pick_teams[pick_number])
+
+    def round_of(self, pick_number):
+        """ 1-based round of overall pick `pick_number`. """
+        return pick_number // self.num_teams + 1
+
+    def next_pick(self, team, after):
+        """ `team`'s first overall pick after pick `after` (0-based), or None if it has no picks left. """
+        picks = self.team_picks[team - 1]
+        # A team picks exactly once per round, so the answer is its pick in this round or the next one
+        round_index = max(after + 1, 0) // self.num_teams
+        for pick in picks[round_index:round_index + 2]:
+            if pick > after:
+                return int(pick)
+        return None
+
+    def next_picks(self, team, after, count):
+        """ Up to `count` of `team`'s picks after pick `after`, in order. """
+        first = self.next_pick(team, after)
+        if first is None:
+            return []
+        start = self.round_of(first) - 1
+        return [int(pick) for pick in self.team_picks[team - 1][start:start + count]]
+# ---------------------- League Config ----------------------
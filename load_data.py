@@ -1,12 +1,37 @@
 # ---------------------- Libraries ----------------------
+import logging
 import os
 import re
+import time
 import pandas as pd
 import streamlit as st
-from scraper import load_adp_data, load_season_projections_qb, load_season_projections_rb, load_season_projections_wr
-from scraper import load_season_projections_te
+from http_client import fetch_pages, CACHE_DIR, TTL_HOURLY, TTL_DAILY
+from player_identity import add_player_ids, PRO_BOWL_MARKERS
+from scraper import parse_adp_data, parse_season_projections
+from instrumentation import timed, cache_miss
+from app_logging import get_logger, fields, frame_summary
+
+# Optional: pyarrow gives the memory-mapped Feather store below (falls back to the CSV files without it)
+try:
+    from pyarrow import feather
+except ImportError:
+    feather = None
 # ---------------------- Libraries ----------------------
 
+logger = get_logger(__name__)
+
+
+# ---------------------- FantasyPros Sources ----------------------
+# Every FantasyPros page Home.py needs at startup: key -> (url, timeout in seconds, on-disk cache TTL)
+FANTASYPROS_SOURCES = {
+    "adp": ("https://www.fantasypros.com/nfl/adp/best-ball-overall.php", 10, TTL_HOURLY),
+    "QB": ("https://www.fantasypros.com/nfl/projections/qb.php?week=draft", 15, TTL_DAILY),
+    "RB": ("https://www.fantasypros.com/nfl/projections/rb.php?week=draft&scoring=PPR&week=draft", 15, TTL_DAILY),
+    "WR": ("https://www.fantasypros.com/nfl/projections/wr.php?week=draft&scoring=PPR&week=draft", 15, TTL_DAILY),
+    "TE": ("https://www.fantasypros.com/nfl/projections/te.php?week=draft&scoring=PPR&week=draft", 15, TTL_DAILY),
+}
+# ---------------------- FantasyPros Sources ----------------------
+
 
 # ---------------------- Data Handling Functions ----------------------
 # @st.cache_data
@@ -25,17 +50,13 @@ from scraper import load_season_projections_te
 @st.cache_data
 def load_nfl_player_data(data_folder, file_name):
     nfl_player_stats_df = pd.read_csv(os.path.join(data_folder, file_name))
-    print("---------------------------------------------------------------")
-    print(nfl_player_stats_df)
-    print("---------------------------------------------------------------")
+    logger.info("🧠 Loaded %s (%s)", file_name, frame_summary(nfl_player_stats_df))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Sample rows:\n%s", nfl_player_stats_df.head().to_string())
     return nfl_player_stats_df
 
-# Loads Average Draft Position (ADP) data from FantasyPros, processes it, and caches the result to improve performance.
-@st.cache_data # Subsequent calls with the same input will return the cached result instead of re-executing the function.
-def get_adp_data(url):
-    print(f"⏳ Scraping ADP data from {url} ...")
-    # adp_data is a list of dictionaries where each dictionary contains data about a player.
-    adp_data = load_adp_data(url)
+# Strips position rank suffixes from ADP rows (e.g., "WR1" -> "WR")
+def clean_adp_positions(adp_data):
     # Check if data is empty or None
     if not adp_data:
         raise ValueError("No ADP data returned from the source.")
@@ -44,76 +65,107 @@ def get_adp_data(url):
         match = re.match(r"([A-Za-z]+)", player['pos'])
         # Uses the function get_primary_position() to standardize or clean up the player’s position field.
         player['pos'] = match.group(1) if match else player['pos']  # Default to the original position if no match=
-    print("🧠 ADP data loaded!\n")
-    print("Data summary:")
-    for player in adp_data[:5]:
-        print(player)
-    print("---------------------------------------------------------------")
     return adp_data
 
-@st.cache_data
-def get_season_projections_qb(url):
-    print(f"⏳ Scraping QB Season Projections from {url} ...")
-    projections_qb = load_season_projections_qb(url)
-    print("🧠 QB Season Projections loaded!\n")
-    print("Data summary:")
-    for qb in projections_qb[:5]:
-        print(qb)
-    print("---------------------------------------------------------------")
-    return projections_qb
+# Downloads the ADP page and all four projection pages at once, then hands each page to its parser.
+# Returns a dict: {'adp': [...], 'QB': [...], 'RB': [...], 'WR': [...], 'TE': [...]}
+@timed(cached=True)
+@st.cache_data(ttl=TTL_HOURLY)
+def get_fantasypros_data(sources=None):
+    cache_miss()
+    sources = sources or FANTASYPROS_SOURCES
+    logger.info("⏳ Scraping %d FantasyPros pages concurrently ...", len(sources))
 
-@st.cache_data
-def get_season_projections_rb(url):
-    print(f"⏳ Scraping RB Season Projections from {url} ...")
-    projections_rb = load_season_projections_rb(url)
-    print("🧠 RB Season Projections loaded!\n")
-    print("Data summary:")
-    for rb in projections_rb[:5]:
-        print(rb)
-    print("---------------------------------------------------------------")
-    return projections_rb
+    start = time.perf_counter()
+    pages, timings = fetch_pages(sources)
+    fetch_wall_time = time.perf_counter() - start
 
-@st.cache_data
-def get_season_projections_wr(url):
-    print(f"⏳ Scraping WR Season Projections from {url} ...")
-    projections_wr = load_season_projections_wr(url)
-    print("🧠 WR Season Projections loaded!\n")
-    print("Data summary:")
-    for wr in projections_wr[:5]:
-        print(wr)
-    print("---------------------------------------------------------------")
-    return projections_wr
+    # The requests overlap and share the connection, so their summed time is not what a one-after-another fetch takes
+    logger.info("⏱️ Fetch wall-clock: %.2fs concurrent (sum of request times %.2fs)", fetch_wall_time,
+                sum(timings.values()), extra=fields(**{key: round(elapsed, 2) for key, elapsed in timings.items()}))
 
-@st.cache_data
-def get_season_projections_te(url):
-    print(f"⏳ Scraping TE Season Projections from {url} ...")
-    projections_te = load_season_projections_te(url)
-    print("🧠 TE Season Projections loaded!\n")
-    print("Data summary:")
-    for te in projections_te[:5]:
-        print(te)
-    print("---------------------------------------------------------------")
-    return projections_te
+    data = {}
+    for key, html in pages.items():
+        if key == "adp":
+            data[key] = clean_adp_positions(parse_adp_data(html) if html else None)
+        elif html:
+            data[key] = parse_season_projections(html, key)
+        else:
+            logger.warning("⚠️ No %s Season Projections returned from the source.", key)
+            data[key] = []
 
-# @st.cache_data
-# def get_season_projections_k(url):
-#     print(f"⏳ Scraping Kicker Season Projections from {url} ...")
-#     projections_k = load_season_projections_k(url)
-#     print("🧠 Kicker Season Projections loaded!\n")
-#     print("Data summary:")
-#     for k in projections_k[:5]:
-#         print(k)
-#     print("---------------------------------------------------------------")
-#     return projections_k
-#
-# @st.cache_data
-# def get_season_projections_dst(url):
-#     print(f"⏳ Scraping DST Season Projections from {url} ...")
-#     projections_dst = load_season_projections_dst(url)
-#     print("🧠 DST Season Projections loaded!\n")
-#     print("Data summary:")
-#     for dst in projections_dst[:5]:
-#         print(dst)
-#     print("---------------------------------------------------------------")
-#     return projections_dst
-# ---------------------- Data Handling Functions ----------------------
\ No newline at end of file
+    logger.info("🧠 FantasyPros data loaded in %.2fs", time.perf_counter() - start,
+                extra=fields(**{key: len(rows) for key, rows in data.items()}))
+    return data
+
+# ---------------------- Data Handling Functions ----------------------
+
+# ---------------------- Historical Player Stats Store ----------------------
+# Pro-Football-Reference season stats shipped as CSV (data_files/nfl_player_stats_<season>.csv)
+HISTORICAL_SEASONS = [2024, 2023, 2022]
+HISTORICAL_CSV = os.path.join("data_files", "nfl_player_stats_{season}.csv")
+
+# Typed Feather copies of the CSVs, built on first use (and again whenever the CSV is newer)
+HISTORICAL_STORE_DIR = os.path.join(CACHE_DIR, "historical")
+
+# Part of the store file name: bump it when the schema or the player ids change, so old stores are rebuilt
+HISTORICAL_STORE_VERSION = 3
+
+# Explicit schema of the store; every other (stat) column is float32
+HISTORICAL_DTYPES = {
+    'rank': 'int16', 'player': 'string', 'player_id': 'string', 'team': 'category', 'pos': 'category',
+    'age': 'int16', 'games': 'int16', 'games_started': 'int16', 'pos_rank': 'int16',
+    'pro_bowl': 'bool', 'all_pro': 'bool',
+}
+
+def historical_store_path(season):
+    return os.path.join(HISTORICAL_STORE_DIR, f"nfl_player_stats_{season}.v{HISTORICAL_STORE_VERSION}.feather")
+
+def read_historical_csv(season):
+    """ Reads a season CSV and applies the store schema: cleaned names + player ids, Pro Bowl flags, typed columns. """
+    df = pd.read_csv(HISTORICAL_CSV.format(season=season))
+
+    # (*) Pro Bowl and (+) First-Team All-Pro markers become flags, so names are stored already cleaned
+    df['pro_bowl'] = df['player'].str.contains('*', regex=False)
+    df['all_pro'] = df['player'].str.contains('+', regex=False)
+    df = add_player_ids(df, 'player', tiebreak=('pos', 'team'))
+
+    dtypes = {col: HISTORICAL_DTYPES.get(col, 'float32') for col in df.columns}
+    return df.astype(dtypes)
+
+@timed()
+def build_historical_store(season):
+    """ Converts one season CSV into the Feather store (uncompressed, so reads can be memory-mapped). """
+    df = read_historical_csv(season)
+    os.makedirs(HISTORICAL_STORE_DIR, exist_ok=True)
+    tmp_path = f"{historical_store_path(season)}.{os.getpid()}.tmp"
+    feather.write_feather(df, tmp_path, compression='uncompressed')
+    os.replace(tmp_path, historical_store_path(season))
+    logger.info("🧠 Built %s (%s)", historical_store_path(season), frame_summary(df))
+
+@timed()
+def load_historical_stats(season, columns=None):
+    """
+    Loads a season of historical player stats from the columnar store.
+
+    The Feather file is memory-mapped and only `columns` are read, so a page that needs four columns doesn't pay
+    for all thirty-five. Player names are already cleaned (see 'pro_bowl' / 'all_pro' for the markers) and
+    every frame carries a 'player_id'. Without pyarrow the CSV is read and typed on every call instead.
+
+    Args:
+        season (int): Season of data_files/nfl_player_stats_<season>.csv.
+        columns (list | None): Columns to read (None reads all of them).
+
+    Returns:
+        pd.DataFrame: Typed stats (categorical team/pos, float32 stats).
+    """
+    if feather is None:
+        df = read_historical_csv(season)
+        return df[columns] if columns else df
+
+    path = historical_store_path(season)
+    csv_path = HISTORICAL_CSV.format(season=season)
+    if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(csv_path):
+        build_historical_store(season)
+    return feather.read_table(path, columns=columns, memory_map=True).to_pandas()
+# ---------------------- Historical Player Stats Store ----------------------
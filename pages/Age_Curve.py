@@ -1,28 +1,22 @@
 # ---------------------- LIBRARIES ----------------------
-import pandas as pd
 import streamlit as st
-from age_curve import apply_age_curve
+import datasets
+import instrumentation
 # ---------------------- LIBRARIES ----------------------
 
+instrumentation.begin_run("Age Curve")
 
-# ---------------------- Initialize Session State ----------------------
-# 2024 NFL Player Stats DataFrame
-if 'age_curve_df' in st.session_state:
-    age_curve_df = st.session_state['age_curve_df']
-else:
-    # Load the 2024 NFL Player stats .csv file - (must be above Player_Transactions.py data pulls)
-    nfl_player_stats_2024_df = pd.read_csv('data_files/nfl_player_stats_2024.csv')
-    # Remove + and * from player names
-    nfl_player_stats_2024_df['player'] = nfl_player_stats_2024_df['player'].str.replace(r'[\+\*]', '', regex=True)
-    age_curve_mult_df = apply_age_curve(nfl_player_stats_2024_df)
-    st.session_state['age_curve_df'] = age_curve_mult_df
-# ---------------------- Initialize Session State ----------------------
+
+# ---------------------- Load Datasets ----------------------
+# Age curve of the 2024 players (builds only the 2024 stats it depends on)
+age_curve_df = datasets.load('age_curve')
+# ---------------------- Load Datasets ----------------------
 
 # ---------------------- Age Curve DataFrame ----------------------
 st.subheader("🧮 Age Curve Multiplier")
 
 # Display with friendly column names
-display_df = st.session_state.age_curve_df.rename(columns={
+display_df = age_curve_df.rename(columns={
     "player": "Player Name",
     "team": "Team",
     "pos": "Pos",
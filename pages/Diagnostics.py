@@ -0,0 +1,68 @@
+# ---------------------- LIBRARIES ----------------------
+import tracemalloc
+import pandas as pd
+import streamlit as st
+import instrumentation
+# ---------------------- LIBRARIES ----------------------
+
+
+# ---------------------- Diagnostics ----------------------
+st.subheader("⏱️ Diagnostics")
+
+runs = instrumentation.get_runs()
+
+col1, col2, col3 = st.columns(3)
+
+with col1:
+    # Peak allocation per stage (slows the app down while it is on)
+    trace_memory = st.toggle("Trace memory", value=tracemalloc.is_tracing())
+    if trace_memory != tracemalloc.is_tracing():
+        instrumentation.set_memory_tracing(trace_memory)
+
+with col2:
+    st.download_button("Export JSON", instrumentation.export_json(), file_name="draftvader_timings.json",
+                       mime="application/json")
+
+with col3:
+    if st.button("Clear Runs"):
+        instrumentation.clear_runs()
+        st.rerun()
+
+if not runs:
+    st.markdown("<p style='color: lightblue;'>🤖 <strong>No runs recorded yet - open the draft board or a page first."
+                "</strong></p>", unsafe_allow_html=True)
+    st.stop()
+
+# One row per run (newest first): wall time of its top-level stages and how many stages were cache misses
+summary_rows = []
+for number, run in reversed(list(enumerate(runs))):
+    top_level = [record for record in run['stages'] if record['depth'] == 0]
+    summary_rows.append({
+        'Run': number,
+        'Page': run['label'],
+        'Started': run['started_at'],
+        'Stages': len(run['stages']),
+        'Seconds': round(sum(record['seconds'] for record in top_level), 3),
+        'Cache Misses': sum(record['cache'] == 'miss' for record in run['stages']),
+    })
+st.dataframe(pd.DataFrame(summary_rows), use_container_width=True, hide_index=True)
+
+# Stages of one run, in completion order (children finish before their parent)
+selected_run = st.selectbox(
+    "Select Run:", [row['Run'] for row in summary_rows],
+    format_func=lambda number: f"#{number} {runs[number]['label']} ({runs[number]['started_at']})"
+)
+stages_df = pd.DataFrame(runs[selected_run]['stages'], columns=['stage', 'depth', 'seconds', 'cache', 'peak_bytes'])
+stages_df['stage'] = ["    " * depth + name for name, depth in zip(stages_df['stage'], stages_df['depth'])]
+stages_df['peak_mib'] = pd.to_numeric(stages_df['peak_bytes']) / 2**20
+display_df = stages_df.drop(columns=['depth', 'peak_bytes']).rename(columns={
+    'stage': 'Stage',
+    'seconds': 'Seconds',
+    'cache': 'Cache',
+    'peak_mib': 'Peak MiB',
+})
+st.dataframe(display_df, use_container_width=True, hide_index=True)
+
+st.markdown('<p style="font-size:13px;">Cache: hit / miss for st.cache_data functions and registry datasets; '
+            'Peak MiB is only measured while memory tracing is on.</p>', unsafe_allow_html=True)
+# ---------------------- Diagnostics ----------------------
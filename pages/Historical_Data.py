@@ -1,8 +1,11 @@
 # ---------------------- LIBRARIES ----------------------
 import streamlit as st
-from load_data import load_nfl_player_data
+from load_data import load_historical_stats
+import instrumentation
 # ---------------------- LIBRARIES ----------------------
 
+instrumentation.begin_run("Historical Data")
+
 
 # ---------------------- NFL Player Data - loaded from .csv files ----------------------
 st.subheader("🏛️ NFL Historical Data")
@@ -23,20 +26,13 @@ with col3:
 with col4:
     st.empty()
 
-# Check if the Boom-Bust message has been shown before printing to terminal
-if 'nfl_player_data_shown' not in st.session_state:
-    print("---------------------------------------------------------------")
-    print(f"\n////////// {selected_season} NFL Player Data //////////\n")
-    st.session_state['nfl_player_data_shown'] = True
-
-# Set the directory where the data files are located
-data_folder = './'
-
-# Load the appropriate file based on season
-file_name = f"data_files/nfl_player_stats_{selected_season}.csv"
+# Load the selected season from the columnar store (names are stored cleaned, with Pro Bowl / All-Pro flags)
+data = load_historical_stats(int(selected_season))
 
-# Load and display the data
-data = load_nfl_player_data(data_folder, file_name)
+# Put the (*) / (+) markers back on the displayed names
+data['player'] = (data['player'] + data['pro_bowl'].map({True: '*', False: ''})
+                  + data['all_pro'].map({True: '+', False: ''}))
+data = data.drop(columns=['player_id', 'pro_bowl', 'all_pro'])
 
 st.markdown(f"<p style='color: lightblue;'>🤖 "
             f"<strong>Displaying historical data for season: {selected_season}"
@@ -1,33 +1,28 @@
 # ---------------------- LIBRARIES ----------------------
 import pandas as pd
 import streamlit as st
+import datasets
+import instrumentation
 # ---------------------- LIBRARIES ----------------------
 
+instrumentation.begin_run("Injury Reports")
 
-# ---------------------- Initialize Session State ----------------------
-# 2024 NFL Player Stats DataFrame
-if 'nfl_player_stats_2024_df' in st.session_state:
-    nfl_player_stats_2024_df = st.session_state['nfl_player_stats_2024_df']
-else:
-    st.write("No DataFrame found in session_state.")
 
-# Rookie Rankings DataFrame
-if 'rookie_rankings_df' in st.session_state:
-    rookie_rankings_df = st.session_state['rookie_rankings_df']
-    rookie_names = rookie_rankings_df['PLAYER NAME'].dropna().unique()
-    rookie_name_set = set(name.lower() for name in rookie_names)
-else:
-    rookie_names = []
-    rookie_name_set = set()
-    st.warning("No rookie rankings data found in session_state.")
-# ---------------------- Initialize Session State ----------------------
+# ---------------------- Load Datasets ----------------------
+# Top 320 QB / RB / WR / TE of 2024 by overall rank
+top_320_players_df = datasets.load('top_320_players')
+
+# Injury news (incremental crawl) and Rookie Rankings DataFrames
+injury_reports_df = datasets.load('injury_reports')
+rookie_rankings_df = datasets.load('rookie_rankings')
+# ---------------------- Load Datasets ----------------------
 
 
 # ---------------------- All Injuries DataFrame ----------------------
 st.subheader("🏥 All Injury Reports")
 
 # Display with friendly column names
-display_df = st.session_state.injury_reports_df.rename(columns={
+display_df = injury_reports_df.drop(columns=['player_id'], errors='ignore').rename(columns={
     "player_name": "Player Name",
     "headline": "Headline",
     "date": "Date",
@@ -75,26 +70,17 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-# Filter to top 320 players by overall rank and positions QB, RB, WR, TE
-filtered_df = nfl_player_stats_2024_df[nfl_player_stats_2024_df['pos'].isin(['QB', 'RB', 'WR', 'TE'])]
-sorted_df = filtered_df.sort_values('ovr_rank').reset_index(drop=True)
-top_320_players_df = sorted_df.head(320)
-
-# Combine top 320 player names and rookie names
-top_player_names = top_320_players_df['player'].dropna().unique()
-all_relevant_player_names = list(set(top_player_names) | set(rookie_names))
-
-# Filter the injury reports to only include rows where the player name is in all_relevant_player_names
-# Assuming the injury_reports_df has a 'player_name' or similar column for matching players
+# Ids of the top 320 players and the rookies
+relevant_player_ids = set(top_320_players_df['player_id'].dropna()) | set(rookie_rankings_df['player_id'].dropna())
 
-# First, check if 'player_name' column exists in injury_reports_df
-if 'player_name' in st.session_state.injury_reports_df.columns:
-    relevant_injuries_df = st.session_state.injury_reports_df[
-        st.session_state.injury_reports_df['player_name'].str.lower().isin([name.lower() for name in all_relevant_player_names])
-    ].reset_index(drop=True)
+# Filter the injury reports to only include rows of relevant players (matched on canonical player id)
+if 'player_id' in injury_reports_df.columns:
+    relevant_injuries_df = injury_reports_df[
+        injury_reports_df['player_id'].isin(relevant_player_ids)
+    ].drop(columns=['player_id']).reset_index(drop=True)
 else:
-    # If no player_name column, display warning and empty dataframe
-    st.warning("Injury reports DataFrame does not have a 'player_name' column to filter relevant players.")
+    # If no player_id column, display warning and empty dataframe
+    st.warning("Injury reports DataFrame does not have a 'player_id' column to filter relevant players.")
     relevant_injuries_df = pd.DataFrame()
 
 # Display the filtered dataframe with renamed columns for clarity
@@ -3,27 +3,21 @@ from datetime import datetime
 from datetime import date
 import pandas as pd
 import streamlit as st
-from player_transactions import get_player_transactions
+import datasets
+from player_transactions import get_transactions_by_month, build_player_name_index, match_relevant_transactions
+import instrumentation
 # ---------------------- LIBRARIES ----------------------
 
+instrumentation.begin_run("Player Transactions")
 
-# ---------------------- Initialize Session State ----------------------
-# 2024 NFL Player Stats DataFrame
-if 'nfl_player_stats_2024_df' in st.session_state:
-    nfl_player_stats_2024_df = st.session_state['nfl_player_stats_2024_df']
-else:
-    st.write("No DataFrame found in session_state.")
+
+# ---------------------- Load Datasets ----------------------
+# Top 320 QB / RB / WR / TE of 2024 by overall rank
+top_320_players_df = datasets.load('top_320_players')
 
 # Rookie Rankings DataFrame
-if 'rookie_rankings_df' in st.session_state:
-    rookie_rankings_df = st.session_state['rookie_rankings_df']
-    rookie_names = rookie_rankings_df['PLAYER NAME'].dropna().unique()
-    rookie_name_set = set(name.lower() for name in rookie_names)
-else:
-    rookie_names = []
-    rookie_name_set = set()
-    st.warning("No rookie rankings data found in session_state.")
-# ---------------------- Initialize Session State ----------------------
+rookie_rankings_df = datasets.load('rookie_rankings')
+# ---------------------- Load Datasets ----------------------
 
 
 # -------------------------------------------- Player Transactions --------------------------------------------
@@ -32,9 +26,6 @@ st.subheader("📝 Player Transactions")
 current_year = datetime.now().year
 current_month_int = datetime.now().month
 
-# Dictionary to hold monthly transactions
-player_transactions_by_month = {}
-
 # Build list of valid months up to current month for the current year
 months_list = [datetime(current_year, m, 1).strftime('%B') for m in range(1, current_month_int + 1)]
 
@@ -60,13 +51,8 @@ with col3:
 with col4:
     st.empty()
 
-# Loop through valid months and load transactions
-for month in range(1, current_month_int + 1):
-    month_str = f"{month:02}"
-    url = f"https://www.pro-football-reference.com/years/{current_year}/{month_str}_transactions.htm"
-    transactions = get_player_transactions(month_str, url)
-    month_name = datetime.strptime(month_str, "%m").strftime("%B")
-    player_transactions_by_month[month_name] = transactions
+# Dictionary to hold monthly transactions - finished months come from the local store, only the rest are fetched
+player_transactions_by_month = get_transactions_by_month(current_year, current_month_int)
 
 # Get transactions for the selected month
 selected_month_transactions = player_transactions_by_month.get(selected_month)
@@ -74,46 +60,16 @@ st.write(f"All player transactions for {selected_month}, {current_year}:")
 st.dataframe(selected_month_transactions, use_container_width=True, hide_index=True)
 
 # ---------------------- Relevant Transactions DataFrame ----------------------
-# Filter to top 320 players by overall rank and positions QB, RB, WR, TE
-filtered_df = nfl_player_stats_2024_df[nfl_player_stats_2024_df['pos'].isin(['QB', 'RB', 'WR', 'TE'])]
-sorted_df = filtered_df.sort_values('ovr_rank').reset_index(drop=True)
-top_320_players_df = sorted_df.head(320)
-
-# Combine top 320 player names and rookie names
-top_player_names = top_320_players_df['player'].dropna().unique()
-all_relevant_player_names = list(set(top_player_names) | set(rookie_names))
-
-matched_transactions = []
-rookie_flags = []
-
-# Helper to extract core first and last name, ignoring suffixes
-suffixes = {"jr", "sr", "ii", "iii", "iv", "v"}
-def extract_first_last(name):
-    parts = name.lower().split()
-    parts = [part for part in parts if part.strip('.').lower() not in suffixes]
-    if len(parts) >= 2:
-        return parts[0], parts[-1]
-    return parts[0], ""
-
-# Check if any player name appears in the selected transaction text
-for idx, row in selected_month_transactions.iterrows():
-    transaction_text = row['Transaction']
-    transaction_text_lower = transaction_text.lower()
-    for player_name in all_relevant_player_names:
-        first, last = extract_first_last(player_name)
-        if first in transaction_text_lower and last in transaction_text_lower:
-            matched_transactions.append(row)
-            is_rookie = player_name.lower() in rookie_name_set
-            rookie_flags.append("Yes" if is_rookie else "No")
-            break
-
-# Create relevant DataFrame and add Rookie flag
-relevant_transactions_df = pd.DataFrame(matched_transactions)
-if not relevant_transactions_df.empty:
-    relevant_transactions_df['Rookie'] = rookie_flags
+# Index the top 320 players and the rookies (name, player id) once, then match each transaction by its own tokens
+top_players = top_320_players_df[['player', 'player_id']].dropna().itertuples(index=False, name=None)
+rookies = rookie_rankings_df[['PLAYER NAME', 'player_id']].dropna().itertuples(index=False, name=None)
+player_name_index = build_player_name_index(tuple(top_players), tuple(rookies))
 
+# Relevant DataFrame with the matched player and Rookie flag
+relevant_transactions_df = match_relevant_transactions(selected_month_transactions, player_name_index)
+if not relevant_transactions_df.empty:
     st.write(f"Player transactions for {selected_month}, {current_year}, sorted for relevance (including rookies):")
-    st.dataframe(relevant_transactions_df, use_container_width=True, hide_index=True)
+    st.dataframe(relevant_transactions_df.drop(columns=['player_id']), use_container_width=True, hide_index=True)
 else:
     st.info("No relevant transactions matched.")
 # ---------------------- Relevant Transactions DataFrame ----------------------
@@ -1,16 +1,16 @@
 # ---------------------- LIBRARIES ----------------------
 import streamlit as st
-import plotly.express as px
+import datasets
+import instrumentation
 # ---------------------- LIBRARIES ----------------------
 
+instrumentation.begin_run("Positional Scarcity")
+
 
-# ---------------------- Initialize Session State ----------------------
+# ---------------------- Load Datasets ----------------------
 # Positional Scarcity DataFrame
-if 'positional_scarcity_df' in st.session_state:
-    positional_scarcity_df = st.session_state['positional_scarcity_df']
-else:
-    st.write("No DataFrame found in session_state.")
-# ---------------------- Initialize Session State ----------------------
+positional_scarcity_df = datasets.load('positional_scarcity')
+# ---------------------- Load Datasets ----------------------
 
 
 # ---------------------- Positional Spread Visualization ----------------------
@@ -90,7 +90,9 @@ def filter_by_range(df, option):
 # Load and filter
 df = filter_by_range(positional_scarcity_df, range_option)
 
-# Plot
+# Plot (plotly is imported here, at the first chart, instead of with the page - see benchmarks/import_profile.py)
+import plotly.express as px
+
 if plot_type == "Violin Plot":
     fig = px.violin(
         df,
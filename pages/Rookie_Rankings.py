@@ -1,11 +1,15 @@
 # ---------------------- LIBRARIES ----------------------
 import streamlit as st
+import datasets
+import instrumentation
 # ---------------------- LIBRARIES ----------------------
 
+instrumentation.begin_run("Rookie Rankings")
+
 
 # ---------------------- Rookie Rankings ----------------------
 st.subheader("🎓 Rooking Rankings")
 
 # Output as a dataframe:
-st.dataframe(st.session_state.rookie_rankings_df, use_container_width=True, hide_index=True)
+st.dataframe(datasets.load('rookie_rankings').drop(columns=['player_id']), use_container_width=True, hide_index=True)
 # ---------------------- Rookie Rankings ----------------------
\ No newline at end of file
@@ -1,16 +1,14 @@
 # ---------------------- LIBRARIES ----------------------
 import streamlit as st
-import seaborn as sns
-import matplotlib.pyplot as plt
+import datasets
+import instrumentation
 # ---------------------- LIBRARIES ----------------------
 
-# ---------------------- Initialize Session State ----------------------
-if 'positional_scarcity_df' in st.session_state:
-    positional_scarcity_df = st.session_state['positional_scarcity_df']
-else:
-    st.warning("No DataFrame found in session_state.")
-    st.stop()
-# ---------------------- Initialize Session State ----------------------
+instrumentation.begin_run("Season Projections")
+
+# ---------------------- Load Datasets ----------------------
+positional_scarcity_df = datasets.load('positional_scarcity')
+# ---------------------- Load Datasets ----------------------
 
 # ---------------------- Tiered Fantasy Projections ----------------------
 # What This Shows:
@@ -37,6 +35,10 @@ else:
 # Sort by Tier then projected points
 df = df.sort_values(by=['Tier', 'proj_points'], ascending=[True, False])
 
+# Plotting libraries are imported at the first chart instead of with the page
+import seaborn as sns
+import matplotlib.pyplot as plt
+
 fig, ax = plt.subplots(figsize=(12, 6))
 sns.barplot(
     data=df,
@@ -2,20 +2,24 @@
 from datetime import datetime
 import pandas as pd
 import streamlit as st
-from schedules import get_schedules
+import datasets
+from schedules import SCHEDULE_YEAR
+import instrumentation
 # ---------------------- LIBRARIES ----------------------
 
+instrumentation.begin_run("Season Schedules")
+
 
 # ---------------------- Season Schedule ----------------------
 # TODO: determine year to use based on if schedule is out yet or not
 # current_year = datetime.now().year
 # current_month = datetime.now().month
 
-year = "2025"
+year = SCHEDULE_YEAR
 st.subheader(f"📅 {year} NFL Season Schedule")
 
-# Get the raw schedule
-schedules_df = get_schedules(year, f"https://www.pro-football-reference.com/years/{year}/games.htm")
+# Get the raw schedule (a copy - the shared dataset is reshaped below)
+schedules_df = datasets.load('schedules').copy()
 
 # Rename columns to your standard names
 schedules_df.columns = ['day', 'date', 'visitor_team', 'visitor_pts', 'at', 'home_team', 'home_pts', 'time']
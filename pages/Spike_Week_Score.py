@@ -1,14 +1,16 @@
 # ---------------------- LIBRARIES ----------------------
 import streamlit as st
-import spike_week_score
+import datasets
+import instrumentation
 # ---------------------- LIBRARIES ----------------------
 
+instrumentation.begin_run("Spike Week Score")
+
 
 st.subheader("📈 Spike Week Score")
 
-# Calculates the Boom-Bust profile for players based on a list of seasons, specifically for the year
-seasons = [2024]
-df = spike_week_score.organize_by_condition(seasons)
+# Boom-Bust profile for players over spike_week_score.SPIKE_WEEK_SEASONS (shared with the draft board)
+df = datasets.load('boom_bust').drop(columns=['player_id'])
 
 # ---------------------- Display Cleanup Logic for UI ----------------------
 # Format the percentage columns for display
@@ -0,0 +1,201 @@
+# ---------------------- Libraries ----------------------
+import hashlib
+import re
+import unicodedata
+import pandas as pd
+from app_logging import get_logger, fields
+# ---------------------- Libraries ----------------------
+
+logger = get_logger(__name__)
+
+
+# ---------------------- Name Normalization ----------------------
+# Pro-Football-Reference marks Pro Bowl (*) and First-Team All-Pro (+) selections in the player name
+PRO_BOWL_MARKERS = re.compile(r"[\*\+]")
+
+# Generational suffixes dropped from the canonical name ("Marvin Harrison Jr." == "Marvin Harrison")
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+# Everything that isn't a letter, digit or space ("D.K." -> "dk", "Ja'Marr" -> "jamarr", "Amon-Ra" -> "amonra")
+NAME_PUNCTUATION = re.compile(r"[^a-z0-9 ]")
+
+def clean_display_name(name):
+    """ Display name without Pro Bowl / All-Pro markers ("Saquon Barkley*+" -> "Saquon Barkley"). """
+    return PRO_BOWL_MARKERS.sub("", name).strip()
+
+def normalize_name(name):
+    """
+    Canonical form of a player name used to join sources that spell names differently.
+
+    Lower-cases, strips accents, Pro Bowl markers, punctuation and generational suffixes:
+    "D.K. Metcalf" and "DK Metcalf" -> "dk metcalf", "Marvin Harrison Jr." -> "marvin harrison".
+    """
+    if not isinstance(name, str):
+        return ""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    name = NAME_PUNCTUATION.sub("", PRO_BOWL_MARKERS.sub("", name).lower())
+    return " ".join(part for part in name.split() if part not in NAME_SUFFIXES)
+
+def player_id(name, tiebreak=None):
+    """
+    Stable id of a player: the same canonical name always hashes to the same id, in every source and run.
+
+    `tiebreak` (e.g. "WR WAS") tells apart a different player who shares the name - see assign_player_ids().
+    """
+    key = normalize_name(name)
+    if not key:
+        return None
+    if tiebreak:
+        key = f"{key}|{tiebreak}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+def assign_player_ids(names, tiebreaks=None):
+    """
+    Player ids of one source's names, telling apart different players who share a name.
+
+    Rows of the same canonical name with different `tiebreaks` values (e.g. "WR ARI" and "WR WAS") are different
+    players: the first one - the best ranked, sources being in rank order - keeps the canonical player_id(name) the
+    sources are joined on, the others get player_id(name, tiebreak). Without tiebreaks every row of a name is taken
+    to be the same player (e.g. one row per game or per article).
+
+    Returns:
+        tuple: ([player id per name], {canonical name: [tiebreak values]} of the names shared by several players)
+    """
+    if tiebreaks is None:
+        tiebreaks = [None] * len(names)
+    ids = {}
+    # canonical name -> tiebreak values seen, in order
+    seen = {}
+    result = []
+    for name, tiebreak in zip(names, tiebreaks):
+        if (name, tiebreak) not in ids:
+            key = normalize_name(name)
+            values = seen.setdefault(key, [])
+            if tiebreak not in values:
+                values.append(tiebreak)
+            ids[name, tiebreak] = player_id(name, tiebreak if values.index(tiebreak) else None)
+        result.append(ids[name, tiebreak])
+    collisions = {key: values for key, values in seen.items() if key and len(values) > 1}
+    return result, collisions
+# ---------------------- Name Normalization ----------------------
+
+
+# ---------------------- Headline Names ----------------------
+# Longest player name (in words) looked for at the start of a headline
+HEADLINE_NAME_WORDS = 5
+
+# Possessive ending of a headline name ("Puka Nacua's status" -> "Puka Nacua")
+POSSESSIVE = re.compile(r"['’]s$")
+
+def name_from_headline(headline, known_names=None):
+    """
+    Player name at the start of a news headline.
+
+    With `known_names` (canonical names, see normalize_name) it is the longest leading run of words that names a known
+    player, so title-case headlines work too ("Puka Nacua Limited At Practice" -> "Puka Nacua"). Otherwise - or
+    when no known name matches - it takes the leading run of capitalised words plus any suffix, up to a
+    parenthetical ("Marvin Harrison Jr. (ankle) limited" -> "Marvin Harrison Jr.", "Amon-Ra St. Brown expected to
+    play" -> "Amon-Ra St. Brown"), falling back to the first two words when the headline doesn't start with a name.
+    """
+    if not isinstance(headline, str):
+        return None
+    words = headline.split()
+    if known_names:
+        for length in range(min(len(words), HEADLINE_NAME_WORDS), 0, -1):
+            candidate = POSSESSIVE.sub("", " ".join(words[:length]).rstrip(",:;"))
+            if normalize_name(candidate) in known_names:
+                return candidate
+    name_words = []
+    for word in words[:HEADLINE_NAME_WORDS]:
+        if word.startswith("("):
+            break
+        if word[:1].isupper() or (name_words and word.strip(".").lower() in NAME_SUFFIXES):
+            name_words.append(word)
+        else:
+            break
+    if len(name_words) < 2:
+        return " ".join(words[:2]) if len(words) >= 2 else headline
+    return " ".join(name_words)
+# ---------------------- Headline Names ----------------------
+
+
+# ---------------------- Team Codes ----------------------
+# Team codes that differ between sources (Pro-Football-Reference "JAC", nfl_data_py "LA") -> the FantasyPros code
+TEAM_ALIASES = {"JAC": "JAX", "LA": "LAR", "LVR": "LV", "OAK": "LV", "SD": "LAC", "STL": "LAR", "WSH": "WAS"}
+
+# Pro-Football-Reference's team for a player who played for several teams in the season ("2TM", "3TM")
+MULTI_TEAM = re.compile(r"^(?:\d+TM|TOT)$")
+
+def normalize_team(team):
+    """ Team code every source agrees on ("JAC" -> "JAX", "LA" -> "LAR"); "" when unknown or several ("2TM"). """
+    if not isinstance(team, str):
+        return ""
+    team = team.strip().upper()
+    if MULTI_TEAM.match(team):
+        return ""
+    return TEAM_ALIASES.get(team, team)
+# ---------------------- Team Codes ----------------------
+
+
+# ---------------------- Player Index ----------------------
+def tiebreak_values(df, columns):
+    """
+    "pos team" strings of each row from whichever of `columns` the frame has (None if it has none).
+
+    Values go through normalize_team (positions are left as they are), so every source builds the same string for
+    the same player; a multi-team season ("RB 2TM") falls back to the position alone.
+    """
+    columns = [column for column in columns or () if column in df.columns]
+    if not columns:
+        return None
+    values = df[columns].astype(object).to_numpy().tolist()
+    return [" ".join(filter(None, map(normalize_team, row))) for row in values]
+
+def add_player_ids(df, name_column, tiebreak=None):
+    """
+    Cleans `name_column` (Pro Bowl markers removed) and adds a 'player_id' column next to it.
+
+    Ids are computed once per distinct name (and tiebreak), so large frames (e.g. weekly data) only hash each player
+    once. `tiebreak` names the columns (e.g. ('pos', 'team')) that tell apart different players sharing a name in a
+    frame with one row per player; they get different ids (see assign_player_ids) and the collision is logged.
+    """
+    df = df.copy()
+    df[name_column] = df[name_column].map(clean_display_name, na_action='ignore')
+    named = df[name_column].notna()
+    ids, collisions = assign_player_ids(df.loc[named, name_column].tolist(), tiebreak_values(df[named], tiebreak))
+    if collisions:
+        logger.warning("⚠️ Names shared by different players get separate ids",
+                       extra=fields(column=name_column, count=len(collisions), names=sorted(collisions)[:10]))
+    player_ids = pd.Series(None, index=df.index, dtype=object)
+    player_ids[named] = ids
+    df.insert(df.columns.get_loc(name_column) + 1, 'player_id', player_ids)
+    return df
+
+def build_row_index(df, id_column='player_id'):
+    """ {player_id: [row positions]} for a frame with a player id column (see add_player_ids). """
+    return {key: list(rows) for key, rows in df.groupby(id_column, sort=False).indices.items()}
+
+def build_player_index(sources):
+    """
+    Hashed index over every player-level dataset, keyed by player id.
+
+    Args:
+        sources (dict): Maps a source name (e.g. 'adp', 'stats_2024', 'injuries') to a DataFrame that has a
+                        'player_id' column.
+
+    Returns:
+        dict: {player_id: {source_name: [row positions in that source]}} - a player's rows in any source are a
+              single dict lookup away, and sources can be joined on 'player_id' instead of scanning names.
+    """
+    index = {}
+    for source, df in sources.items():
+        if df is None or 'player_id' not in df.columns:
+            continue
+        for key, rows in build_row_index(df).items():
+            index.setdefault(key, {})[source] = rows
+    return index
+
+def player_rows(index, source, df, key):
+    """ The rows of `df` (the frame registered as `source`) belonging to a player id, as a DataFrame. """
+    return df.iloc[index.get(key, {}).get(source, [])]
+# ---------------------- Player Index ----------------------
@@ -1,85 +1,237 @@
-import requests
+import os
+from datetime import date, datetime
 import streamlit as st
-from bs4 import BeautifulSoup
 import pandas as pd
 import re
-
-@st.cache_data
-def get_player_transactions(month, url):
+import snapshots
+from http_client import fetch_pages, CACHE_DIR, DEFAULT_TIMEOUT, TTL_ALWAYS_REVALIDATE, TTL_HOURLY
+from instrumentation import timed, cache_miss
+from app_logging import get_logger, fields
+
+logger = get_logger(__name__)
+
+# Pro-Football-Reference monthly transactions page
+TRANSACTIONS_URL = "https://www.pro-football-reference.com/years/{year}/{month:02}_transactions.htm"
+
+TRANSACTION_COLUMNS = ['Date', 'Transaction']
+
+# ---------------------- Transaction Text Normalizer ----------------------
+# get_text(strip=True) glues neighbouring text nodes together ("TheBaltimore Ravenssigned WRJohn Smithto ..."),
+# so every transaction line needs spaces put back. All rules are compiled once into a single alternation; each
+# alternative matches the text that needs a space after it, so one sub() pass fixes the whole line.
+TRANSACTION_KEYWORDS = ["Signed", "Re-Signed", "Waived", "Claimed", "Released", "Activated", "Placed", "Traded"]
+
+TRANSACTION_POSITIONS = [
+    "QB", "RB", "WR", "TE", "DT", "DE", "LB", "CB", "S",
+    "OT", "OG", "G", "C", "FB", "K", "P", "LS", "DL", "DB", "OL"
+]
+
+DATE_PATTERN = re.compile(r"^[A-Za-z]+\s\d{1,2},\s\d{4}$")
+
+KEYWORD_PATTERN = re.compile("|".join(re.escape(keyword) for keyword in TRANSACTION_KEYWORDS), re.IGNORECASE)
+
+# Longest positions first so "CBJaylon" becomes "CB Jaylon" rather than "C BJaylon". Single-letter positions only
+# split before a capitalised word, which keeps initials such as "CJ Stroud" or "PJ Walker" intact.
+_positions = "|".join(sorted((pos for pos in TRANSACTION_POSITIONS if len(pos) > 1), key=len, reverse=True))
+_single_letter_positions = "".join(pos for pos in TRANSACTION_POSITIONS if len(pos) == 1)
+_keywords = "|".join(re.escape(keyword) for keyword in TRANSACTION_KEYWORDS)
+
+# Words that follow "on" in a transaction ("on injured reserve", "on waivers", "on March 3"). Plenty of names end in
+# "on" (Houston, Jackson, Washington), so a glued "on" is only split off in front of one of these.
+_on_followers = "|".join([
+    "injured", "reserve", "waivers", "the", "a", "an", "IR", "PUP", "NFI",
+    "January", "February", "March", "April", "May", "June", "July", "August", "September", "October", "November",
+    "December",
+])
+
+NORMALIZE_PATTERN = re.compile(
+    # "TheBaltimore" -> "The Baltimore", "theTeam" -> "the Team"
+    r"\b[Tt]he(?=[A-Z])"
+    # Position abbreviation glued to the player name: "WRJohn" -> "WR John", and to the word before it as well:
+    # "signedRBSaquon" -> "signed RB Saquon" (never inside a run of capitals)
+    rf"|(?<![A-Z])(?:{_positions})(?=[A-Z])"
+    rf"|(?<![A-Z])[{_single_letter_positions}](?=[A-Z][a-z])"
+    rf"|[a-z](?=(?:{_positions})[A-Z]|[{_single_letter_positions}][A-Z][a-z])"
+    # Missing space before a keyword: "Ravenssigned" -> "Ravens signed"
+    rf"|[A-Za-z](?=(?i:{_keywords}))"
+    # Name glued to the next word: "Smithto" -> "Smith to", "Dolphinsfor" -> "Dolphins for", "Smithoff waivers" ->
+    # "Smith off waivers", "Smithon injured" -> "Smith on injured" (but never split "season", "extension" or
+    # "Houston Texans")
+    r"|[A-Za-z](?<![Ss]eas)(?<![st]i)(?=(?:to|from|for)\b)"
+    r"|[A-Za-z](?=off\swaivers\b)"
+    rf"|[A-Za-z](?<![Ss]eas)(?<![st]i)(?=on\s(?:{_on_followers})\b)"
+)
+
+def normalize_transaction_text(text):
+    """ Puts back the spaces lost between text nodes in a single transaction line. """
+    return NORMALIZE_PATTERN.sub(r"\g<0> ", text)
+
+def normalize_transactions(transactions):
+    """ Vectorized normalize_transaction_text() over a Series of transaction lines. """
+    return transactions.str.replace(NORMALIZE_PATTERN, r"\g<0> ", regex=True)
+# ---------------------- Transaction Text Normalizer ----------------------
+
+# One parsed CSV per finished month (<year>_<month>.csv); a month is frozen here once it is over
+TRANSACTIONS_STORE_DIR = os.path.join(CACHE_DIR, "transactions")
+
+@timed()
+def parse_player_transactions(html):
+    """ Parses a Pro-Football-Reference monthly transactions page into a DataFrame of ['Date', 'Transaction']. """
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    content_div = soup.find('div', {'id': 'content'})
+
+    rows = []
+    current_date = None
+
+    for elem in content_div.find_all(['h2', 'p']):
+        text = elem.get_text(strip=True)
+
+        if DATE_PATTERN.match(text):
+            current_date = text
+
+        elif current_date:
+            rows.append((current_date, text))
+
+    # Keep transaction lines only, then fix the glued words of the whole month in one batch
+    df = pd.DataFrame(rows, columns=TRANSACTION_COLUMNS)
+    df = df[df['Transaction'].str.contains(KEYWORD_PATTERN)].reset_index(drop=True)
+    df['Transaction'] = normalize_transactions(df['Transaction'])
+    return df
+
+
+def month_store_path(year, month):
+    return os.path.join(TRANSACTIONS_STORE_DIR, f"{year}_{month:02}.csv")
+
+@timed(cached=True)
+@st.cache_data(ttl=TTL_HOURLY)
+def get_transactions_by_month(year, last_month):
     """
-            Fetches and parses NFL player transactions from the specified URL.
+    Loads every month of transactions from January through `last_month`, keyed by month name.
 
-            Args:
-                month (str): Month for which transactions are being fetched (used for display context).
-                url (str): URL to the NFL transaction page.
+    Months that are already over never change, so once parsed they are frozen in TRANSACTIONS_STORE_DIR and read
+    back from disk. Only months missing from the store (normally just the current one) are downloaded, all at once.
+    A closed month is revalidated with the server before it is frozen: the on-disk HTTP cache may still hold the
+    copy fetched while the month was running, without its last transactions.
 
-            Returns:
-                pd.DataFrame: A DataFrame containing transaction dates and descriptions.
-            """
+    Args:
+        year (int): Season year of the transaction pages.
+        last_month (int): Last month to load (1-12).
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+    Returns:
+        dict: {'January': pd.DataFrame, ...} with ['Date', 'Transaction'] columns.
+    """
+    cache_miss()
+    today = date.today()
+    # Replay runs read the snapshot pages directly instead of whatever an earlier live run froze
+    use_store = not snapshots.is_replaying()
+
+    transactions_by_month = {}
+    to_fetch = {}
+    for month in range(1, last_month + 1):
+        closed = (year, month) < (today.year, today.month)
+        path = month_store_path(year, month)
+        if closed and use_store and os.path.exists(path):
+            transactions_by_month[month] = pd.read_csv(path)
+        else:
+            # Never freeze a page cached mid-month: a closed month is revalidated (a 304 when it is unchanged)
+            ttl = TTL_ALWAYS_REVALIDATE if closed else TTL_HOURLY
+            to_fetch[month] = (TRANSACTIONS_URL.format(year=year, month=month), DEFAULT_TIMEOUT, ttl)
+
+    logger.info("⏳ Loading %s transactions", year,
+                extra=fields(from_store=len(transactions_by_month), to_fetch=len(to_fetch)))
+    pages, _ = fetch_pages(to_fetch)
+    for month, html in pages.items():
+        if html is None:
+            transactions_by_month[month] = pd.DataFrame(columns=TRANSACTION_COLUMNS)
+            continue
+        transactions_by_month[month] = parse_player_transactions(html)
+        if use_store and (year, month) < (today.year, today.month):
+            os.makedirs(TRANSACTIONS_STORE_DIR, exist_ok=True)
+            transactions_by_month[month].to_csv(month_store_path(year, month), index=False)
+
+    return {
+        datetime(year, month, 1).strftime('%B'): transactions_by_month[month]
+        for month in sorted(transactions_by_month)
     }
 
-    try:
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        content_div = soup.find('div', {'id': 'content'})
 
-        transactions = []
-        current_date = None
+# ---------------------- Relevant Player Matching ----------------------
+# Suffixes ignored when matching a player's name inside a transaction ("Marvin Harrison Jr." -> marvin / harrison)
+PLAYER_NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
 
-        positions = [
-            "QB", "RB", "WR", "TE", "DT", "DE", "LB", "CB", "S",
-            "OT", "OG", "G", "C", "FB", "K", "P", "LS", "DL", "DB", "OL"
-        ]
+NAME_TOKEN_PATTERN = re.compile(r"[a-z0-9'\-]+")
 
-        keywords = ["Signed", "Re-Signed", "Waived", "Claimed", "Released", "Activated", "Placed", "Traded"]
+# Period after a single letter, i.e. inside initials ("a.j." -> "aj", but "st. brown" and "jr." keep their words)
+INITIAL_PERIOD_PATTERN = re.compile(r"(?<=\b[a-z])\.")
 
-        for elem in content_div.find_all(['h2', 'p']):
-            text = elem.get_text(strip=True)
+def name_tokens(text):
+    """
+    Lower-case word tokens of a name or transaction line ("Ja'Marr Chase." -> ["ja'marr", "chase"],
+    "A.J. Brown" -> ["aj", "brown"]).
+    """
+    return NAME_TOKEN_PATTERN.findall(INITIAL_PERIOD_PATTERN.sub("", text.lower()))
 
-            if re.match(r"^[A-Za-z]+\s\d{1,2},\s\d{4}$", text):
-                current_date = text
+def core_name_tokens(name):
+    """ Tokens of a player name without suffixes ("Marvin Harrison Jr." -> ("marvin", "harrison")). """
+    return tuple(part for part in name_tokens(name) if part not in PLAYER_NAME_SUFFIXES)
 
-            elif current_date and any(word.lower() in text.lower() for word in keywords):
-                # Fix "TheBaltimore" → "The Baltimore"
-                text = re.sub(r'(The)([A-Z])', r'\1 \2', text)
+@st.cache_data
+def build_player_name_index(players, rookies=()):
+    """
+    Inverted index from a last-name token to the relevant players carrying it.
 
-                # Fix missing space between lowercase and keyword (e.g. "Ravenssigned")
-                for keyword in keywords:
-                    text = re.sub(rf'([a-z])({keyword})', r'\1 \2', text, flags=re.IGNORECASE)
+    Built once per player set so every transaction can be matched in a single scan of its own tokens
+    (see match_relevant_transactions) instead of testing each transaction against every player.
 
-                # Fix position abbreviation glued to player name, excluding "CB"
-                for pos in positions:
-                    text = re.sub(rf'({pos})([A-Z])', r'\1 \2', text)
+    Args:
+        players (iterable): (name, player_id) of the relevant players (e.g. the top 320).
+        rookies (iterable): (name, player_id) of the rookies (relevant too, and flagged as rookies).
 
-                # Fix player last name glued to "to", "on", "from" but exclude "season"
-                # This avoids splitting "2025 season"
-                def fix_glued(match):
-                    word = match.group(2)
-                    if word.lower() == "season":
-                        return match.group(1) + word
-                    else:
-                        return match.group(1) + " " + word
+    Returns:
+        dict: {last_name_token: [(name tokens, player_id, player_name, is_rookie), ...]}
+    """
+    rookie_ids = {key for _, key in rookies}
 
-                text = re.sub(r'([a-zA-Z])(?=(to|on|from|season)\b)', r'\1 ',
-                              text)  # add space before to/on/from/season first
-                # Then correct "season" back to no space (undo)
-                text = re.sub(r'([a-zA-Z])\s(season\b)', fix_glued, text, flags=re.IGNORECASE)
+    index = {}
+    for player_name, key in dict.fromkeys(list(players) + list(rookies)):
+        tokens = core_name_tokens(player_name)
+        if len(tokens) < 2:
+            continue
+        index.setdefault(tokens[-1], []).append((tokens, key, player_name, key in rookie_ids))
+    return index
 
-                # Fix "theTeam" → "the Team"
-                text = re.sub(r'\b(the)([A-Z])', r'\1 \2', text, flags=re.IGNORECASE)
+def match_transaction(transaction_text, name_index):
+    """
+    Returns (player_id, player_name, is_rookie) of the first relevant player named in a transaction, else None.
 
-                transactions.append({
-                    'Date': current_date,
-                    'Transaction': text
-                })
+    A player matches when his whole name appears as consecutive words ending at his last name, so "TE Noah Brown
+    to a one-year contract" doesn't name A.J. Brown.
+    """
+    tokens = name_tokens(transaction_text)
+    for end, token in enumerate(tokens, start=1):
+        for name, key, player_name, is_rookie in name_index.get(token, ()):
+            if tuple(tokens[end - len(name):end]) == name:
+                return key, player_name, is_rookie
+    return None
+
+def match_relevant_transactions(transactions, name_index):
+    """
+    Keeps the transactions that name a relevant player.
 
-        df = pd.DataFrame(transactions)
-        return df
+    Args:
+        transactions (pd.DataFrame): ['Date', 'Transaction'] rows (see parse_player_transactions).
+        name_index (dict): Index from build_player_name_index().
 
-    except requests.RequestException as e:
-        print(f"Error while fetching the page: {e}")
-        return pd.DataFrame()
\ No newline at end of file
+    Returns:
+        pd.DataFrame: The matching rows with added 'Player', 'player_id' and 'Rookie' ("Yes" / "No") columns.
+    """
+    matches = [match_transaction(text, name_index) for text in transactions['Transaction']]
+    matches_found = [match for match in matches if match is not None]
+
+    relevant = transactions[[match is not None for match in matches]].copy()
+    relevant['Player'] = [player_name for _, player_name, _ in matches_found]
+    relevant['player_id'] = [key for key, _, _ in matches_found]
+    relevant['Rookie'] = ["Yes" if is_rookie else "No" for _, _, is_rookie in matches_found]
+    return relevant.reset_index(drop=True)
+# ---------------------- Relevant Player Matching ----------------------
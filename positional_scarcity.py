@@ -1,8 +1,13 @@
 # ---------------------- LIBRARIES ----------------------
+import logging
 import pandas as pd
 import streamlit as st
+from instrumentation import timed
+from app_logging import get_logger, frame_summary
 # ---------------------- LIBRARIES ----------------------
 
+logger = get_logger(__name__)
+
 
 # Replacement-level starters per position in Best Ball
 REPLACEMENT_RANK = {
@@ -36,10 +41,12 @@ Summary of Use Cases in Draft Vader:
     Sort/filter recommendations by VoR or ScarcityScore instead of just projected points.
 """
 
+@timed()
 def load_player_data(df):
     """ Takes a unified projections DataFrame and filters valid positions. """
     return df[df['pos'].isin(['QB', 'RB', 'WR', 'TE'])].reset_index(drop=True)
 
+@timed()
 def calculate_value_over_replacement(df):
     """Adds a Value Over Replacement (VoR) column per position.
 
@@ -71,6 +78,7 @@ def calculate_value_over_replacement(df):
 
     return pd.concat(vor_list).sort_values(by='VoR', ascending=False).reset_index(drop=True)
 
+@timed()
 def calculate_positional_tiers(df):
     """Adds a Tier column by looking for steep drop-offs in points.
 
@@ -112,6 +120,7 @@ def calculate_positional_tiers(df):
 
     return pd.concat(tiered).sort_values(by='VoR', ascending=False).reset_index(drop=True)
 
+@timed()
 def get_scarcity_score(df, elite_tier_weight=1.25):
     """Returns scarcity score as a multiplier for boosting players in elite/sparse tiers.
 
@@ -147,15 +156,8 @@ def get_scarcity_score(df, elite_tier_weight=1.25):
 
     df.sort_values(by='ScarcityScore', ascending=False).reset_index(drop=True)
 
-    # Check if the message has been shown before printing to terminal
-    if 'positional_scarcity_shown' not in st.session_state:
-        print("---------------------------------------------------------------")
-        print(f"\n////////// Positional Scarcity //////////\n")
-        print("---------------------------------------------------------------")
-        st.session_state['positional_scarcity_shown'] = True
-    # Print DataFrame preview to terminal
-    print("\n")
-    print(df)
-    print("---------------------------------------------------------------")
+    logger.info("🧠 Positional scarcity scores calculated (%s)", frame_summary(df))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Sample rows:\n%s", df.head().to_string())
 
     return df
\ No newline at end of file
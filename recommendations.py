@@ -0,0 +1,178 @@
+"""
+Live pick recommendations: every available player ranked for the team on the clock.
+
+    scores = datasets.load('player_scores')                     # {player_id: base score}, once per data load
+    recommender = PickRecommender(scores, adp_records, taken=draft.taken)
+    recommender.remove(pick.player_id)                          # after a pick (add() after an undo)
+    recommender.rank(team_rosters.lineup("Team 3")[0], limit=10)
+
+A player's base score is a weighted sum of z-scores (over the ADP pool) of his age-adjusted VoR, ScarcityScore,
+value vs. ADP and Spike Week Score. It doesn't depend on the draft, so it's computed once per data load. Roster need
+is a bonus per position (open starting slot, open FLEX), so it never changes the order within a position: each
+position is kept as a score-sorted list (bisect on pick / undo), and ranking is a heap merge of the position lists
+with the picking team's bonuses - O(k log positions) for the top k, nothing rescored between picks.
+"""
+# ---------------------- Libraries ----------------------
+from bisect import bisect_left, insort
+from collections import namedtuple
+from heapq import merge
+from itertools import islice
+import numpy as np
+from player_identity import player_id
+from team_rosters import STARTING_SLOTS, FLEX_SLOTS
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Settings ----------------------
+# Weight of each z-scored signal in the base score
+WEIGHTS = {
+    'VoR': 1.0,
+    'ScarcityScore': 0.5,
+    'value_vs_adp': 0.5,
+    'spike_week_score': 0.25,
+}
+
+# Bonus (in base-score units) for a position that still fills an open starting slot / only the open FLEX
+STARTER_NEED = 0.75
+FLEX_NEED = 0.25
+
+# One ranked player
+Recommendation = namedtuple('Recommendation', ['player_id', 'name', 'pos', 'adp', 'score', 'need'])
+# ---------------------- Settings ----------------------
+
+
+# ---------------------- Base Scores ----------------------
+def _zscores(values, missing):
+    """ Z-scores of `values` (NaN filled with `missing` z first: 0 = average, None = the pool's worst). """
+    values = np.asarray(values, dtype=float)
+    known = values[~np.isnan(values)]
+    if known.size == 0:
+        return np.zeros_like(values)
+    spread = known.std() or 1.0
+    z = (values - known.mean()) / spread
+    fill = (known.min() - known.mean()) / spread if missing is None else missing
+    return np.where(np.isnan(z), fill, z)
+
+def build_player_scores(adp_records, positional_scarcity, value_vs_adp, age_curve, boom_bust):
+    """
+    Draft-independent base score of every ADP player (see the module docstring).
+
+    Players without a projection get the pool's lowest VoR / ScarcityScore; a missing value vs. ADP or Spike Week
+    Score counts as average, and a missing age curve as a multiplier of 1.
+
+    Returns:
+        dict: {player_id: base score}
+    """
+    keys = list(adp_records)
+    scarcity = positional_scarcity.drop_duplicates('player_id').set_index('player_id')
+    age_multipliers = dict(zip(map(player_id, age_curve['player']), age_curve['age_curve_multiplier']))
+    value = {}
+    for df in value_vs_adp.values():
+        if 'value_vs_adp' in df.columns:
+            value.update(zip(map(player_id, df['name']), df['value_vs_adp']))
+    spike = dict(zip(boom_bust['player_id'], boom_bust['spike_week_score']))
+
+    vor = scarcity['VoR'].reindex(keys).to_numpy(dtype=float)
+    vor = vor * np.array([age_multipliers.get(key, 1.0) for key in keys])
+    signals = {
+        'VoR': _zscores(vor, None),
+        'ScarcityScore': _zscores(scarcity['ScarcityScore'].reindex(keys).to_numpy(dtype=float), None),
+        'value_vs_adp': _zscores([value.get(key, np.nan) for key in keys], 0.0),
+        'spike_week_score': _zscores([spike.get(key, np.nan) for key in keys], 0.0),
+    }
+    scores = sum(WEIGHTS[name] * z for name, z in signals.items())
+    return dict(zip(keys, scores.tolist()))
+# ---------------------- Base Scores ----------------------
+
+
+# ---------------------- Roster Need ----------------------
+def need_bonus(starters, slots=STARTING_SLOTS):
+    """
+    {pos: bonus} for a team's current starters (team_rosters.assign_slots): STARTER_NEED while a position has an
+    open starting slot, FLEX_NEED while only a flex slot it fits (FLEX: RB / WR / TE, SUPERFLEX: any) is open.
+    """
+    flex_open = {
+        pos for slot, positions in FLEX_SLOTS.items() if len(starters.get(slot, ())) < slots.get(slot, 0)
+        for pos in positions
+    }
+    bonus = {}
+    for pos, count in slots.items():
+        if pos in FLEX_SLOTS:
+            continue
+        if len(starters.get(pos, ())) < count:
+            bonus[pos] = STARTER_NEED
+        elif pos in flex_open:
+            bonus[pos] = FLEX_NEED
+        else:
+            bonus[pos] = 0.0
+    return bonus
+# ---------------------- Roster Need ----------------------
+
+
+# ---------------------- Pick Recommender ----------------------
+class PickRecommender:
+    """ Available players ordered by base score per position, ranked on demand for one team's needs. """
+
+    __slots__ = ('scores', 'records', '_positions')
+
+    def __init__(self, scores, records, taken=()):
+        """
+        Args:
+            scores (dict): {player_id: base score} (the 'player_scores' dataset).
+            records (dict): {player_id: ADP record} (the 'adp_records' dataset).
+            taken (set): Player ids already drafted.
+        """
+        self.scores = scores
+        self.records = records
+        # pos -> [(-score, player id), ...] sorted, i.e. best first
+        self._positions = {}
+        for key, score in scores.items():
+            if key in records and key not in taken:
+                self._positions.setdefault(records[key]['pos'], []).append((-score, key))
+        for players in self._positions.values():
+            players.sort()
+
+    def _entry(self, key):
+        return self.records[key]['pos'], (-self.scores[key], key)
+
+    def remove(self, key):
+        """ Takes a drafted player out of the ranking (unknown or already removed players are ignored). """
+        if key not in self.scores or key not in self.records:
+            return
+        pos, entry = self._entry(key)
+        players = self._positions.get(pos, [])
+        i = bisect_left(players, entry)
+        if i < len(players) and players[i] == entry:
+            del players[i]
+
+    def add(self, key):
+        """ Puts an undrafted player back into the ranking. """
+        if key not in self.scores or key not in self.records:
+            return
+        pos, entry = self._entry(key)
+        players = self._positions.setdefault(pos, [])
+        i = bisect_left(players, entry)
+        if i == len(players) or players[i] != entry:
+            insort(players, entry)
+
+    def rank(self, starters, limit=None, slots=STARTING_SLOTS):
+        """
+        Available players best first for a team with these starters (team_rosters.TeamRosters.lineup()[0]) in a
+        league with these lineup `slots`.
+
+        Returns:
+            list[Recommendation]: The top `limit` players (all of them if None).
+        """
+        bonus = need_bonus(starters, slots)
+
+        def scored(pos, players):
+            need = bonus.get(pos, 0.0)
+            return ((negative - need, key, need) for negative, key in players)
+
+        ranked = merge(*(scored(pos, players) for pos, players in self._positions.items()))
+        recommendations = []
+        for negative, key, need in islice(ranked, limit):
+            player = self.records[key]
+            recommendations.append(Recommendation(key, player['name'], player['pos'], player['adp'], -negative, need))
+        return recommendations
+# ---------------------- Pick Recommender ----------------------
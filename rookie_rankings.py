@@ -1,19 +1,19 @@
 # ---------------------- Libraries ----------------------
+import logging
 import pandas as pd
 import streamlit as st
+from instrumentation import timed, cache_miss
+from app_logging import get_logger, frame_summary
 # ---------------------- Libraries ----------------------
 
+logger = get_logger(__name__)
+
 
 # ---------------------- Get Rookie Rankings - get_rookie_rankings(file_path) ----------------------
+@timed(cached=True)
 @st.cache_data
 def get_rookie_rankings(file_path):
-
-    # Check if the message has been shown before printing to terminal
-    if 'rookie_rankings_shown' not in st.session_state:
-        print("---------------------------------------------------------------")
-        print(f"\n////////// Rookie Rankings //////////\n")
-        print("---------------------------------------------------------------")
-        st.session_state['rookie_rankings_shown'] = True
+    cache_miss()
 
     # Define the expected headers
     expected_headers = ["RK", "PLAYER NAME", "TEAM", "POS", "AGE", "BEST", "WORST", "AVG.", "STD.DEV", "ECR VS. ADP"]
@@ -21,9 +21,9 @@ def get_rookie_rankings(file_path):
     # Load the CSV file
     df = pd.read_csv(file_path, names=expected_headers, header=0)
 
-    # Show the first few rows
-    print(df.head())
-    print("---------------------------------------------------------------")
+    logger.info("🧠 Rookie Rankings loaded from %s (%s)", file_path, frame_summary(df))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Sample rows:\n%s", df.head().to_string())
 
     return df
 # ---------------------- Get Rookie Rankings - get_rookie_rankings(file_path) ----------------------
\ No newline at end of file
@@ -1,30 +1,34 @@
 # ---------------------- Libraries ----------------------
-import requests
+import logging
 import streamlit as st
-from bs4 import BeautifulSoup
 import pandas as pd
+from http_client import fetch_page, TTL_DAILY
+from instrumentation import timed, cache_miss
+from app_logging import get_logger, frame_summary
 # ---------------------- Libraries ----------------------
 
+logger = get_logger(__name__)
+
+
+# Pro-Football-Reference season schedule page and the season shown on the Season Schedules page
+SCHEDULE_URL = "https://www.pro-football-reference.com/years/{year}/games.htm"
+SCHEDULE_YEAR = "2025"
+
 
 # ---------------------- get_schedules() ----------------------
-@st.cache_data
+@timed(cached=True)
+@st.cache_data(ttl=TTL_DAILY)
 def get_schedules(year, url):
+    cache_miss()
 
-    # Check if the message has been shown before printing to terminal
-    if 'nfl_schedule_shown' not in st.session_state:
-        print("---------------------------------------------------------------")
-        print(f"\n////////// {year} Season Schedule //////////\n")
-        print("---------------------------------------------------------------")
-        st.session_state['nfl_schedule_shown'] = True
-
-    # Send a GET request to the webpage
-    response = requests.get(url)
-    response.raise_for_status()
+    # Send a GET request to the webpage (served from the on-disk cache for up to a day)
+    html = fetch_page(url, ttl=TTL_DAILY)
 
     # Parse the HTML content using BeautifulSoup
-    soup = BeautifulSoup(response.text, 'html.parser')
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
 
-    print(f"Scraping {year} Season Schedule from '{url}' ... ")
+    logger.info("⏳ Scraping %s Season Schedule from %s ...", year, url)
 
     # Find the main table containing the game data
     table = soup.find("table", {"id": "games"})
@@ -46,9 +50,9 @@ def get_schedules(year, url):
     # Convert to DataFrame
     df = pd.DataFrame(rows, columns=headers)
 
-    print("Data Summary:")
-    print(df.head())
-    print("---------------------------------------------------------------")
+    logger.info("🧠 %s Season Schedule loaded (%s)", year, frame_summary(df))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Sample rows:\n%s", df.head().to_string())
 
     # # Save to CSV
     # df.to_csv(f"nfl_schedule_{year}.csv", index=False)
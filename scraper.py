@@ -2,9 +2,17 @@
 import requests
 import re
 import pandas as pd
-from bs4 import BeautifulSoup
+from http_client import fetch_page, TTL_HOURLY, TTL_DAILY
+from instrumentation import timed
+from app_logging import get_logger
+try:
+    from lxml import html as lxml_html
+except ImportError:  # lxml is optional - read_table_cells() falls back to BeautifulSoup's html.parser
+    lxml_html = None
 # ---------------------- Libraries ----------------------
 
+logger = get_logger(__name__)
+
 
 # ---------------------- Script Functions ----------------------
 # Extract player name, team, and bye week from player_info
@@ -41,7 +49,7 @@ def extract_player_info(player_info):
         name = player_info.strip()
         team = None
         bye_week = None
-        print(f"Player without team/bye week: {player_info}")
+        logger.debug("Player without team/bye week: %s", player_info)
 
     return name, team, bye_week
 # ---------------------- Script Functions ----------------------
@@ -110,8 +118,18 @@ def extract_player_info(player_info):
 def load_adp_data(url):
     try:
         # URL of the FantasyPros Best Ball ADP page
-        response = requests.get(url)
-        soup = BeautifulSoup(response.text, 'html.parser')
+        html = fetch_page(url, ttl=TTL_HOURLY)
+    except requests.RequestException as e:
+        logger.error("⚠️ HTTP request error: %s", e)
+        return None
+    return parse_adp_data(html)
+
+# Parses the ADP table out of an already-downloaded FantasyPros page
+@timed()
+def parse_adp_data(html):
+    from bs4 import BeautifulSoup
+    try:
+        soup = BeautifulSoup(html, 'html.parser')
 
         # Locate the table containing the ADP data
         table = soup.find('table', {'id': 'data'})
@@ -157,197 +175,87 @@ def load_adp_data(url):
 
         return df.to_dict(orient='records')
 
-    except requests.RequestException as e:
-        print(f"HTTP request error: {e}")
-        return None
     except Exception as e:
-        print(f"An unexpected error occurred: {e}")
+        logger.exception("⚠️ An unexpected error occurred while parsing ADP data: %s", e)
         return None
 # ---------------------- ADP Data ----------------------
 
 
-# ---------------------- QB Season Projections ----------------------
-def load_season_projections_qb(url):
-    # Fetch the page content
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # Locate the table containing the QB projections
-    table = soup.find('table', {'id': 'data'})
-
-    players = []
-
-    # NFL team abbreviations
-    team_abbr = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX',
-                 'KC', 'LV', 'LAC', 'LAR', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB', 'TEN', 'WAS']
-
-    for row in table.tbody.find_all('tr'):
-        cols = row.find_all('td')
-        if len(cols) > 1:
-            player_info = cols[0].text.strip()
-            pass_att = cols[1].text.strip()
-            pass_cmp = cols[2].text.strip()
-            pass_yds = cols[3].text.strip()
-            pass_tds = cols[4].text.strip()
-            ints = cols[5].text.strip()
-            rush_att = cols[6].text.strip()
-            rush_yds = cols[7].text.strip()
-            rush_tds = cols[8].text.strip()
-            fumbles = cols[9].text.strip()
-            proj_points = cols[10].text.strip()
-
-            # Extract player name and team from player_info
-            player_name_parts = player_info.split()
-            team = player_name_parts[-1] if player_name_parts[-1] in team_abbr else ''
-            name = ' '.join(player_name_parts[:-1]) if team else player_info
-
-            players.append({
-                'name': name,
-                'team': team,
-                'pass_att': pass_att,
-                'pass_cmp': pass_cmp,
-                'pass_yds': pass_yds,
-                'pass_tds': pass_tds,
-                'ints': ints,
-                'rush_att': rush_att,
-                'rush_yds': rush_yds,
-                'rush_tds': rush_tds,
-                'fumbles': fumbles,
-                'proj_points': proj_points
-            })
-
-    # Convert to DataFrame
-    df = pd.DataFrame(players)
-
-    # Normalize numeric columns
-    for col in ['pass_att', 'pass_cmp', 'pass_yds', 'pass_tds', 'ints', 'rush_att', 'rush_yds', 'rush_tds', 'fumbles', 'proj_points']:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-
-    # Drop rows with missing essential values
-    df = df.dropna(subset=['name', 'proj_points'])
-
-    # Sort by fantasy points descending
-    df = df.sort_values(by='proj_points', ascending=False)
-
-    return df.to_dict(orient='records')
-# ---------------------- QB Season Projections ----------------------
-
-
-# ---------------------- RB Season Projections ----------------------
-def load_season_projections_rb(url):
-    # Fetch the page content
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # Locate the table containing the QB projections
-    table = soup.find('table', {'id': 'data'})
-
-    players = []
-
-    # NFL team abbreviations
-    team_abbr = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX',
-                 'KC', 'LV', 'LAC', 'LAR', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB', 'TEN', 'WAS']
-
-    for row in table.tbody.find_all('tr'):
-        cols = row.find_all('td')
-        if len(cols) > 1:
-            player_info = cols[0].text.strip()
-            rush_att = cols[1].text.strip()
-            rush_yds = cols[2].text.strip()
-            rush_tds = cols[3].text.strip()
-            rec = cols[4].text.strip()
-            rec_yds = cols[5].text.strip()
-            rec_tds = cols[6].text.strip()
-            fumbles = cols[7].text.strip()
-            proj_points = cols[8].text.strip()
-
-            # Extract player name and team from player_info
-            player_name_parts = player_info.split()
-            team = player_name_parts[-1] if player_name_parts[-1] in team_abbr else ''
-            name = ' '.join(player_name_parts[:-1]) if team else player_info
-
-            players.append({
-                'name': name,
-                'team': team,
-                'rush_att': rush_att,
-                'rush_yds': rush_yds,
-                'rush_tds': rush_tds,
-                'rec': rec,
-                'rec_yds': rec_yds,
-                'rec_tds': rec_tds,
-                'fumbles': fumbles,
-                'proj_points': proj_points
-            })
-
-    # Convert to DataFrame
-    df = pd.DataFrame(players)
-
-    # Normalize numeric columns
-    for col in ['rush_att', 'rush_yds', 'rush_tds', 'rec', 'rec_yds', 'rec_tds', 'fumbles', 'proj_points']:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-
-    # Drop rows with missing essential values
-    df = df.dropna(subset=['name', 'proj_points'])
-
-    # Sort by fantasy points descending
-    df = df.sort_values(by='proj_points', ascending=False)
+# ---------------------- Season Projections ----------------------
+# NFL team abbreviations (used to split the team off the end of the player cell, e.g. "Josh Allen BUF")
+TEAM_ABBR = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX',
+             'KC', 'LV', 'LAC', 'LAR', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB', 'TEN', 'WAS']
+
+# Stat columns of the FantasyPros projection table (table#data) for each position, in page order.
+# The first cell of every row is the player ("Name TEAM"), or the team name for DST.
+PROJECTION_SCHEMAS = {
+    'QB': ['pass_att', 'pass_cmp', 'pass_yds', 'pass_tds', 'ints', 'rush_att', 'rush_yds', 'rush_tds', 'fumbles',
+           'proj_points'],
+    'RB': ['rush_att', 'rush_yds', 'rush_tds', 'rec', 'rec_yds', 'rec_tds', 'fumbles', 'proj_points'],
+    'WR': ['rec', 'rec_yds', 'rec_tds', 'rush_att', 'rush_yds', 'rush_tds', 'fumbles', 'proj_points'],
+    'TE': ['rec', 'rec_yds', 'rec_tds', 'fumbles', 'proj_points'],
+    'K': ['fg', 'fga', 'xpt', 'proj_points'],
+    'DST': ['sack', 'int', 'fr', 'ff', 'td', 'safety', 'pa', 'yds_agn', 'proj_points'],
+}
+
+def read_table_cells(html, table_id='data'):
+    """
+    Returns the text of every <td> in the table body as a list of rows (one list of strings per <tr>).
+
+    Uses lxml's C tree builder when it is installed and falls back to BeautifulSoup's html.parser otherwise.
+    """
+    if lxml_html is not None:
+        tree = lxml_html.fromstring(html)
+        tables = tree.xpath(f'//table[@id="{table_id}"]')
+        if not tables:
+            return []
+        return [[td.text_content() for td in tr.iterchildren('td')] for tr in tables[0].iterfind('.//tbody/tr')]
+
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    table = soup.find('table', {'id': table_id})
+    if table is None or table.tbody is None:
+        return []
+    return [[td.get_text() for td in tr.find_all('td')] for tr in table.tbody.find_all('tr')]
+
+def read_projection_table(html, pos):
+    """
+    Pulls the whole FantasyPros projection table into a typed DataFrame in one pass.
+
+    Args:
+        html (str): Projection page HTML.
+        pos (str): Key into PROJECTION_SCHEMAS ('QB', 'RB', 'WR', 'TE', 'K' or 'DST').
+
+    Returns:
+        pd.DataFrame: 'name', 'team' (except DST) and one float64 column per stat in the schema.
+    """
+    stat_cols = PROJECTION_SCHEMAS[pos]
+    width = len(stat_cols) + 1
+
+    # Keep rows that carry the full set of cells (skips spacer / ad rows)
+    rows = [cells[:width] for cells in read_table_cells(html) if len(cells) >= width]
+    df = pd.DataFrame(rows, columns=['player_info'] + stat_cols, dtype=object)
+
+    # Collapse whitespace in the player cell, then split "Name TEAM" into 'name' and 'team'
+    player_info = df['player_info'].str.split().str.join(' ')
+    if pos == 'DST':
+        df.insert(0, 'name', player_info)
+    else:
+        parts = player_info.str.rsplit(n=1, expand=True).reindex(columns=[0, 1])
+        has_team = parts[1].isin(TEAM_ABBR)
+        df.insert(0, 'name', parts[0].where(has_team, player_info))
+        df.insert(1, 'team', parts[1].where(has_team, ''))
+    df = df.drop(columns='player_info')
 
-    return df.to_dict(orient='records')
-# ---------------------- RB Season Projections ----------------------
+    # Normalize all numeric columns at once (thousands separators such as "4,306.1" included)
+    numbers = df[stat_cols].apply(lambda col: col.str.strip().str.replace(',', '', regex=False))
+    df[stat_cols] = numbers.apply(pd.to_numeric, errors='coerce').astype('float64')
 
+    return df
 
-# ---------------------- WR Season Projections ----------------------
-def load_season_projections_wr(url):
-    # Fetch the page content
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # Locate the table containing the QB projections
-    table = soup.find('table', {'id': 'data'})
-
-    players = []
-
-    # NFL team abbreviations
-    team_abbr = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX',
-                 'KC', 'LV', 'LAC', 'LAR', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB', 'TEN', 'WAS']
-
-    for row in table.tbody.find_all('tr'):
-        cols = row.find_all('td')
-        if len(cols) > 1:
-            player_info = cols[0].text.strip()
-            rec = cols[1].text.strip()
-            rec_yds = cols[2].text.strip()
-            rec_tds = cols[3].text.strip()
-            rush_att = cols[4].text.strip()
-            rush_yds = cols[5].text.strip()
-            rush_tds = cols[6].text.strip()
-            fumbles = cols[7].text.strip()
-            proj_points = cols[8].text.strip()
-
-            # Extract player name and team from player_info
-            player_name_parts = player_info.split()
-            team = player_name_parts[-1] if player_name_parts[-1] in team_abbr else ''
-            name = ' '.join(player_name_parts[:-1]) if team else player_info
-
-            players.append({
-                'name': name,
-                'team': team,
-                'rec': rec,
-                'rec_yds': rec_yds,
-                'rec_tds': rec_tds,
-                'rush_att': rush_att,
-                'rush_yds': rush_yds,
-                'rush_tds': rush_tds,
-                'fumbles': fumbles,
-                'proj_points': proj_points
-            })
-
-    # Convert to DataFrame
-    df = pd.DataFrame(players)
-
-    # Normalize numeric columns
-    for col in ['rec', 'rec_yds', 'rec_tds', 'rush_att', 'rush_yds', 'rush_tds',  'fumbles', 'proj_points']:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
+@timed()
+def parse_season_projections(html, pos):
+    df = read_projection_table(html, pos)
 
     # Drop rows with missing essential values
     df = df.dropna(subset=['name', 'proj_points'])
@@ -356,171 +264,8 @@ def load_season_projections_wr(url):
     df = df.sort_values(by='proj_points', ascending=False)
 
     return df.to_dict(orient='records')
-# ---------------------- WR Season Projections ----------------------
 
-
-# ---------------------- TE Season Projections ----------------------
-def load_season_projections_te(url):
+def load_season_projections(url, pos):
     # Fetch the page content
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # Locate the table containing the QB projections
-    table = soup.find('table', {'id': 'data'})
-
-    players = []
-
-    # NFL team abbreviations
-    team_abbr = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX',
-                 'KC', 'LV', 'LAC', 'LAR', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB', 'TEN', 'WAS']
-
-    for row in table.tbody.find_all('tr'):
-        cols = row.find_all('td')
-        if len(cols) > 1:
-            player_info = cols[0].text.strip()
-            rec = cols[1].text.strip()
-            rec_yds = cols[2].text.strip()
-            rec_tds = cols[3].text.strip()
-            fumbles = cols[4].text.strip()
-            proj_points = cols[5].text.strip()
-
-            # Extract player name and team from player_info
-            player_name_parts = player_info.split()
-            team = player_name_parts[-1] if player_name_parts[-1] in team_abbr else ''
-            name = ' '.join(player_name_parts[:-1]) if team else player_info
-
-            players.append({
-                'name': name,
-                'team': team,
-                'rec': rec,
-                'rec_yds': rec_yds,
-                'rec_tds': rec_tds,
-                'fumbles': fumbles,
-                'proj_points': proj_points
-            })
-
-    # Convert to DataFrame
-    df = pd.DataFrame(players)
-
-    # Normalize numeric columns
-    for col in ['rec', 'rec_yds', 'rec_tds', 'fumbles', 'proj_points']:
-        df[col] = pd.to_numeric(df[col], errors='coerce')
-
-    # Drop rows with missing essential values
-    df = df.dropna(subset=['name', 'proj_points'])
-
-    # Sort by fantasy points descending
-    df = df.sort_values(by='proj_points', ascending=False)
-
-    return df.to_dict(orient='records')
-# ---------------------- TE Season Projections ----------------------
-
-
-# ---------------------- K Season Projections ----------------------
-# def load_season_projections_k(url):
-#     # Fetch the page content
-#     response = requests.get(url)
-#     soup = BeautifulSoup(response.text, 'html.parser')
-#
-#     # Locate the table containing the QB projections
-#     table = soup.find('table', {'id': 'data'})
-#
-#     players = []
-#
-#     # NFL team abbreviations
-#     team_abbr = ['ARI', 'ATL', 'BAL', 'BUF', 'CAR', 'CHI', 'CIN', 'CLE', 'DAL', 'DEN', 'DET', 'GB', 'HOU', 'IND', 'JAX',
-#                  'KC', 'LV', 'LAC', 'LAR', 'MIA', 'MIN', 'NE', 'NO', 'NYG', 'NYJ', 'PHI', 'PIT', 'SF', 'SEA', 'TB', 'TEN', 'WAS']
-#
-#     for row in table.tbody.find_all('tr'):
-#         cols = row.find_all('td')
-#         if len(cols) > 1:
-#             player_info = cols[0].text.strip()
-#             fg = cols[1].text.strip()
-#             fga = cols[2].text.strip()
-#             xpt = cols[3].text.strip()
-#             proj_points = cols[4].text.strip()
-#
-#             # Extract player name and team from player_info
-#             player_name_parts = player_info.split()
-#             team = player_name_parts[-1] if player_name_parts[-1] in team_abbr else ''
-#             name = ' '.join(player_name_parts[:-1]) if team else player_info
-#
-#             players.append({
-#                 'name': name,
-#                 'team': team,
-#                 'fg': fg,
-#                 'fga': fga,
-#                 'xpt': xpt,
-#                 'proj_points': proj_points
-#             })
-#
-#     # Convert to DataFrame
-#     df = pd.DataFrame(players)
-#
-#     # Normalize numeric columns
-#     for col in ['fg', 'fga', 'xpt', 'proj_points']:
-#         df[col] = pd.to_numeric(df[col], errors='coerce')
-#
-#     # Drop rows with missing essential values
-#     df = df.dropna(subset=['name', 'proj_points'])
-#
-#     # Sort by fantasy points descending
-#     df = df.sort_values(by='proj_points', ascending=False)
-#
-#     return df.to_dict(orient='records')
-# ---------------------- K Season Projections ----------------------
-
-
-# ---------------------- DST Season Projections ----------------------
-# def load_season_projections_dst(url):
-#     # Fetch the page content
-#     response = requests.get(url)
-#     soup = BeautifulSoup(response.text, 'html.parser')
-#
-#     # Locate the table containing the QB projections
-#     table = soup.find('table', {'id': 'data'})
-#
-#     teams = []
-#
-#     for row in table.tbody.find_all('tr'):
-#         cols = row.find_all('td')
-#         if len(cols) > 1:
-#             team = cols[0].text.strip()
-#             sack = cols[1].text.strip()
-#             int = cols[2].text.strip()
-#             fr = cols[3].text.strip()
-#             ff = cols[4].text.strip()
-#             td = cols[5].text.strip()
-#             safety = cols[6].text.strip()
-#             pa = cols[7].text.strip()
-#             yds_agn = cols[8].text.strip()
-#             proj_points = cols[9].text.strip()
-#
-#             teams.append({
-#                 'name': team,
-#                 'sack': sack,
-#                 'int': int,
-#                 'fr': fr,
-#                 'ff': ff,
-#                 'td': td,
-#                 'safety': safety,
-#                 'pa': pa,
-#                 'yds_agn': yds_agn,
-#                 'proj_points': proj_points
-#             })
-#
-#     # Convert to DataFrame
-#     df = pd.DataFrame(teams)
-#
-#     # Normalize numeric columns
-#     for col in ['sack', 'int', 'fr', 'ff', 'td', 'safety',  'pa', 'proj_points']:
-#         df[col] = pd.to_numeric(df[col], errors='coerce')
-#
-#     # Drop rows with missing essential values
-#     df = df.dropna(subset=['name', 'proj_points'])
-#
-#     # Sort by fantasy points descending
-#     df = df.sort_values(by='proj_points', ascending=False)
-#
-#     return df.to_dict(orient='records')
-# ---------------------- DST Season Projections ----------------------
\ No newline at end of file
+    return parse_season_projections(fetch_page(url, ttl=TTL_DAILY), pos)
+# ---------------------- Season Projections ----------------------
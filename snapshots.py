@@ -0,0 +1,147 @@
+"""
+Record / replay snapshots of every page the data pipeline downloads.
+
+    DRAFTVADER_SNAPSHOT_MODE=record streamlit run Home.py   # save every page the app fetches
+    DRAFTVADER_SNAPSHOT_MODE=replay streamlit run Home.py   # run entirely from the snapshot, no network
+    python snapshots.py record [--year 2025]                # record all sources without starting the app
+
+Snapshots live in DRAFTVADER_SNAPSHOT_DIR (default: ./snapshots) together with an index.json manifest
+mapping each URL to its file.
+"""
+# ---------------------- Libraries ----------------------
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+import requests
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Settings ----------------------
+RECORD = "record"
+REPLAY = "replay"
+
+SNAPSHOT_MODE = os.environ.get("DRAFTVADER_SNAPSHOT_MODE", "").strip().lower()
+SNAPSHOT_DIR = os.environ.get("DRAFTVADER_SNAPSHOT_DIR", "snapshots")
+INDEX_FILE = "index.json"
+
+_index_lock = threading.Lock()
+# ---------------------- Settings ----------------------
+
+
+# ---------------------- Mode ----------------------
+class SnapshotMissingError(requests.RequestException):
+    """ Raised in replay mode when a page was never recorded (treated like any other failed request). """
+
+def is_recording():
+    return SNAPSHOT_MODE == RECORD
+
+def is_replaying():
+    return SNAPSHOT_MODE == REPLAY
+# ---------------------- Mode ----------------------
+
+
+# ---------------------- Page Snapshots ----------------------
+def snapshot_file_name(url):
+    """ Readable, collision-free file name for a URL (e.g. www.fantasypros.com_nfl_injury-news.php_page_2-1a2b3c4d.html). """
+    slug = re.sub(r"^https?://", "", url)
+    slug = re.sub(r"[^A-Za-z0-9.\-]+", "_", slug).strip("_")[:120]
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:8]
+    return f"{slug}-{digest}.html"
+
+def read_index():
+    try:
+        with open(os.path.join(SNAPSHOT_DIR, INDEX_FILE), encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_page(url, body):
+    """ Writes a downloaded page into the snapshot directory and records it in the manifest. """
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    file_name = snapshot_file_name(url)
+    with open(os.path.join(SNAPSHOT_DIR, file_name), "w", encoding="utf-8") as f:
+        f.write(body)
+
+    with _index_lock:
+        index = read_index()
+        index[url] = {"file": file_name, "recorded_at": datetime.now().isoformat(timespec="seconds")}
+        with open(os.path.join(SNAPSHOT_DIR, INDEX_FILE), "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2, sort_keys=True)
+
+def load_page(url):
+    """ Returns the recorded body of a URL, raising SnapshotMissingError if it was never recorded. """
+    path = os.path.join(SNAPSHOT_DIR, snapshot_file_name(url))
+    try:
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        raise SnapshotMissingError(f"No snapshot recorded for {url} in '{SNAPSHOT_DIR}'")
+# ---------------------- Page Snapshots ----------------------
+
+
+# ---------------------- DataFrame Snapshots ----------------------
+# For sources that come from a library instead of a page (e.g. nfl_data_py weekly data)
+def save_frame(name, df):
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    df.to_pickle(os.path.join(SNAPSHOT_DIR, f"{name}.pkl"))
+
+def load_frame(name):
+    import pandas as pd
+    path = os.path.join(SNAPSHOT_DIR, f"{name}.pkl")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No snapshot recorded for '{name}' in '{SNAPSHOT_DIR}'")
+    return pd.read_pickle(path)
+# ---------------------- DataFrame Snapshots ----------------------
+
+
+# ---------------------- Record All Sources ----------------------
+def record_all(year):
+    """ Downloads every source the app uses (bypassing the response cache TTLs) into the snapshot directory.
+
+    `year` selects the season whose monthly transaction pages are recorded.
+    """
+    global SNAPSHOT_MODE
+    from http_client import fetch_pages, DEFAULT_TIMEOUT, TTL_ALWAYS_REVALIDATE
+    from load_data import FANTASYPROS_SOURCES
+    from injury_reports import INJURY_NEWS_MAX_PAGES, injury_news_url
+    from schedules import SCHEDULE_URL, SCHEDULE_YEAR
+    from player_transactions import TRANSACTIONS_URL
+    from spike_week_score import SPIKE_WEEK_SEASONS, load_weekly_data
+
+    SNAPSHOT_MODE = RECORD
+    last_month = datetime.now().month if year == datetime.now().year else 12
+
+    sources = {key: (url, timeout, TTL_ALWAYS_REVALIDATE) for key, (url, timeout, _) in FANTASYPROS_SOURCES.items()}
+    for page in range(1, INJURY_NEWS_MAX_PAGES + 1):
+        sources[f"injury_news_{page}"] = (injury_news_url(page), DEFAULT_TIMEOUT, TTL_ALWAYS_REVALIDATE)
+    sources["schedule"] = (SCHEDULE_URL.format(year=SCHEDULE_YEAR), DEFAULT_TIMEOUT, TTL_ALWAYS_REVALIDATE)
+    for month in range(1, last_month + 1):
+        url = TRANSACTIONS_URL.format(year=year, month=month)
+        sources[f"transactions_{month:02}"] = (url, DEFAULT_TIMEOUT, TTL_ALWAYS_REVALIDATE)
+
+    start = time.perf_counter()
+    pages, _ = fetch_pages(sources)
+    load_weekly_data(SPIKE_WEEK_SEASONS)
+
+    missing = [key for key, html in pages.items() if html is None]
+    print(f"Recorded {len(pages) - len(missing)}/{len(pages)} pages + weekly data into '{SNAPSHOT_DIR}' "
+          f"in {time.perf_counter() - start:.1f}s")
+    if missing:
+        print(f"Missing: {', '.join(missing)}")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Record every DraftVader data source into a snapshot directory.")
+    parser.add_argument("command", choices=[RECORD])
+    parser.add_argument("--year", type=int, default=datetime.now().year)
+    args = parser.parse_args()
+
+    # Run through the importable module so http_client sees the same SNAPSHOT_MODE
+    import snapshots
+    snapshots.record_all(args.year)
+# ---------------------- Record All Sources ----------------------
@@ -1,8 +1,17 @@
 # ---------------------- Libraries ----------------------
+import logging
 import streamlit as st
-import nfl_data_py as nfl
+import snapshots
+from instrumentation import timed, cache_miss
+from app_logging import get_logger, frame_summary
 # ---------------------- Libraries ----------------------
 
+logger = get_logger(__name__)
+
+
+# Seasons of weekly data behind the Spike Week Score
+SPIKE_WEEK_SEASONS = [2024]
+
 
 # ---------------------- Script Functions ----------------------
 # Function to count games above a given PPR threshold
@@ -56,16 +65,35 @@ def calculate_spike_score(row):
 # ---------------------- Script Functions ----------------------
 
 
+# ---------------------- Weekly Data ----------------------
+# Imports weekly NFL data through nfl_data_py, or from the snapshot directory in replay mode. Cached, so the
+# Spike Week Score and the Best Ball simulator's weekly points share one download.
+@timed(cached=True)
+@st.cache_data
+def load_weekly_data(years):
+    cache_miss()
+    snapshot_name = "weekly_data_" + "_".join(str(year) for year in years)
+    if snapshots.is_replaying():
+        return snapshots.load_frame(snapshot_name)
+
+    # Deferred: nfl_data_py is slow to import and replay runs never need it
+    import nfl_data_py as nfl
+    weekly_data = nfl.import_weekly_data(years)
+    if snapshots.is_recording():
+        snapshots.save_frame(snapshot_name, weekly_data)
+    return weekly_data
+# ---------------------- Weekly Data ----------------------
+
+
 # ---------------------- Organize by Condition ----------------------
+@timed(cached=True)
 @st.cache_data
 def organize_by_condition(years):
-    print("---------------------------------------------------------------")
-    print("\n////////// SPIKE WEEK SCORES //////////\n")
-    print("---------------------------------------------------------------")
-    print(f"⏳ Importing weekly NFL data from {years} ...")
+    cache_miss()
+    logger.info("⏳ Importing weekly NFL data from %s ...", years)
 
     # Imports weekly NFL data for the specified years using the nfl library.
-    weekly_data = nfl.import_weekly_data(years)
+    weekly_data = load_weekly_data(years)
 
     # Calculate games over 20, 25, and 30 PPR points (Boom)
     over_20_ppr = count_games_above_threshold(weekly_data, 20)
@@ -102,7 +130,7 @@ def organize_by_condition(years):
             (merged[f'under_{threshold}_ppr_count'] / merged['total_games'] * 100).round(2)
         )
 
-    print("⏳ Calculating 'Spike Week' scores ...")
+    logger.info("⏳ Calculating 'Spike Week' scores (%s) ...", frame_summary(merged))
     # Calculate the Spike Week Score
     merged['spike_week_score'] = merged.apply(calculate_spike_score, axis=1)
 
@@ -111,19 +139,14 @@ def organize_by_condition(years):
     cols.insert(1, cols.pop(cols.index('spike_week_score')))
     merged = merged[cols]
 
-    # Sort the merged dataframe by Spike Week Score in descending order
-    top_10 = merged.sort_values(by='spike_week_score', ascending=False).head(10)
-
-    # Print the top 10 players with boom, bust, spike week scores, and total games played
-    print("\nTop 10 Players by Spike Week Score:\n")
-    for index, row in top_10.iterrows():
-        print(f"{row['player_display_name']}: {int(row['total_games'])} total games\n"
-              f"Spike Week Score: {row['spike_week_score']:.2f}\n"
-              f"{int(row['over_20_ppr_count'])} games over 20, {int(row['over_25_ppr_count'])} over 25, "
-              f"{int(row['over_30_ppr_count'])} over 30\n"
-              f"{int(row['under_5_ppr_count'])} under 5, {int(row['under_10_ppr_count'])} under 10, "
-              f"{int(row['under_15_ppr_count'])} under 15")
-        print("---------------------------------------------------------------")
+    # Top 10 players with boom, bust, spike week scores, and total games played (only rendered at DEBUG)
+    if logger.isEnabledFor(logging.DEBUG):
+        top_10 = merged.sort_values(by='spike_week_score', ascending=False).head(10)
+        logger.debug("Top 10 Players by Spike Week Score:\n%s", top_10[[
+            'player_display_name', 'spike_week_score', 'total_games', 'over_20_ppr_count', 'over_25_ppr_count',
+            'over_30_ppr_count', 'under_5_ppr_count', 'under_10_ppr_count', 'under_15_ppr_count'
+        ]].to_string(index=False))
+    logger.info("🧠 Spike Week scores calculated (%s)", frame_summary(merged))
 
     return merged
 # ---------------------- Organize by Condition ----------------------
\ No newline at end of file
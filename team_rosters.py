@@ -0,0 +1,98 @@
+"""
+Starting lineups and benches of every team on the draft board, kept up to date pick by pick.
+
+    rosters = TeamRosters(adp_records, draft.rosters)   # adp_records: {player_id: ADP record}; slots= per league
+    rosters.add("Team 3", pick.player_id)                # after a pick
+    rosters.remove("Team 3", pick.player_id)             # after an undo
+    starters, bench = rosters.lineup("Team 3")
+
+A team's players are kept sorted by ADP (bisect), and only the team that just picked gets its slots reassigned, so
+rendering the board is a dict lookup per team instead of a scan of the ADP list per pick.
+"""
+# ---------------------- Libraries ----------------------
+from bisect import insort
+# ---------------------- Libraries ----------------------
+
+
+# ---------------------- Lineup Slots ----------------------
+# Starting lineup of a Best Ball roster (the default; a league can change it - see league_config.LeagueConfig)
+STARTING_SLOTS = {"QB": 1, "RB": 2, "WR": 3, "TE": 1, "FLEX": 1}
+
+# Slots open to several positions, most restrictive first (the order they are filled in)
+FLEX_SLOTS = {"FLEX": ("RB", "WR", "TE"), "SUPERFLEX": ("QB", "RB", "WR", "TE")}
+FLEX_POSITIONS = FLEX_SLOTS["FLEX"]
+
+def assign_slots(players, slots=STARTING_SLOTS):
+    """
+    Fills the starting slots in order of the given players (best ADP first): a player takes an open slot of his
+    position, else the first open flex slot he is eligible for (FLEX, then SUPERFLEX); the rest go to the bench.
+
+    Returns:
+        tuple: ({'QB': [record], 'RB': [...], ..., 'FLEX': [...]}, [bench records])
+    """
+    starters = {slot: [] for slot in slots}
+    flex_slots = [(slot, FLEX_SLOTS[slot]) for slot in FLEX_SLOTS if slots.get(slot, 0)]
+    bench = []
+    for player in players:
+        pos = player['pos']
+        if pos in starters and pos not in FLEX_SLOTS and len(starters[pos]) < slots[pos]:
+            starters[pos].append(player)
+            continue
+        for slot, positions in flex_slots:
+            if pos in positions and len(starters[slot]) < slots[slot]:
+                starters[slot].append(player)
+                break
+        else:
+            bench.append(player)
+    return starters, bench
+# ---------------------- Lineup Slots ----------------------
+
+
+# ---------------------- Team Rosters ----------------------
+class TeamRosters:
+    """ Per-team lineups built from one ADP load; players without an ADP record are left off the board. """
+
+    __slots__ = ('records', 'slots', '_players', '_lineups')
+
+    def __init__(self, records, rosters, slots=STARTING_SLOTS):
+        """
+        Args:
+            records (dict): {player_id: ADP record} (the 'adp_records' dataset).
+            rosters (dict): {team name: [player ids]} - e.g. DraftState.rosters.
+            slots (dict): Starting lineup slot counts (e.g. LeagueConfig.slots).
+        """
+        self.records = records
+        self.slots = slots
+        # team name -> sorted [(adp, player id), ...]
+        self._players = {team: [] for team in rosters}
+        # team name -> (starters, bench)
+        self._lineups = {}
+        for team, keys in rosters.items():
+            for key in keys:
+                self._insert(team, key)
+            self._assign(team)
+
+    def _insert(self, team, key):
+        player = self.records.get(key)
+        if player is not None:
+            insort(self._players[team], (player['adp'], key))
+            return True
+        return False
+
+    def _assign(self, team):
+        self._lineups[team] = assign_slots([self.records[key] for _, key in self._players[team]], self.slots)
+
+    def add(self, team, key):
+        if self._insert(team, key):
+            self._assign(team)
+
+    def remove(self, team, key):
+        player = self.records.get(key)
+        if player is not None and (player['adp'], key) in self._players[team]:
+            self._players[team].remove((player['adp'], key))
+            self._assign(team)
+
+    def lineup(self, team):
+        """ (starters, bench) of `team` - see assign_slots(). """
+        return self._lineups[team]
+# ---------------------- Team Rosters ----------------------
@@ -0,0 +1,122 @@
+"""
+Warm-up worker: builds every shared table before the first visitor needs it, then keeps them fresh.
+
+    In the app:   warmup.start()       # called by Home.py - one daemon thread per server process
+    Standalone:   python warmup.py     # one pass (fills the on-disk caches the server reads from)
+                  python warmup.py --every 900
+
+Inside the server the tables land in the dataset registry (datasets.py), so sessions only ever read finished tables.
+While a refresh is running the previous tables are served as they are (see readiness_status()). A standalone process
+can't share memory with the server, but it fills the HTTP response cache, the injury news store, the transactions
+store and the historical stats store, so the server's own warm-up finds every page on disk.
+"""
+# ---------------------- Libraries ----------------------
+import threading
+import time
+import datasets
+import instrumentation
+from app_logging import get_logger, fields
+# ---------------------- Libraries ----------------------
+
+logger = get_logger(__name__)
+
+
+# ---------------------- Settings ----------------------
+# Tables prebuilt for the sessions, in build order (shared inputs such as 'fantasypros' are built once)
+WARM_DATASETS = [
+    'adp', 'adp_records', 'season_projections', 'value_vs_adp', 'positional_scarcity', 'boom_bust', 'draft_player_index',
+    'age_curve', 'player_scores', 'top_320_players', 'rookie_rankings', 'injury_reports', 'schedules',
+]
+
+# Seconds between refresh passes (the shortest dataset TTL: injury news)
+REFRESH_INTERVAL = 15 * 60
+# ---------------------- Settings ----------------------
+
+
+# ---------------------- Warm-Up ----------------------
+_state_lock = threading.Lock()
+_refreshing = set()
+_errors = {}
+_thread = None
+
+def warm_up(names=None):
+    """
+    Builds (or refreshes, if stale) each dataset in `names` (default: WARM_DATASETS).
+
+    A dataset that fails to build is logged and skipped; its previous table, if any, keeps being served.
+
+    Returns:
+        dict: {name: error message} for the datasets that failed.
+    """
+    errors = {}
+    for name in names or WARM_DATASETS:
+        with _state_lock:
+            _refreshing.add(name)
+        start = time.perf_counter()
+        try:
+            datasets.refresh(name)
+            _errors.pop(name, None)
+        except Exception as e:
+            errors[name] = _errors[name] = f"{type(e).__name__}: {e}"
+            logger.warning("⚠️ Warm-up of '%s' failed after %.2fs: %s", name, time.perf_counter() - start, errors[name])
+        finally:
+            with _state_lock:
+                _refreshing.discard(name)
+    return errors
+
+def _refresh_loop(interval):
+    while True:
+        instrumentation.begin_run("warm-up")
+        start = time.perf_counter()
+        errors = warm_up()
+        logger.info("🧠 Warm-up pass finished in %.2fs", time.perf_counter() - start,
+                    extra=fields(ready=len(WARM_DATASETS) - len(errors), datasets=len(WARM_DATASETS)))
+        time.sleep(interval)
+
+def start(interval=REFRESH_INTERVAL):
+    """
+    Starts the background warm-up thread once per process (later calls do nothing).
+
+    From then on sessions get the current tables instantly, stale or not, while the thread refreshes them.
+    """
+    global _thread
+    with _state_lock:
+        if _thread is not None:
+            return
+        datasets.SERVE_STALE = True
+        _thread = threading.Thread(target=_refresh_loop, args=(interval,), name="draftvader-warmup", daemon=True)
+        _thread.start()
+
+def readiness_status():
+    """
+    Per-dataset readiness for the UI.
+
+    Returns:
+        dict: {name: {'built': bool, 'built_at': epoch seconds or None, 'stale': bool, 'refreshing': bool,
+                      'error': str or None}} for every dataset in WARM_DATASETS.
+    """
+    with _state_lock:
+        refreshing = set(_refreshing)
+    return {
+        name: {**datasets.status(name), 'refreshing': name in refreshing, 'error': _errors.get(name)}
+        for name in WARM_DATASETS
+    }
+
+def is_ready():
+    """ True once every warm-up dataset has a table to serve (possibly stale). """
+    return all(entry['built'] for entry in readiness_status().values())
+# ---------------------- Warm-Up ----------------------
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Prebuild DraftVader's shared data tables and on-disk caches.")
+    parser.add_argument("--every", type=int, metavar="SECONDS", help="Keep refreshing every SECONDS seconds")
+    args = parser.parse_args()
+
+    if args.every:
+        _refresh_loop(args.every)
+    else:
+        failed = warm_up()
+        raise SystemExit(1 if failed else 0)
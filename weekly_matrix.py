@@ -0,0 +1,138 @@
+"""
+Player x week matrix of weekly PPR scores, shareable with process-pool workers without copying.
+
+    matrix = datasets.load('weekly_matrix')     # {'values': float32 (players, weeks), 'player_ids', 'positions', 'weeks'}
+    with publish(matrix['values']) as spec:     # shared memory (or backend="npy": a memory-mapped .npy file)
+        with ProcessPoolExecutor(4, initializer=attach, initargs=(spec,)) as executor:
+            ...                                 # workers call attach(spec) again for the (cached) read-only view
+
+The matrix is built once from the nfl_data_py weekly frame behind the Spike Week Score (regular season only). A cell
+is NaN when the player has no game that week (bye, injury, not on a roster). Workers receive only the small spec
+(segment name or file path, shape, dtype) instead of a pickled DataFrame, and every worker maps the same pages.
+"""
+# ---------------------- Libraries ----------------------
+import os
+import tempfile
+from collections import namedtuple
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+from instrumentation import timed
+# ---------------------- Libraries ----------------------
+
+
+# What a worker needs to attach to a published matrix: backend ("shared_memory" or "npy"), the shared memory
+# segment name or .npy path, and the array's shape and dtype
+MatrixSpec = namedtuple('MatrixSpec', ['backend', 'name', 'shape', 'dtype'])
+
+
+# ---------------------- Build ----------------------
+@timed()
+def build_weekly_matrix(weekly_data):
+    """
+    Player x week float32 matrix of the weekly frame's fantasy_points_ppr.
+
+    Returns:
+        dict: {'values': float32 array (players, weeks), NaN where the player has no game,
+               'player_ids': [player_id per row], 'positions': [position per row],
+               'weeks': [(season, week) per column]}
+    """
+    from player_identity import assign_player_ids, clean_display_name, player_id, tiebreak_values
+    df = weekly_data
+    if 'season_type' in df.columns:
+        df = df[df['season_type'] == 'REG']
+    df = df.dropna(subset=['player_display_name', 'fantasy_points_ppr'])
+    points = df['fantasy_points_ppr'].to_numpy(dtype=np.float64)
+    week_keys = df['season'].to_numpy(dtype=np.int64) * 100 + df['week'].to_numpy(dtype=np.int64)
+
+    if 'player_id' in df.columns:
+        # One row per nfl_data_py (gsis) id, so players sharing a name keep separate rows and ids
+        keep = df['player_id'].notna().to_numpy()
+        df, points, week_keys = df[keep], points[keep], week_keys[keep]
+        source_rows, source_ids = pd.factorize(df['player_id'])
+        # Rows in rank order (total PPR points, best first), so the best player of a shared name keeps the canonical
+        # id, as in the ranked sources (ADP, season stats) - see assign_player_ids
+        order = np.argsort(-np.bincount(source_rows, weights=points, minlength=len(source_ids)), kind='stable')
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        rows = rank[source_rows]
+        # The name, position and team of a row come from the player's latest game
+        latest = np.lexsort((week_keys, rows))
+        player_rows = latest[np.r_[np.flatnonzero(np.diff(rows[latest])), len(latest) - 1]]
+        latest_games = df.iloc[player_rows]
+        names = [clean_display_name(name) for name in latest_games['player_display_name']]
+        player_ids, _ = assign_player_ids(names, tiebreak_values(latest_games, ('position', 'recent_team')))
+    else:
+        # Ids are hashed once per distinct name (as in player_identity.add_player_ids), rows in first-seen order
+        name_codes, names = pd.factorize(df['player_display_name'])
+        name_ids = np.array([player_id(clean_display_name(name)) for name in names], dtype=object)
+        rows, player_ids = pd.factorize(name_ids[name_codes])
+        player_rows = np.unique(rows, return_index=True)[1]
+    positions = df['position'].to_numpy()[player_rows].tolist()
+
+    # Columns are the (season, week) pairs that have games, in calendar order
+    columns, week_values = pd.factorize(week_keys, sort=True)
+    weeks = [(int(key) // 100, int(key) % 100) for key in week_values]
+
+    values = np.full((len(player_ids), len(weeks)), np.nan, dtype=np.float32)
+    values[rows, columns] = points
+    return {'values': values, 'player_ids': list(player_ids), 'positions': positions, 'weeks': weeks}
+
+def row_index(matrix):
+    """ {player_id: row} of a weekly matrix. """
+    return {key: row for row, key in enumerate(matrix['player_ids'])}
+# ---------------------- Build ----------------------
+
+
+# ---------------------- Publish / Attach ----------------------
+@contextmanager
+def publish(values, backend="shared_memory", directory=None):
+    """
+    Publishes `values` for other processes and yields its MatrixSpec; the segment / file is removed on exit.
+
+    Args:
+        backend (str): "shared_memory" (multiprocessing.shared_memory) or "npy" (a .npy file workers memory-map).
+        directory (str): Where the "npy" backend writes its file (default: the temp directory).
+    """
+    values = np.ascontiguousarray(values)
+    if backend == "shared_memory":
+        segment = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        try:
+            np.ndarray(values.shape, values.dtype, buffer=segment.buf)[...] = values
+            yield MatrixSpec(backend, segment.name, values.shape, values.dtype.str)
+        finally:
+            _attached.pop(segment.name, None)
+            segment.close()
+            segment.unlink()
+    elif backend == "npy":
+        fd, path = tempfile.mkstemp(suffix=".npy", dir=directory)
+        os.close(fd)
+        try:
+            np.save(path, values)
+            yield MatrixSpec(backend, path, values.shape, values.dtype.str)
+        finally:
+            _attached.pop(path, None)
+            os.remove(path)
+    else:
+        raise ValueError(f"Unknown backend '{backend}' (expected 'shared_memory' or 'npy')")
+
+# spec name -> (shared memory segment or None, read-only array) of the matrices this process attached to
+_attached = {}
+
+def attach(spec):
+    """
+    Read-only view of a published matrix (zero-copy). The view is cached per process, so this also works as a
+    ProcessPoolExecutor initializer and is free to call again from the tasks.
+    """
+    if spec.name not in _attached:
+        if spec.backend == "shared_memory":
+            segment = shared_memory.SharedMemory(name=spec.name)
+            values = np.ndarray(spec.shape, np.dtype(spec.dtype), buffer=segment.buf)
+        else:
+            segment = None
+            values = np.load(spec.name, mmap_mode='r')
+        values.flags.writeable = False
+        _attached[spec.name] = (segment, values)
+    return _attached[spec.name][1]
+# ---------------------- Publish / Attach ----------------------